@@ -4,7 +4,6 @@ import datetime
 import io
 import itertools
 import math
-from itertools import product
 
 import numpy as np
 
@@ -721,59 +720,27 @@ Initializing model
             file_handle.write(buffer_.getvalue())
         buffer_.close()
 
-    def _get_surface_idx(self, _i, _j):
-        """Return cell index of the surface"""
-        offset = (_i - 1) * 2 + (_j - 1) * (4 * self._total_nx)
-        return [
-            offset,
-            offset + 1,
-            offset + 2 * self._total_nx,
-            offset + 2 * self._total_nx + 1,
-        ]
-
     def export_grdecl(self, filename):
         """Print out COORD, ZCORN, MULTX, MULTY and MULTPV to GRDECL file"""
-        surface = np.repeat(self._zv[0], 2)[1:-1]
-        for idx in range(1, self._total_ny + 1):
-            surface = np.append(
-                surface,
-                np.tile(
-                    np.repeat(self._zv[idx], 2)[1:-1], 2 if idx < self._total_ny else 1
-                ),
-            )
-        n_surface_points = surface.size
+        # Depth of the top corners of each cell, as (2 * ny, 2 * nx), where
+        # the pillars between two cells are repeated for both cells
+        corner_rows = np.repeat(np.arange(self._total_ny + 1), 2)[1:-1]
+        surface = np.repeat(self._zv[corner_rows], 2, axis=1)[:, 1:-1]
 
         for throw in self._throws:
             surface[
-                np.concatenate(
-                    [
-                        self._get_surface_idx(idx[0], idx[1])
-                        for idx in list(
-                            product(
-                                list(range(throw[0], throw[1] + 1)),
-                                list(range(throw[2], throw[3] + 1)),
-                            )
-                        )
-                    ]
-                )
+                2 * (throw[2] - 1) : 2 * throw[3], 2 * (throw[0] - 1) : 2 * throw[1]
             ] += throw[4]
 
-        zcorn = np.zeros(8 * self._total_cells)
-        zcorn[0:n_surface_points] = surface
-        zcorn[n_surface_points : 2 * n_surface_points] = (
-            zcorn[0:n_surface_points] + self._layer_dz[0]
-        )
+        # Depth of each layer boundary, accumulating the layer thicknesses
+        # downwards from the top surface
+        depths = np.empty((self._total_nz + 1, surface.size))
+        depths[0] = surface.ravel()
+        depths[1:] = self._layer_dz[:, np.newaxis]
+        np.cumsum(depths, axis=0, out=depths)
 
-        for idx in range(1, self._total_nz):
-            zcorn[n_surface_points * 2 * idx : n_surface_points * (2 * idx + 1)] = (
-                zcorn[n_surface_points * (2 * idx - 1) : n_surface_points * (2 * idx)]
-            )
-            zcorn[
-                n_surface_points * (2 * idx + 1) : 2 * n_surface_points * (idx + 1)
-            ] = (
-                zcorn[2 * n_surface_points * idx : n_surface_points * (2 * idx + 1)]
-                + self._layer_dz[idx]
-            )
+        # Top and bottom corners of each layer
+        zcorn = depths[np.repeat(np.arange(self._total_nz + 1), 2)[1:-1]].ravel()
         self.dict_info["top"] = zcorn.min()
         self.dict_info["bottom"] = zcorn.max()
 
@@ -796,15 +763,21 @@ Initializing model
         print("/", file=buffer_)
 
         print("COORD", file=buffer_)
-        for i in range(self._xv.shape[0]):
-            for j in range(self._xv.shape[1]):
-                print(
-                    "{{x:{0}}} {{y:{0}}} {{z:{0}}} "  # noqa: UP032
-                    "{{x:{0}}} {{y:{0}}} {{z:{0}}}".format(
-                        self._eclipse_output_float
-                    ).format(x=self._xv[i, j], y=self._yv[i, j], z=0.0),
-                    file=buffer_,
+        float_format = self._eclipse_output_float
+        pillar_format = (
+            f"{{0:{float_format}}} {{1:{float_format}}} {0.0:{float_format}} "
+            f"{{0:{float_format}}} {{1:{float_format}}} {0.0:{float_format}}"
+        )
+        print(
+            "\n".join(
+                map(
+                    pillar_format.format,
+                    self._xv.ravel().tolist(),
+                    self._yv.ravel().tolist(),
                 )
+            ),
+            file=buffer_,
+        )
         print("/", file=buffer_)
         self._print_property(buffer_, "ZCORN", zcorn)
         self._print_property(buffer_, "PORO", self._porosity)
@@ -834,16 +807,12 @@ Initializing model
             value_format = self._eclipse_output_float_compact
 
         print(keyword, file=stream)
-        list_value = [props[0]]
-        list_count = [1]
-        for idx in range(1, len(props)):
-            if props[idx] == list_value[-1]:
-                list_count[-1] += 1
-            else:
-                list_value.append(props[idx])
-                list_count.append(1)
+        # Start of each run of repeated values
+        run_starts = np.flatnonzero(np.append(True, props[1:] != props[:-1]))
+        list_value = props[run_starts].tolist()
+        list_count = np.diff(np.append(run_starts, props.size)).tolist()
         string_buffer = ""
-        for count, value in zip(list_count, list_value, strict=False):
+        for count, value in zip(list_count, list_value, strict=True):
             string_new = (
                 (" {0}*{1:" + value_format + "}").format(count, value)
                 if count > 1
@@ -1,7 +1,14 @@
 """SWATINIT qc tool"""
 
 import argparse
+import glob
+import hashlib
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
 from typing import Any
 
 import matplotlib.pyplot as plt
@@ -36,6 +43,43 @@ QC_FLAGS = [
     __WATER__,
 ]
 
+QC_VECTORS = [
+    # All of these are required.
+    "FIPNUM",
+    "EQLNUM",
+    "SATNUM",
+    "SWATINIT",  # Not outputted by OPM-flow, injected from the deck
+    "SWAT",
+    "PORO",
+    "PERMX",
+    "NTG",
+    "PRESSURE",
+    "PCW",
+    "PPCW",
+    "SWL",
+    "SWLPC",
+    "SWU",
+]
+
+# Number of cells for which corner coordinates are exported at a time:
+CORNER_BLOCKSIZE = 2**16
+
+# Deck keywords from which the saturation function and EQUIL tables are made:
+TABLE_KEYWORDS = [
+    "OIL",
+    "WATER",
+    "GAS",
+    "TABDIMS",
+    "EQLDIMS",
+    *res2df.satfunc.SUPPORTED_KEYWORDS,
+    "EQUIL",
+]
+
+REAL_REGEXP = r".*realization-(\d+)/.*"
+
+# Tables pr. content of TABLE_KEYWORDS, shared by decks in the same process:
+_QC_TABLES: dict[str, tuple[pd.DataFrame, pd.DataFrame]] = {}
+
 
 def main() -> None:
     """Executed when called from the command line.
@@ -45,10 +89,17 @@ def main() -> None:
     parser = get_parser()
     args = parser.parse_args()
 
-    if args.DATAFILE.endswith(".csv"):
-        qc_frame = pd.read_csv(args.DATAFILE)
+    datafiles = glob_datafiles(args.DATAFILE)
+    if len(datafiles) > 1 or datafiles != args.DATAFILE:
+        main_batch(args, datafiles)
+        return
+    if args.volumes or args.outputdir:
+        logger.warning("--volumes and --outputdir only apply to several DATA files")
+
+    if args.DATAFILE[0].endswith(".csv"):
+        qc_frame = pd.read_csv(args.DATAFILE[0])
     else:
-        eclfiles = res2df.ResdataFiles(args.DATAFILE)
+        eclfiles = res2df.ResdataFiles(args.DATAFILE[0])
 
         # Fail hard if the deck is not suitable for this tool or
         # give warnings/hints to the user:
@@ -93,6 +144,119 @@ def main() -> None:
         plt.show()
 
 
+def main_batch(args: argparse.Namespace, datafiles: list[str]) -> None:
+    """Run the qc on several DATA files, and write or print a table with the
+    qc volumes for each of them.
+
+    Args:
+        args: Parsed command line arguments
+        datafiles: Paths to the DATA files
+    """
+    if args.output or args.plot or args.plotfile or args.volplot or args.volplotfile:
+        sys.exit(
+            "--output and plotting is not supported for several DATA files. "
+            "Use --volumes and --outputdir"
+        )
+    if not datafiles:
+        sys.exit(f"No files found matching {' '.join(args.DATAFILE)}")
+    if any(datafile.endswith(".csv") for datafile in datafiles):
+        sys.exit("CSV files can only be supplied one at a time")
+    if args.outputdir:
+        stems = [Path(datafile).stem for datafile in datafiles]
+        if len(set(stems)) < len(stems):
+            sys.exit("DATA files must have distinct names to be used with --outputdir")
+        Path(args.outputdir).mkdir(parents=True, exist_ok=True)
+
+    volumes_df = qc_volumes_batch(
+        datafiles, workers=args.workers, outputdir=args.outputdir
+    )
+    if args.volumes:
+        logger.info("Exporting volumes to %s", args.volumes)
+        volumes_df.to_csv(args.volumes, index=False)
+    else:
+        print(volumes_df.to_string(index=False))
+
+
+def glob_datafiles(patterns: list[str]) -> list[str]:
+    """Expand glob patterns into sorted filenames, keeping the order of the
+    patterns. Patterns without wildcards are kept as they are.
+
+    Args:
+        patterns: Filenames or glob patterns
+
+    Returns:
+        Filenames, without duplicates
+    """
+    datafiles: list[str] = []
+    for pattern in patterns:
+        if any(char in pattern for char in "*?["):
+            datafiles.extend(sorted(glob.glob(pattern)))
+        else:
+            datafiles.append(pattern)
+    return list(dict.fromkeys(datafiles))
+
+
+def qc_volumes_batch(
+    datafiles: list[str], workers: int = 1, outputdir: str | None = None
+) -> pd.DataFrame:
+    """Compute qc volumes for several simulations, f.ex. all realizations
+    in an ensemble.
+
+    Each DATA file is processed independently in a pool of worker processes.
+    Failing DATA files are logged and get no volumes in the table.
+
+    Args:
+        datafiles: Paths to DATA files of finished runs.
+        workers: Number of worker processes, 0 for one per available CPU.
+        outputdir: If provided, the qc gridframe for each DATA file is
+            written to a CSV file in this directory, named after the DATA file.
+
+    Returns:
+        pd.DataFrame with one row pr. DATA file, with the columns DATAFILE,
+        REAL (if realization-* is in the paths) and the qc volumes.
+    """
+    workers = workers or os.cpu_count() or 1
+    workers = min(workers, len(datafiles))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            volumes = list(executor.map(_qc_volumes_for, datafiles, repeat(outputdir)))
+    else:
+        volumes = [_qc_volumes_for(datafile, outputdir) for datafile in datafiles]
+
+    volumes_df = pd.DataFrame(volumes)
+    volumes_df.insert(0, "DATAFILE", datafiles)
+    reals = [
+        re.match(REAL_REGEXP, str(Path(datafile).resolve())) for datafile in datafiles
+    ]
+    if any(reals):
+        volumes_df.insert(
+            1,
+            "REAL",
+            pd.Series([real and int(real.group(1)) for real in reals], dtype="Int64"),
+        )
+    return volumes_df
+
+
+def _qc_volumes_for(datafile: str, outputdir: str | None) -> dict[str, float]:
+    """Compute the qc volumes for one DATA file, optionally dumping its
+    qc gridframe to outputdir"""
+    try:
+        eclfiles = res2df.ResdataFiles(datafile)
+        check_applicability(eclfiles)
+        qc_frame = make_qc_gridframe(eclfiles)
+    except (SystemExit, Exception) as err:
+        logger.error("Skipping %s: %s", datafile, err)
+        return {}
+    if outputdir:
+        csvfile = Path(outputdir) / (Path(datafile).stem + ".csv")
+        logger.info("Exporting CSV to %s", csvfile)
+        reorder_dframe_for_nonnans(qc_frame).to_csv(csvfile, index=False)
+    if "SWATINIT" not in qc_frame:
+        logger.warning("%s did not use SWATINIT", datafile)
+        return {}
+    return {key: float(value) for key, value in qc_volumes(qc_frame).items()}
+
+
 def check_applicability(eclfiles: res2df.ResdataFiles) -> None:
     """Check that the input is relevant for usage with check_swatinit. This
     function may raise exceptions, SystemExit or only give warnings"""
@@ -210,73 +374,50 @@ def make_qc_gridframe(eclfiles: res2df.ResdataFiles) -> pd.DataFrame:
     Makes a dataframe with one row for each active cell. Information from
     satfunc and equil merged in.
     """
-
-    grid_df = res2df.grid.df(
-        eclfiles,
-        vectors=[
-            # All of these are required.
-            "FIPNUM",
-            "EQLNUM",
-            "SATNUM",
-            "SWATINIT",  # Not outputted by OPM-flow, injected below
-            "SWAT",
-            "PORO",
-            "PERMX",
-            "NTG",
-            "PRESSURE",
-            "PCW",
-            "PPCW",
-            "SWL",
-            "SWLPC",
-            "SWU",
-        ],
-        rstdates="first",
-    )
-
-    # Circumvent bug in res2df that will pick SWL from both INIT and restart file:
-    grid_df = grid_df.loc[:, ~grid_df.columns.duplicated()]
+    deck = eclfiles.get_deck()
+    columns = qc_gridvectors(eclfiles, QC_VECTORS)
 
     # Merge in PPCWMAX from the deck, it is not reported in binary output files:
-    if "PPCWMAX" in eclfiles.get_deck():
-        grid_df["PPCWMAX"] = ppcwmax_gridvector(eclfiles)
-
-    # This will be unneccessary from res2df 0.13.0:
-    grid_df = grid_df.where(grid_df > -1e20 + 1e13)
+    if "PPCWMAX" in deck:
+        columns["PPCWMAX"] = ppcwmax_gridvector(eclfiles, columns["SATNUM"])
 
-    if "SWL" not in grid_df:
+    if "SWL" not in columns:
         logger.warning("SWL not found in model. Using SWL=0.")
         logger.warning("Consider adding FILLEPS to the PROPS section")
-        grid_df["SWL"] = 0.0
+        columns["SWL"] = np.zeros(len(columns["GLOBAL_INDEX"]), dtype=np.float32)
 
-    deck = eclfiles.get_deck()
     if "SWATINIT" in deck:
-        swatinit_deckdata = deck["SWATINIT"][0][0].get_raw_data_list()
         # This list includes non-active cells, we must map via GLOBAL_INDEX:
         # GLOBAL_INDEX is 0-indexed.
-        grid_df["SWATINIT_DECK"] = pd.Series(swatinit_deckdata)[
-            grid_df["GLOBAL_INDEX"].astype(int).tolist()
-        ].to_numpy()
+        columns["SWATINIT_DECK"] = np.asarray(
+            deck["SWATINIT"][0][0].get_raw_data_list(), dtype=np.float32
+        )[columns["GLOBAL_INDEX"]]
 
-    if "SWATINIT" not in grid_df:
+    if "SWATINIT" not in columns:
         # OPM-flow does not include SWATINIT in the INIT file.
-        grid_df = grid_df.rename({"SWATINIT_DECK": "SWATINIT"}, axis="columns")
-    elif "SWATINIT_DECK" in grid_df:
+        if "SWATINIT_DECK" in columns:
+            columns["SWATINIT"] = columns.pop("SWATINIT_DECK")
+    elif "SWATINIT_DECK" in columns:
         # (if SWATINIT is inputted using binary data in Eclipse deck, the code above
         # is not able to extract it)
         if not np.isclose(
-            (grid_df["SWATINIT_DECK"] - grid_df["SWATINIT"]).abs().max(), 0, atol=1e-7
+            np.nanmax(np.abs(columns["SWATINIT_DECK"] - columns["SWATINIT"])),
+            0,
+            atol=1e-7,
         ):
             logger.warning("SWATINIT from INIT was not close to SWATINIT  from deck")
         else:
-            del grid_df["SWATINIT_DECK"]  # This is not needed
+            del columns["SWATINIT_DECK"]  # This is not needed
+
+    grid_df = pd.DataFrame(columns, copy=False)
 
     # Exposed to issues with endpoint scaling in peculiar decks:
-    satfunc_df = res2df.satfunc.df(eclfiles)
+    satfunc_df, equil_df = qc_tables(deck)
 
     # Merge in the input pcmax pr. satnum for each cell:
     grid_df = merge_pc_max(grid_df, satfunc_df)
 
-    grid_df = merge_equil(grid_df, res2df.equil.df(eclfiles, keywords=["EQUIL"]))
+    grid_df = merge_equil(grid_df, equil_df)
 
     grid_df = augment_grid_frame_qc_vectors(grid_df)
 
@@ -299,6 +440,101 @@ def make_qc_gridframe(eclfiles: res2df.ResdataFiles) -> pd.DataFrame:
     return grid_df
 
 
+def qc_tables(deck: Any) -> tuple[pd.DataFrame, pd.DataFrame]:  # noqa: ANN401
+    """Extract the saturation function and EQUIL tables from a deck
+
+    The tables are cached in the process on the content of the keywords they
+    are made from, so that decks sharing these (typically through common
+    include files) are only processed once.
+
+    Args:
+        deck: Parsed opm.io deck
+
+    Returns:
+        Tuple with the satfunc and equil dataframes from res2df.
+    """
+    key = hashlib.sha256(
+        "".join(
+            str(deck[keyword]) for keyword in TABLE_KEYWORDS if keyword in deck
+        ).encode()
+    ).hexdigest()
+    if key not in _QC_TABLES:
+        _QC_TABLES[key] = (
+            res2df.satfunc.df(deck),
+            res2df.equil.df(deck, keywords=["EQUIL"]),
+        )
+    satfunc_df, equil_df = _QC_TABLES[key]
+    return satfunc_df.copy(), equil_df.copy()
+
+
+def qc_gridvectors(
+    eclfiles: res2df.ResdataFiles, vectors: list[str]
+) -> dict[str, np.ndarray]:
+    """Read grid geometry and cell vectors for all active cells
+
+    Cell vectors are read from the INIT file, and from the first report step
+    in the UNRST file when not in the INIT file. Arrays are kept in the
+    datatype they have in the binary files (float32/int32), undefined values
+    are set to NaN, and vectors that are undefined in all cells are skipped.
+
+    Args:
+        eclfiles: Handle to a simulator case with EGRID, INIT and UNRST files.
+        vectors: Names of cell vectors to read. Vectors not present are
+            ignored.
+
+    Returns:
+        Dictionary with one array pr. column, each with one value pr.
+        active cell. Columns I, J, K, X, Y, Z, Z_MIN, Z_MAX, VOLUME and
+        GLOBAL_INDEX are always included.
+    """
+    grid = eclfiles.get_egrid()
+    num_active = grid.get_num_active()
+    index_frame = grid.export_index(active_only=True)
+
+    columns: dict[str, np.ndarray] = {}
+    ijk = index_frame[["i", "j", "k"]].to_numpy(dtype=np.int32) + 1
+    for axis, name in enumerate(["I", "J", "K"]):
+        columns[name] = ijk[:, axis]
+    xyz = grid.export_position(index_frame)
+    for axis, name in enumerate(["X", "Y", "Z"]):
+        columns[name] = xyz[:, axis]
+
+    # Corners are exported in blocks, as they need 24 floats pr. cell:
+    z_min = np.empty(num_active)
+    z_max = np.empty(num_active)
+    for start in range(0, num_active, CORNER_BLOCKSIZE):
+        stop = start + CORNER_BLOCKSIZE
+        z_corners = grid.export_corners(index_frame.iloc[start:stop])[:, 2::3]
+        z_corners.min(axis=1, out=z_min[start:stop])
+        z_corners.max(axis=1, out=z_max[start:stop])
+    columns["Z_MIN"] = z_min
+    columns["Z_MAX"] = z_max
+    columns["VOLUME"] = grid.export_volume(index_frame)
+    columns["GLOBAL_INDEX"] = index_frame.index.to_numpy()
+
+    # INIT vectors take precedence over restart vectors with the same name:
+    for resfile, source in [
+        (eclfiles.get_initfile(), "INIT"),
+        (eclfiles.get_rstfile(), "UNRST"),
+    ]:
+        for vector in vectors:
+            if vector in columns or vector not in resfile:
+                continue
+            keyword = resfile.iget_named_kw(vector, 0)
+            if len(keyword) != num_active:
+                continue
+            values = keyword.numpy_view().copy()
+            if values.dtype.kind == "f":
+                # resdata emits a number around -1.0000000200408773e+20
+                # which should be considered Not-a-number:
+                values[values < -1e20 + 1e13] = np.nan
+                if np.isnan(values).all():
+                    continue
+            logger.info("Extracted %s from %s file", vector, source)
+            columns[vector] = values
+    return columns
+
+
 def qc_flag(qc_frame: pd.DataFrame) -> pd.Series:
     """Compute a series categorizing the QC type of the cell, determining
     how SWATINIT behaved in that cell
@@ -438,8 +674,13 @@ def qc_volumes(qc_frame: pd.DataFrame) -> dict[str, float]:
 
         # Overwrite dict values with correct figures:
         for qc_cat, qc_subframe in qc_frame.groupby("QC_FLAG"):
+            # (in float64, the saturations may be float32)
             watergains[str(qc_cat)] = (
-                (qc_subframe["SWAT"] - qc_subframe["SWATINIT"]) * qc_subframe["PORV"]
+                (
+                    qc_subframe["SWAT"].astype(np.float64)
+                    - qc_subframe["SWATINIT"].astype(np.float64)
+                )
+                * qc_subframe["PORV"]
             ).sum()
 
     # Extra figures:
@@ -458,16 +699,21 @@ def qc_volumes(qc_frame: pd.DataFrame) -> dict[str, float]:
 
 
 def _evaluate_pc(
-    swats: npt.NDArray[np.float64],
-    scale_vert: npt.NDArray[np.float64],
-    swls: npt.NDArray[np.float64] | None,
-    swus: npt.NDArray[np.float64] | None,
+    swats: npt.ArrayLike,
+    scale_vert: npt.ArrayLike,
+    swls: npt.ArrayLike | None,
+    swus: npt.ArrayLike | None,
     satfunc: pd.DataFrame,
     sat_name: str = "SW",
     pc_name: str = "PCOW",
-) -> list[Any]:
+) -> npt.NDArray[np.float64]:
     """Evaluate pc as a function of saturation on a scaled Pc-curve
 
+    Instead of scaling the saturation axis of the table for every cell, each
+    cell's saturation is mapped back to the unscaled axis by inverting the
+    linear endpoint scaling, so that the table is interpolated only once for
+    all cells.
+
     Args:
         swats: floats with water saturation values
         scale_vert: floats with vertical scalers for pc
@@ -484,25 +730,26 @@ def _evaluate_pc(
     Returns:
         Computed capillary pressure values.
     """
-    p_cap = []
-    sw_min = satfunc[sat_name].min()
-    sw_max = satfunc[sat_name].max()
-    if swls is None:
-        swls = np.full(len(swats), sw_min)
-    if swus is None:
-        swus = np.full(len(swats), sw_max)
-    for swat, pc_scaling, swl, swu in zip(swats, scale_vert, swls, swus, strict=False):
-        p_cap.append(
-            np.interp(
-                swat,
-                swl
-                + (satfunc[sat_name].to_numpy() - sw_min)
-                / (sw_max - sw_min)
-                * (swu - swl),
-                satfunc[pc_name].to_numpy() * pc_scaling,
-            )
-        )
-    return p_cap
+    swats = np.asarray(swats, dtype=np.float64)
+    sat_table = satfunc[sat_name].to_numpy(dtype=np.float64)
+    pc_table = satfunc[pc_name].to_numpy(dtype=np.float64)
+    sw_min = sat_table.min()
+    sw_max = sat_table.max()
+    swls = sw_min if swls is None else np.asarray(swls, dtype=np.float64)
+    swus = sw_max if swus is None else np.asarray(swus, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        unscaled_swats = sw_min + (swats - swls) * ((sw_max - sw_min) / (swus - swls))
+    # Pin the endpoints exactly, so that f.ex. pc at SWU is not subject to
+    # rounding. This also covers a collapsed scaled axis (SWL == SWU):
+    unscaled_swats = np.where(
+        swats >= swus, sw_max, np.where(swats <= swls, sw_min, unscaled_swats)
+    )
+    # Undefined endpoints give undefined pc:
+    unscaled_swats = np.where(np.isnan(swls + swus), np.nan, unscaled_swats)
+    return np.interp(unscaled_swats, sat_table, pc_table) * np.asarray(
+        scale_vert, dtype=np.float64
+    )
 
 
 def compute_pc(qc_frame: pd.DataFrame, satfunc_df: pd.DataFrame) -> pd.Series:
@@ -533,25 +780,26 @@ def compute_pc(qc_frame: pd.DataFrame, satfunc_df: pd.DataFrame) -> pd.Series:
 
     if "SATNUM" not in qc_frame or "PC_SCALING" not in qc_frame:
         return p_cap
-    for satnum, satnum_frame in qc_frame.groupby("SATNUM"):
-        if "SWLPC" in satnum_frame:
-            swls = satnum_frame["SWLPC"].to_numpy(dtype=np.float64)
-        elif "SWL" in satnum_frame:
-            swls = satnum_frame["SWL"].to_numpy(dtype=np.float64)
-        else:
-            swls = None
-        swus = (
-            satnum_frame["SWU"].to_numpy(dtype=np.float64)
-            if "SWU" in satnum_frame
-            else None
-        )
-        p_cap[satnum_frame.index] = _evaluate_pc(
-            satnum_frame["SWAT"].to_numpy(dtype=np.float64),
-            satnum_frame["PC_SCALING"].to_numpy(dtype=np.float64),
-            swls,
-            swus,
+    if "SWLPC" in qc_frame:
+        swls = qc_frame["SWLPC"].to_numpy(dtype=np.float64)
+    elif "SWL" in qc_frame:
+        swls = qc_frame["SWL"].to_numpy(dtype=np.float64)
+    else:
+        swls = None
+    swus = qc_frame["SWU"].to_numpy(dtype=np.float64) if "SWU" in qc_frame else None
+    swats = qc_frame["SWAT"].to_numpy(dtype=np.float64)
+    pc_scaling = qc_frame["PC_SCALING"].to_numpy(dtype=np.float64)
+    p_cap_values = p_cap.to_numpy(copy=True)
+    for satnum, rows in qc_frame.groupby("SATNUM").indices.items():
+        p_cap_values[rows] = _evaluate_pc(
+            swats[rows],
+            pc_scaling[rows],
+            swls[rows] if swls is not None else None,
+            swus[rows] if swus is not None else None,
             satfunc_df[satfunc_df["SATNUM"] == satnum],
         )
+    p_cap[:] = p_cap_values
+
     # Fix needed for OPM-flow above contact:
     contact = "OWC" if "OWC" in qc_frame else "GWC"
 
@@ -572,24 +820,25 @@ def compute_pc(qc_frame: pd.DataFrame, satfunc_df: pd.DataFrame) -> pd.Series:
     return p_cap
 
 
-def ppcwmax_gridvector(eclfiles: res2df.ResdataFiles) -> pd.Series:
+def ppcwmax_gridvector(
+    eclfiles: res2df.ResdataFiles, satnums: npt.ArrayLike
+) -> npt.NDArray[np.float64]:
     """Generate a vector of PPCWMAX data pr cell
 
     PPCWMAX is pr. SATNUM in the input deck
 
     Args:
         eclfiles
+        satnums: SATNUM value for each cell
 
     Returns:
-        pd.Series, indexed according to res2df.grid.df(eclfiles)
+        PPCWMAX value for each cell, in the order given by satnums
     """
-
-    satnum_df = res2df.grid.df(eclfiles, vectors="SATNUM")
-    deck = eclfiles.get_deck()
-    for satnum in satnum_df["SATNUM"].unique():
-        ppcwmax = deck["PPCWMAX"][satnum - 1][0].get_raw_data_list()[0]
-        satnum_df.loc[satnum_df["SATNUM"] == satnum, "PPCWMAX"] = ppcwmax
-    return satnum_df["PPCWMAX"]
+    ppcwmax = np.array(
+        [record[0].get_raw_data_list()[0] for record in eclfiles.get_deck()["PPCWMAX"]],
+        dtype=np.float64,
+    )
+    return ppcwmax[np.asarray(satnums) - 1]
 
 
 def merge_equil(grid_df: pd.DataFrame, equil_df: pd.DataFrame) -> pd.DataFrame:
@@ -615,7 +864,12 @@ def merge_equil(grid_df: pd.DataFrame, equil_df: pd.DataFrame) -> pd.DataFrame:
     assert not pd.isna(equil_df).any().any(), (
         f"BUG: NaNs in equil dataframe:\n{equil_df}"
     )
-    return grid_df.merge(equil_df, on="EQLNUM", how="left")
+    # Look up each cell's EQLNUM instead of merging, to avoid copying
+    # the grid dataframe:
+    equil_cells = equil_df.set_index("EQLNUM").reindex(grid_df["EQLNUM"].to_numpy())
+    for column in equil_cells:
+        grid_df[column] = equil_cells[column].to_numpy()
+    return grid_df
 
 
 def merge_pc_max(
@@ -633,27 +887,37 @@ def merge_pc_max(
     if satfunc_df.empty:
         raise ValueError("Saturation function dataframe is empty")
     max_pc = satfunc_df.groupby("SATNUM")[pc_name].max()
-    max_pc.name = pc_name + "_MAX"
-    return grid_df.merge(max_pc.reset_index(), on="SATNUM")
+    grid_df[pc_name + "_MAX"] = max_pc.reindex(grid_df["SATNUM"].to_numpy()).to_numpy()
+    if grid_df[pc_name + "_MAX"].isna().any():
+        # Cells with a SATNUM not in the saturation functions are dropped:
+        grid_df = grid_df.dropna(subset=[pc_name + "_MAX"]).reset_index(drop=True)
+    return grid_df
 
 
 def augment_grid_frame_qc_vectors(grid_df: pd.DataFrame) -> pd.DataFrame:
     """Add extra columns to a dataframe with simple calculations from
     data already in the dataframe"""
-    grid_df["EQLNUM"] = grid_df["EQLNUM"].astype(int)
-    grid_df["FIPNUM"] = grid_df["FIPNUM"].astype(int)
-    grid_df["SATNUM"] = grid_df["SATNUM"].astype(int)
+    grid_df["EQLNUM"] = grid_df["EQLNUM"].astype(np.int32)
+    grid_df["FIPNUM"] = grid_df["FIPNUM"].astype(np.int32)
+    grid_df["SATNUM"] = grid_df["SATNUM"].astype(np.int32)
 
-    grid_df["PORV"] = grid_df["VOLUME"] * grid_df["NTG"] * grid_df["PORO"]
+    porv = grid_df["VOLUME"].to_numpy(dtype=np.float64, copy=True)
+    porv *= grid_df["NTG"].to_numpy()
+    porv *= grid_df["PORO"].to_numpy()
+    grid_df["PORV"] = porv
 
     if "PPCW" in grid_df:
-        grid_df["PC_SCALING"] = grid_df["PPCW"] / grid_df["PCOW_MAX"]
+        pc_scaling = grid_df["PPCW"].to_numpy(dtype=np.float64, copy=True)
+        pc_scaling /= grid_df["PCOW_MAX"].to_numpy()
+        grid_df["PC_SCALING"] = pc_scaling
     else:
         logger.warning("PPCW not found in grid dataframe")
 
     if "SWATINIT" in grid_df:
-        grid_df["SWATINIT_SWAT"] = grid_df["SWATINIT"] - grid_df["SWAT"]
-        grid_df["SWATINIT_SWAT_WVOL"] = grid_df["SWATINIT_SWAT"] * grid_df["PORV"]
+        swatinit_swat = grid_df["SWATINIT"].to_numpy(dtype=np.float64, copy=True)
+        swatinit_swat -= grid_df["SWAT"].to_numpy()
+        grid_df["SWATINIT_SWAT"] = swatinit_swat
+        grid_df["SWATINIT_SWAT_WVOL"] = swatinit_swat * porv
 
     return grid_df
 
@@ -665,11 +929,14 @@ def get_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "DATAFILE",
+        nargs="+",
         help=(
             "Eclipse DATA-file for a finished run with restart data. "
             "It is also possible to provide a CSV file that has earlier "
             "been exported by this tool, which will trigger a rerun of "
-            "the volumetric report and plotting."
+            "the volumetric report and plotting. Several DATA files or "
+            "quoted glob patterns trigger batch mode, where only the "
+            "volumes are reported, one row pr. DATA file."
         ),
     )
     parser.add_argument(
@@ -711,6 +978,28 @@ def get_parser() -> argparse.ArgumentParser:
             "Does not affect CSV output"
         ),
     )
+    parser.add_argument(
+        "--volumes",
+        type=str,
+        help="Batch mode: CSV filename for the volumes pr. DATA file.",
+    )
+    parser.add_argument(
+        "--outputdir",
+        type=str,
+        help=(
+            "Batch mode: Directory for one CSV file pr. DATA file, "
+            "as with --output for a single DATA file."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Batch mode: Number of worker processes to share the DATA files "
+            "between. Use 0 for one worker per available CPU."
+        ),
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -1,8 +1,13 @@
 import argparse
 import datetime
+import io
+import itertools
 import logging
 import sys
+from collections.abc import Iterator
+from typing import TextIO
 
+import numpy as np
 import pandas as pd
 from dateutil.relativedelta import relativedelta
 
@@ -65,6 +70,9 @@ SUPPORTED_VOLCOLS = ["OIL", "GAS", "WATER", "GINJ", "WINJ", "BHP", "THP"]
 SUPPORTED_DAYCOLS = ["DAYS", "GIDAY", "WIDAY"]
 SUPPORTED_COLS = SUPPORTED_VOLCOLS + SUPPORTED_DAYCOLS
 
+# Number of rows formatted at a time when writing vol files
+VOL_CHUNKSIZE = 100000
+
 
 def read_pdm_csv_files(
     csvfiles: pd.DataFrame | str | list[str] | list[pd.DataFrame],
@@ -144,62 +152,86 @@ def check_consecutive_dates(data: pd.DataFrame) -> None:
     """
 
     assert isinstance(data.index, pd.MultiIndex)
-    for well in data.index.levels[0]:
-        welldata = data.loc[well].reset_index()
-        welldata["DATE"] = pd.to_datetime(welldata["DATE"])
-        welldata["datediff"] = welldata["DATE"].diff()
-        if len(welldata) < 2:
-            continue
-
-        # Determine most common date diff (typically one day)
-        # which will be like this in Python: Timedelta('1 days 00:00:00')
-        dominantdelta = (
-            welldata.groupby("datediff").count().sort_values("DATE").index[-1]
-        )
+    wells = data.index.get_level_values(0)
+    dates = pd.DatetimeIndex(pd.to_datetime(data.index.get_level_values(1)))
+    data = data.set_axis(
+        pd.MultiIndex.from_arrays([wells, dates], names=["WELL", "DATE"])
+    ).sort_index()
+
+    datediff = (
+        pd.Series(data.index.get_level_values("DATE"), index=data.index)
+        .groupby(level="WELL")
+        .diff()
+    )
+    diffs = datediff.dropna()
+    if diffs.empty:
+        return
+    diffwells = diffs.index.get_level_values("WELL")
+
+    # Determine most common date diff (typically one day) pr. well, which will
+    # be like this in Python: Timedelta('1 days 00:00:00'). Ties are resolved
+    # to the smallest timedelta.
+    deltacounts = diffs.groupby([diffwells, diffs.to_numpy()]).size()
+    dominant = (
+        deltacounts.sort_values(ascending=False, kind="stable")
+        .groupby(level=0)
+        .head(1)
+        .index
+    )
+    dominantdelta = pd.Series(
+        dominant.get_level_values(1), index=dominant.get_level_values(0)
+    )
 
-        # List the dates where dates are missing prior to these:
-        checkrows = welldata.dropna(axis="rows", subset=["datediff"]).loc[
-            welldata["datediff"] != dominantdelta
-        ]
+    # The rows where the date diff deviates from the dominant date diff:
+    checkmask = datediff.notna().to_numpy() & (
+        datediff.to_numpy()
+        != dominantdelta.reindex(data.index.get_level_values("WELL")).to_numpy()
+    )
+    checkrows = data[checkmask].assign(datediff=datediff[checkmask])
+
+    # Sum of nonzero production/injections in the rows with non-uniform dates,
+    # ignoring rate columns with missing data for the well:
+    ratecols = [x for x in data.columns if x.endswith("R") and x.startswith("W")]
+    rates = checkrows[ratecols].astype("float")
+    checkprod = (
+        rates.abs()
+        .groupby(level="WELL")
+        .sum()
+        .mask(rates.isna().groupby(level="WELL").any(), 0.0)
+        .sum(axis="columns")
+    )
 
-        datedeltas = (
-            pd.to_datetime(data.loc[well].reset_index()["DATE"])
-            .diff()
-            .dt.days.dropna()
-            .unique()
-        )
-        datedeltas.sort()
-        # Do we have nonzero production/injections in the rows with non-uniform dates?
-        ratecols = [
-            x for x in checkrows.columns if x.endswith("R") and x.startswith("W")
-        ]
-        checkprod = (
-            checkrows[ratecols].dropna(axis="columns").astype("float").abs().sum().sum()
-        )
-        if len(datedeltas) > 1 and checkprod > 0.1:
+    diffdays = diffs.dt.days.groupby(level="WELL")
+    summary = pd.DataFrame(
+        {
+            "dominantdelta": dominantdelta,
+            "mindays": diffdays.min(),
+            "ndeltas": diffdays.nunique(),
+            "checkprod": checkprod,
+        }
+    ).fillna({"checkprod": 0.0})
+
+    for well, row in summary.iterrows():
+        if row["ndeltas"] > 1 and row["checkprod"] > 0.1:
             logger.warning(
                 "Warning: Uneven date intervals for well %s, check these rows:\n%s",
                 well,
-                checkrows,
+                checkrows.loc[well],
             )
-        if int(datedeltas[0]) != 1:
+        if int(row["mindays"]) != 1:
             logger.warning("Dates are not daily-consecutive for well %s", well)
-            logger.warning("Most common timedelta is: %s", dominantdelta)
+            logger.warning("Most common timedelta is: %s", row["dominantdelta"])
 
 
-def df2vol(data: pd.DataFrame) -> str:
-    """Convert a DataFrame to a multiline string in vol-format.
-
-    The 'tab' character is used as a field separator in this format
+def _select_volcolumns(data: pd.DataFrame) -> pd.DataFrame:
+    """Translate column names to vol-format, and drop unsupported columns.
 
     Args:
-        data (pd.DataFrame): Production data, indexed by [WELL, DATE].
-            Unsupported columns will be ignored.
+        data: Production data, indexed by [WELL, DATE].
 
     Returns:
-        str: multiline, in "OFM vol"-format.
+        Data with only supported columns, with empty cells filled with zeros.
     """
-
     # Apply column name translation for a subset of the incoming column names
     columns_trans = [PDMCOLS2VOL.get(colname, colname) for colname in data.columns]
 
@@ -221,22 +253,98 @@ def df2vol(data: pd.DataFrame) -> str:
 
     # Fill empty cells with zeros, empty cells can stem from concatenation
     # of dataframes with gas and water injectors.
-    voldata = voldata.fillna(value=0.0)
+    return voldata.fillna(value=0.0)
+
+
+def _format_vollines(voldata: pd.DataFrame) -> list[str]:
+    """Format each row of data into a line of whitespace separated values,
+    starting with the date.
+
+    All rows are formatted in one go, column by column. Floats are formatted
+    with their shortest exact representation, so no precision is lost.
+
+    Args:
+        voldata: Data with only supported columns, indexed by [WELL, DATE].
+
+    Returns:
+        One string pr. row in voldata.
+    """
+    lines = pd.Series(voldata.index.get_level_values("DATE")).astype(str)
+    for colname in voldata.columns:
+        lines = lines + " " + voldata[colname].astype(str).to_numpy()
+    return lines.to_list()
+
+
+def _iter_vollines(voldata: pd.DataFrame) -> Iterator[str]:
+    """Format the rows of data into lines, VOL_CHUNKSIZE rows at a time.
+
+    Args:
+        voldata: Data with only supported columns, indexed by [WELL, DATE].
+
+    Yields:
+        One string pr. row in voldata.
+    """
+    for start in range(0, len(voldata), VOL_CHUNKSIZE):
+        yield from _format_vollines(voldata.iloc[start : start + VOL_CHUNKSIZE])
+
+
+def write_vol(data: pd.DataFrame, fileobj: TextIO) -> int:
+    """Write a DataFrame in vol-format to an open file handle.
+
+    The data is formatted VOL_CHUNKSIZE rows at a time and written well by
+    well, so that the full vol-string is never held in memory.
+
+    Args:
+        data: Production data, indexed by [WELL, DATE].
+            Unsupported columns will be ignored.
+        fileobj: Writable text stream, typically an opened file or an
+            io.StringIO object.
 
-    volstr = ""
-    volstr += "*METRIC\n"
-    volstr += "*DAILY\n"
+    Returns:
+        Number of lines written.
+    """
+    voldata = _select_volcolumns(data)
+
+    header = ["*METRIC", "*DAILY"]
     if any(colname in SUPPORTED_DAYCOLS for colname in voldata.columns):
-        volstr += "*HRS_IN_DAYS\n"
-    volstr += "*DATE *" + " *".join(voldata.columns)
+        header.append("*HRS_IN_DAYS")
+    header.append("*DATE *" + " *".join(voldata.columns))
+    fileobj.write("\n".join(header))
+    linecount = len(header)
+
     assert isinstance(voldata.index, pd.MultiIndex)
-    if not voldata.empty:
-        for well in voldata.index.levels[0]:
-            volstr += f"\n\n*NAME {well}\n"
-            volstr += voldata.loc[well].to_string(header=False, index_names=False)
-    else:
+    if voldata.empty:
         logger.warning("No data, only header written")
-    return volstr
+        return linecount
+
+    # Group rows by well, keeping the row order within each well:
+    voldata = voldata.sort_index(level=0, sort_remaining=False, kind="stable")
+    lines = _iter_vollines(voldata)
+    wells = voldata.index.get_level_values(0).to_numpy()
+    wellstarts = [0, *(np.flatnonzero(wells[1:] != wells[:-1]) + 1)]
+    for start, end in zip(wellstarts, [*wellstarts[1:], len(wells)], strict=True):
+        fileobj.write(f"\n\n*NAME {wells[start]}\n")
+        fileobj.write("\n".join(itertools.islice(lines, end - start)))
+        linecount += end - start + 2
+    return linecount
+
+
+def df2vol(data: pd.DataFrame) -> str:
+    """Convert a DataFrame to a multiline string in vol-format.
+
+    Whitespace is used as a field separator in this format. Use
+    write_vol() to write directly to a file.
+
+    Args:
+        data (pd.DataFrame): Production data, indexed by [WELL, DATE].
+            Unsupported columns will be ignored.
+
+    Returns:
+        str: multiline, in "OFM vol"-format.
+    """
+    volbuffer = io.StringIO()
+    write_vol(data, volbuffer)
+    return volbuffer.getvalue()
 
 
 class CustomFormatter(
@@ -294,13 +402,13 @@ def csv2ofmvol_main(csvfilepatterns: list[str], output: str) -> bool:
     # to ascertain how downstream tools will react.
     check_consecutive_dates(data)
 
-    # Convert dataframes to a multiline string:
-    volstr = df2vol(data)
+    # Fail on unsupported data before the output file is opened:
+    voldata = _select_volcolumns(data)
 
     with open(output, "w", encoding="utf8") as outfile:
         outfile.write(f"-- Data printed by csv2ofmvol at {datetime.datetime.now()}\n")
         outfile.write(f"-- Input files: {csvfiles}\n\n")
-        outfile.write(volstr)
+        linecount = write_vol(voldata, outfile) + 3
 
     assert isinstance(data.index, pd.MultiIndex)
     logger.info("Well count: %s", len(data.index.levels[0]))
@@ -317,7 +425,7 @@ def csv2ofmvol_main(csvfilepatterns: list[str], output: str) -> bool:
             delta.months,
             delta.days,
         )
-    logger.info("Written %s lines to %s.", len(volstr) + 3, output)
+    logger.info("Written %s lines to %s.", linecount, output)
     return True
 
 
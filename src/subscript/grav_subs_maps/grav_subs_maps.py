@@ -6,23 +6,17 @@ from datetime import date
 from pathlib import Path
 from typing import Annotated, Any
 
+import numpy as np
 import xtgeo
 import yaml
 from grid3d_maps.avghc._loader import FMUYamlSafeLoader
 from pydantic import BaseModel, Field, FilePath, field_validator
-from resdata.gravimetry import ResdataGrav, ResdataSubsidence
-from resdata.grid import Grid
-from resdata.resfile import ResdataFile
 
 import subscript
+from subscript.gravity_engine.gravity_engine import GravityEngine
 
 logger = subscript.getLogger(__name__)
 
-# Constant for subsidence modelling, not influencing results
-# since subsidence is calculated from porevolume change
-# therefore defaulted
-DUMMY_YOUNGS = 0.5
-
 PREFIX_GRAVSURF = "all--delta_gravity_"
 PREFIX_SUBSSURF = "all--subsidence"
 
@@ -108,6 +102,15 @@ def get_parser() -> argparse.ArgumentParser:
         help="Path to directory for output maps. Directory must exist.",
         default="./",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=(
+            "Number of worker processes to share the map nodes between. "
+            "Use 0 for one worker per available CPU."
+        ),
+        default=1,
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -135,13 +138,15 @@ def main() -> None:
     if not Path(args.UNRSTfile).exists():
         sys.exit("UNRST file does not exist:" + args.UNRSTfile)
 
-    main_gravmaps(args.UNRSTfile, config, Path(args.outputdir))
+    main_gravmaps(args.UNRSTfile, config, Path(args.outputdir), workers=args.workers)
 
 
 def main_gravmaps(
     unrst_file: str,
     config: dict[str, Any],
     output_folder: Path,
+    workers: int = 1,
+    engine: GravityEngine | None = None,
 ) -> None:
     """
     Process a configuration, model gravity and subsidence surfaces and write to disk.
@@ -149,6 +154,9 @@ def main_gravmaps(
     Args:
         resdata: Path to flow simulation UNRST file
         config: Configuration for modelling
+        workers: Number of worker processes to split the map nodes between
+        engine: Already loaded simulation case, to share loaded surveys
+            with other modelling of the same case.
     """
 
     cfg = GravMapsConfig.model_validate(config).model_dump()
@@ -164,19 +172,8 @@ def main_gravmaps(
     seabed = xtgeo.surface_from_file(map_template)
     seabed.coarsen(coarsening)
 
-    if isinstance(unrst_file, str):
-        restart_file = unrst_file[:-6] + ".UNRST"
-        egrid_file = unrst_file[:-6] + ".EGRID"
-        init_file = unrst_file[:-6] + ".INIT"
-        grid = Grid(egrid_file)
-        init = ResdataFile(init_file)
-        rest = ResdataFile(restart_file)
-
-    restart_index = {}
-
-    # From restart datetime format to YYYYMMDD as key
-    for i, restart_date in enumerate(rest.dates):
-        restart_index[restart_date.strftime("%Y%m%d")] = i
+    if engine is None:
+        engine = GravityEngine.from_unrst(unrst_file)
 
     diffdates = []
     # Convert dates from datetime format to strings
@@ -186,56 +183,23 @@ def main_gravmaps(
         diffdates.append(diff)
         logger.info(f"{diffdate[0]}_{diffdate[1]}")
 
-    grav = ResdataGrav(grid, init)
-    subsidence = ResdataSubsidence(grid, init)
-
-    added_dates = []
-
-    for diffdate in diffdates:
-        for singledate in diffdate:  # base and monitor
-            rsb = rest.restart_view(0)
-            if singledate not in added_dates:
-                if singledate in restart_index:
-                    rsb = rest.restart_view(restart_index[singledate])
-                    if rest.has_kw("RFIPGAS"):
-                        grav.add_survey_RFIP(singledate, rsb)
-                    else:
-                        logger.info(
-                            "RFIPGAS missing in restart file.  "
-                            "Cannot use RFIP in gravity calculations.  "
-                            "Will try to use RPORV method instead"
-                        )
-                        grav.add_survey_RPORV(singledate, rsb)
-
-                    subsidence.add_survey_PRESSURE(singledate, rsb)
-                    added_dates.append(singledate)
-                else:
-                    logger.error(
-                        f"Date {singledate} specified but not found in UNRST file."
-                    )
-                    sys.exit(1)
-    phase_code = {"oil": 1, "gas": 2, "water": 4, "total": 7}
+    engine.check_diffdates(diffdates)
+
+    # Map nodes as stations, undefined nodes in the seabed map are left undefined
+    xvalues, yvalues = seabed.get_xy_values()
+    nodes = ~np.ma.getmaskarray(seabed.values)
+    seabed_depth = seabed.values.data[nodes]
+    stations = np.column_stack(
+        (np.asarray(xvalues)[nodes], np.asarray(yvalues)[nodes], seabed_depth)
+    )
 
     # Gravity
-    for diffdate in diffdates:
-        for phase in phases:
-            logger.info(
-                f"Calculating delta gravity map from {phase} "
-                f"for {diffdate[0]}_{diffdate[1]}"
-            )
+    logger.info(f"Calculating delta gravity maps from {', '.join(phases)}")
+    dgsim_values = engine.gravity(stations, diffdates, phases, workers=workers)
+    for diff_index, diffdate in enumerate(diffdates):
+        for phase_index, phase in enumerate(phases):
             dgsim = seabed.copy()
-            df_dgsim = dgsim.get_dataframe()
-            dgsim_series = []
-            for _index, row in df_dgsim.iterrows():
-                dgsim_series.append(
-                    grav.eval(
-                        diffdate[1],
-                        diffdate[0],
-                        (row["X_UTME"], row["Y_UTMN"], row["VALUES"]),
-                        phase_mask=phase_code[phase],
-                    )
-                )
-            dgsim.values = dgsim_series
+            dgsim.values[nodes] = dgsim_values[:, diff_index, phase_index]
             filename = (
                 PREFIX_GRAVSURF
                 + phase
@@ -248,24 +212,13 @@ def main_gravmaps(
             dgsim.to_file(os.path.join(output_folder, filename))
 
     # Subsidence
-    for diffdate in diffdates:
-        logger.info(f"Calculating subsidence map for {diffdate[0]}_{diffdate[1]}")
+    logger.info("Calculating subsidence maps")
+    dzsim_values = engine.subsidence(
+        stations, seabed_depth, diffdates, poisson_ratio, workers=workers
+    )
+    for diff_index, diffdate in enumerate(diffdates):
         dzsim = seabed.copy()
-        df_dzsim = dzsim.get_dataframe()
-        dzsim_series = []
-        for _index, row in df_dzsim.iterrows():
-            dzsim_series.append(
-                subsidence.eval_geertsma_rporv(
-                    diffdate[1],
-                    diffdate[0],
-                    (row["X_UTME"], row["Y_UTMN"], row["VALUES"]),
-                    DUMMY_YOUNGS,
-                    poisson_ratio,
-                    row["VALUES"],
-                )
-            )
-
-        dzsim.values = [i * 100 for i in dzsim_series]  # From m to cms
+        dzsim.values[nodes] = 100 * dzsim_values[:, diff_index]  # From m to cms
 
         filename = PREFIX_SUBSSURF + "--" + diffdate[0] + "_" + diffdate[1] + ".gri"
         dzsim.to_file(os.path.join(output_folder, filename))
@@ -11,19 +11,13 @@ import pandas as pd
 import yaml
 from grid3d_maps.avghc._loader import FMUYamlSafeLoader
 from pydantic import BaseModel, Field, FilePath
-from resdata.gravimetry import ResdataGrav, ResdataSubsidence
-from resdata.grid import Grid
-from resdata.resfile import ResdataFile
 
 import subscript
+from subscript.grav_subs_maps.grav_subs_maps import main_gravmaps
+from subscript.gravity_engine.gravity_engine import DateString, GravityEngine
 
 logger = subscript.getLogger(__name__)
 
-# Constant for subsidence modelling, not influencing results
-# since subsidence is calculated from porevolume change RPORV
-# therefore defaulted
-DUMMY_YOUNGS = 10
-
 PREFIX_POINTS = "all"  # calculation is cumulative over all zones
 EXTENSION_POINTS = ".poi"  # extension for points in roxar points format
 
@@ -57,8 +51,6 @@ EPILOGUE = """
 
 """
 
-DateString = Annotated[str, "Date in YYYYMMDD format"]
-
 
 class Phase(StrEnum):
     OIL = "oil"
@@ -67,9 +59,6 @@ class Phase(StrEnum):
     TOTAL = "total"
 
 
-PHASE_CODE = {Phase.OIL: 1, Phase.GAS: 2, Phase.WATER: 4, Phase.TOTAL: 7}
-
-
 class GravPointsInput(BaseModel):
     diffdates: list[tuple[date, date]]
 
@@ -135,6 +124,28 @@ def get_parser() -> argparse.ArgumentParser:
         ),
         default=".txt",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=(
+            "Number of worker processes to share the stations between. "
+            "Use 0 for one worker per available CPU."
+        ),
+        default=1,
+    )
+    parser.add_argument(
+        "--mapsconfig",
+        type=str,
+        help=(
+            "Name of YAML config file for grav_subs_maps. If given, maps are "
+            "modelled in the same run, reusing the loaded simulation results."
+        ),
+    )
+    parser.add_argument(
+        "--mapsdir",
+        type=str,
+        help="Path to directory for output maps. Defaults to the output directory.",
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -163,13 +174,30 @@ def main() -> None:
     if not Path(args.UNRSTfile).is_file():
         sys.exit("UNRST file does not exist:" + args.UNRSTfile)
 
+    maps_config = None
+    maps_dir = Path(args.mapsdir or args.outputdir)
+    if args.mapsconfig is not None:
+        if not Path(args.mapsconfig).is_file():
+            sys.exit("No such file:" + args.mapsconfig)
+        with open(args.mapsconfig, encoding="utf8") as stream:
+            maps_config = yaml.load(stream, Loader=FMUYamlSafeLoader)
+        if not maps_dir.is_dir():
+            sys.exit("Output folder does not exist:" + str(maps_dir))
+
+    engine = GravityEngine.from_unrst(args.UNRSTfile)
     main_gravpoints(
         args.UNRSTfile,
         config,
         Path(args.outputdir),
         args.prefix_gendata,
         args.extension_gendata,
+        workers=args.workers,
+        engine=engine,
     )
+    if maps_config is not None:
+        main_gravmaps(
+            args.UNRSTfile, maps_config, maps_dir, workers=args.workers, engine=engine
+        )
 
 
 def export_grav_points_xyz(
@@ -269,12 +297,17 @@ def main_gravpoints(
     output_folder: Path,
     pref_gendata: str,
     ext_gendata: str,
+    workers: int = 1,
+    engine: GravityEngine | None = None,
 ) -> None:
     """
     Process a configuration, model gravity and subsidence points and write to disk.
 
     Args:
         config: Configuration for modelling
+        workers: Number of worker processes to split the stations between
+        engine: Already loaded simulation case, to share loaded surveys
+            with other modelling of the same case.
     """
 
     cfg = GravPointsConfig(**config)
@@ -285,18 +318,8 @@ def main_gravpoints(
     phases = cfg.calculations.phases
     poisson_ratio = cfg.calculations.poisson_ratio
 
-    restart_file = unrst_file[:-6] + ".UNRST"
-    egrid_file = unrst_file[:-6] + ".EGRID"
-    init_file = unrst_file[:-6] + ".INIT"
-    grid = Grid(egrid_file)
-    init = ResdataFile(init_file)
-    rest = ResdataFile(restart_file)
-
-    restart_index: dict[DateString, int] = {}
-
-    # From restart datetime format to YYYYMMDD as key
-    for i, restart_date in enumerate(rest.dates):
-        restart_index[restart_date.strftime("%Y%m%d")] = i
+    if engine is None:
+        engine = GravityEngine.from_unrst(unrst_file)
 
     diffdates: list[tuple[DateString, DateString]] = []
     # Convert dates from datetime format to strings
@@ -309,59 +332,24 @@ def main_gravpoints(
         diffdates.append(diff)
         logger.info(f"{input_diffdate[0]}_{input_diffdate[1]}")
 
-    grav = ResdataGrav(grid, init)
-    subsidence = ResdataSubsidence(grid, init)
-
-    added_dates: list[DateString] = []
-
-    for diffdate in diffdates:
-        for singledate in diffdate:  # base and monitor
-            if singledate not in added_dates:
-                if singledate in restart_index:
-                    rsb = rest.restart_view(restart_index[singledate])
-                    if rest.has_kw("RFIPGAS"):
-                        grav.add_survey_RFIP(singledate, rsb)
-                    else:
-                        logger.info(
-                            "RFIPGAS missing in restart file.  "
-                            "Cannot use RFIP in gravity calculations.  "
-                            "Will try to use RPORV method instead"
-                        )
-                        grav.add_survey_RPORV(singledate, rsb)
-
-                    subsidence.add_survey_PRESSURE(singledate, rsb)
-                    added_dates.append(singledate)
-                else:
-                    logger.error(
-                        f"Date {singledate} specified but not found in UNRST file."
-                    )
-                    sys.exit(1)
+    engine.check_diffdates(diffdates)
 
     # Gravity
     for diffdate in diffdates:
         diff_year = str(diffdate[0][0:4]) + "_" + str(diffdate[1][0:4])
         active_stations = pd.read_csv(station_files.grav[diff_year], sep=";")
+        stations = active_stations[["utmx", "utmy", "depth"]].to_numpy(dtype=float)
 
-        for phase in phases:
-            logger.info(
-                f"Calculating delta gravity at bencmark stations "
-                f"from {phase} for {diffdate[0]}_{diffdate[1]}"
-            )
+        logger.info(
+            f"Calculating delta gravity at bencmark stations "
+            f"from {', '.join(phases)} for {diffdate[0]}_{diffdate[1]}"
+        )
+        gravity_values = engine.gravity(stations, [diffdate], phases, workers=workers)
 
-            gravity_values = [
-                grav.eval(
-                    diffdate[1], diffdate[0], (x, y, z), phase_mask=PHASE_CODE[phase]
-                )
-                for x, y, z in zip(
-                    active_stations["utmx"],
-                    active_stations["utmy"],
-                    active_stations["depth"],
-                    strict=False,
-                )
-            ]
+        for phase_index, phase in enumerate(phases):
             active_stations[
                 "dgsim_" + phase + "_" + diffdate[0] + "_" + diffdate[1]
-            ] = gravity_values
+            ] = gravity_values[:, 0, phase_index]
 
             # Export for each diffdate, all phases specified in config
             export_grav_points_xyz(active_stations, phase, diffdate, output_folder)
@@ -376,22 +364,19 @@ def main_gravpoints(
     for diffdate in diffdates:
         diff_year = str(diffdate[0][0:4]) + "_" + str(diffdate[1][0:4])
         active_stations = pd.read_csv(station_files.subs[diff_year], sep=";")
-
-        subs_values = [
-            subsidence.eval_geertsma_rporv(
-                diffdate[1], diffdate[0], (x, y, z), DUMMY_YOUNGS, poisson_ratio, z
-            )
-            for x, y, z in zip(
-                active_stations["utmx"],
-                active_stations["utmy"],
-                active_stations["depth"],
-                strict=False,
-            )
-        ]
-
-        active_stations["subsidence" + "_" + diffdate[0] + "_" + diffdate[1]] = [
-            i * 100 for i in subs_values
-        ]  # from m to cm
+        stations = active_stations[["utmx", "utmy", "depth"]].to_numpy(dtype=float)
+
+        subs_values = engine.subsidence(
+            stations,
+            stations[:, 2],  # Stations are located at the seabed
+            [diffdate],
+            poisson_ratio,
+            workers=workers,
+        )[:, 0]
+
+        active_stations["subsidence" + "_" + diffdate[0] + "_" + diffdate[1]] = (
+            100 * subs_values  # from m to cm
+        )
 
         export_subs_points_xyz(active_stations, diffdate, output_folder)
 
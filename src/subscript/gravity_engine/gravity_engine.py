@@ -0,0 +1,460 @@
+"""Gravity and subsidence modelling from flow simulation output.
+
+Shared by grav_subs_maps and grav_subs_points. A :class:`GravityEngine` holds the
+grid geometry for one simulation case and loads the restart report steps it
+needs on first use, so that map nodes and point stations can be modelled in the
+same run without reading the simulation output twice.
+"""
+
+import os
+import sys
+import tempfile
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import Annotated
+
+import numpy as np
+from resdata.grid import Grid
+from resdata.resfile import ResdataFile, ResdataFileView
+
+import subscript
+
+logger = subscript.getLogger(__name__)
+
+# Gravitational constant scaled to give gravity change in micro Gal
+GRAV_CONSTANT = 6.67428e-3
+
+PHASE_CODE = {"oil": 1, "gas": 2, "water": 4, "total": 7}
+
+# Restart keywords for each phase: RFIP, saturation and density (E100, E300).
+# The oil saturation is not stored, it is what remains after water and gas.
+PHASE_KEYWORDS = {
+    "oil": ("RFIPOIL", None, "OIL_DEN", "DENO"),
+    "gas": ("RFIPGAS", "SGAS", "GAS_DEN", "DENG"),
+    "water": ("RFIPWAT", "SWAT", "WAT_DEN", "DENW"),
+}
+
+# Number of station x cell elements evaluated in one block, sized to fit in cache
+KERNEL_BLOCKSIZE = 2**16
+
+DateString = Annotated[str, "Date in YYYYMMDD format"]
+
+
+class GravityEngine:
+    def __init__(self, grid: Grid, init: ResdataFile, rest: ResdataFile) -> None:
+        """Gravity and subsidence modelling for one simulation case.
+
+        The cell positions are computed once. Surveys, i.e. the cell masses
+        and pore volumes at a restart date, are read from the restart file
+        the first time they are asked for and then kept, so that any number
+        of diffdates and phases can be modelled as array differences.
+
+        Args:
+            grid: Simulation grid
+            init: INIT file for the simulation
+            rest: Unified restart file for the simulation
+        """
+        self.grid = grid
+        self.init = init
+        self.rest = rest
+
+        # From restart datetime format to YYYYMMDD as key
+        self.restart_index: dict[DateString, int] = {
+            restart_date.strftime("%Y%m%d"): i
+            for i, restart_date in enumerate(rest.dates)
+        }
+
+        self.use_rfip = rest.has_kw("RFIPGAS")
+        if not self.use_rfip:
+            logger.info(
+                "RFIPGAS missing in restart file.  "
+                "Cannot use RFIP in gravity calculations.  "
+                "Will try to use RPORV method instead"
+            )
+        # Phase indicator in INTEHEAD, interpreted with the same codes as PHASE_CODE
+        self.phases = init.iget_named_kw("INTEHEAD", 0)[14]
+        self.reservoir = reservoir_cells(grid, init)
+        self.cell_positions = grid.export_position(grid.export_index(active_only=True))[
+            self.reservoir
+        ]
+        self._surveys: dict[DateString, dict[str, np.ndarray]] = {}
+
+    @classmethod
+    def from_unrst(cls, unrst_file: str) -> "GravityEngine":
+        """Open the EGRID, INIT and UNRST files for a simulation case.
+
+        Args:
+            unrst_file: Path to the UNRST file, the other files are found
+                next to it with the same basename.
+        """
+        basename = unrst_file[:-6]
+        return cls(
+            Grid(basename + ".EGRID"),
+            ResdataFile(basename + ".INIT"),
+            ResdataFile(basename + ".UNRST"),
+        )
+
+    def check_diffdates(self, diffdates: Sequence[Sequence[DateString]]) -> None:
+        """Exit if any of the dates in the diffdates is not in the restart file"""
+        for diffdate in diffdates:
+            for singledate in diffdate:  # base and monitor
+                if singledate not in self.restart_index:
+                    logger.error(
+                        f"Date {singledate} specified but not found in UNRST file."
+                    )
+                    sys.exit(1)
+
+    def survey(self, singledate: DateString) -> dict[str, np.ndarray]:
+        """Cell mass for each phase and pore volume ("porv") at a restart date.
+
+        Only the keywords needed for the survey are read from the report step,
+        and each date is read once.
+        """
+        if singledate not in self._surveys:
+            logger.info(f"Loading survey {singledate}")
+            rsb = self.rest.restart_view(self.restart_index[singledate])
+            survey = {
+                phase: mass[self.reservoir]
+                for phase, mass in phase_masses(rsb, self.phases, self.use_rfip).items()
+            }
+            survey["porv"] = _restart_array(rsb, "RPORV")[self.reservoir]
+            self._surveys[singledate] = survey
+        return self._surveys[singledate]
+
+    def gravity(
+        self,
+        stations: np.ndarray,
+        diffdates: Sequence[Sequence[DateString]],
+        phases: Sequence[str],
+        workers: int = 1,
+    ) -> np.ndarray:
+        """Gravity change at stations for each diffdate and phase.
+
+        Args:
+            stations: Station positions (x, y, depth), shape (nstations, 3)
+            diffdates: Pairs of (monitor, base) dates
+            phases: Phase names, "total" sums all phases in the model
+            workers: Number of worker processes to split the stations between
+
+        Returns:
+            Gravity change in micro Gal, shape (nstations, ndiffdates, nphases)
+        """
+        delta_mass = np.column_stack(
+            [
+                delta_mass_by_phase(
+                    self.survey(diffdate[1]), self.survey(diffdate[0]), phases
+                )
+                for diffdate in diffdates
+            ]
+        )
+        return eval_tiled(
+            eval_gravity, self.cell_positions, delta_mass, stations, workers=workers
+        ).reshape(len(stations), len(diffdates), len(phases))
+
+    def subsidence(
+        self,
+        stations: np.ndarray,
+        seabed: np.ndarray,
+        diffdates: Sequence[Sequence[DateString]],
+        poisson_ratio: float,
+        workers: int = 1,
+    ) -> np.ndarray:
+        """Subsidence at stations for each diffdate, using the Geertsma model.
+
+        Args:
+            stations: Station positions (x, y, depth), shape (nstations, 3)
+            seabed: Seabed depth at each station, shape (nstations,)
+            diffdates: Pairs of (monitor, base) dates
+            poisson_ratio: Poisson ratio used in the Geertsma model
+            workers: Number of worker processes to split the stations between
+
+        Returns:
+            Subsidence in metres, shape (nstations, ndiffdates)
+        """
+        delta_porv = np.column_stack(
+            [
+                self.survey(diffdate[1])["porv"] - self.survey(diffdate[0])["porv"]
+                for diffdate in diffdates
+            ]
+        )
+        return eval_tiled(
+            eval_geertsma,
+            self.cell_positions,
+            delta_porv,
+            stations,
+            seabed,
+            poisson_ratio,
+            workers=workers,
+        )
+
+
+def reservoir_cells(grid: Grid, init: ResdataFile) -> np.ndarray:
+    """Boolean mask over the active cells, False for numerical aquifer cells.
+
+    Args:
+        grid: Simulation grid
+        init: INIT file for the simulation
+
+    Returns:
+        Mask with one element per active cell
+    """
+    if "AQUIFERN" in init:
+        return init.iget_named_kw("AQUIFERN", 0).numpy_copy() >= 0
+    return np.ones(grid.get_num_active(), dtype=bool)
+
+
+def _restart_array(rsb: ResdataFileView, keyword: str) -> np.ndarray:
+    return rsb.iget_named_kw(keyword, 0).numpy_copy().astype(np.float64)
+
+
+def phase_masses(
+    rsb: ResdataFileView, phases: int, use_rfip: bool
+) -> dict[str, np.ndarray]:
+    """Compute the fluid mass in each active cell for one restart report step.
+
+    The masses are computed from the RFIPxxx keywords when ``use_rfip`` is set,
+    otherwise from the reservoir pore volume (RPORV) and the saturations.
+    Densities are taken from the per-cell density keywords.
+
+    Args:
+        rsb: Restart view for the report step
+        phases: Phase bitmask for the phases present in the model
+        use_rfip: Whether to use the RFIP keywords
+
+    Returns:
+        Dictionary from phase name to cell masses
+    """
+    masses = {}
+    if not use_rfip:
+        porv = _restart_array(rsb, "RPORV")
+        oil_saturation = np.ones(len(porv), dtype=np.float32)
+        for _, satkw, _, _ in PHASE_KEYWORDS.values():
+            if satkw is not None and satkw in rsb:
+                oil_saturation -= rsb.iget_named_kw(satkw, 0).numpy_view()
+    for phase, (rfipkw, satkw, denkw, denkw_e300) in PHASE_KEYWORDS.items():
+        if not phases & PHASE_CODE[phase]:
+            continue
+        density = _restart_array(rsb, denkw if denkw in rsb else denkw_e300)
+        if use_rfip:
+            masses[phase] = _restart_array(rsb, rfipkw) * density
+        elif satkw is None:
+            masses[phase] = porv * oil_saturation * density
+        else:
+            masses[phase] = porv * _restart_array(rsb, satkw) * density
+    return masses
+
+
+def delta_mass_by_phase(
+    base: dict[str, np.ndarray], monitor: dict[str, np.ndarray], phases: Sequence[str]
+) -> np.ndarray:
+    """Change in cell mass from base to monitor survey for each of the given phases.
+
+    Args:
+        base: Base survey, as returned by :meth:`GravityEngine.survey`
+        monitor: Monitor survey, as returned by :meth:`GravityEngine.survey`
+        phases: Phase names, "total" sums all phases in the model
+
+    Returns:
+        Array with one column per phase, shape (ncells, len(phases))
+    """
+    delta_mass = np.zeros((len(base["porv"]), len(phases)))
+    for model_phase in PHASE_KEYWORDS:
+        if model_phase not in monitor:
+            continue
+        delta = monitor[model_phase] - base[model_phase]
+        for phase_index, phase in enumerate(phases):
+            if PHASE_CODE[model_phase] & PHASE_CODE[phase]:
+                delta_mass[:, phase_index] += delta
+    return delta_mass
+
+
+def _station_blocks(nstations: int, ncells: int) -> list[slice]:
+    blocksize = max(1, KERNEL_BLOCKSIZE // max(ncells, 1))
+    return [
+        slice(start, min(start + blocksize, nstations))
+        for start in range(0, nstations, blocksize)
+    ]
+
+
+def eval_gravity(
+    cell_positions: np.ndarray, delta_mass: np.ndarray, stations: np.ndarray
+) -> np.ndarray:
+    """Gravity change from cell mass changes at a set of stations.
+
+    The stations are evaluated in small blocks, reusing the work arrays for the
+    station x cell distances so that the kernel stays in cache.
+
+    Args:
+        cell_positions: Cell centres, shape (ncells, 3)
+        delta_mass: Change in cell mass, shape (ncells,) or (ncells, k)
+        stations: Station positions (x, y, depth), shape (nstations, 3)
+
+    Returns:
+        Gravity change in micro Gal, shape (nstations,) or (nstations, k)
+    """
+    if len(stations) == 0:
+        return np.zeros((0, *delta_mass.shape[1:]))
+    cell_x, cell_y, cell_z = np.ascontiguousarray(cell_positions.T)
+    blocks = _station_blocks(len(stations), len(cell_positions))
+    blockrows = max(block.stop - block.start for block in blocks)
+    dist2, tmp, dist_z = np.empty((3, blockrows, len(cell_positions)))
+
+    result = np.zeros((len(stations), *delta_mass.shape[1:]))
+    for block in blocks:
+        rows = block.stop - block.start
+        r2, t, dz = dist2[:rows], tmp[:rows], dist_z[:rows]
+        np.subtract(cell_x, stations[block, 0, np.newaxis], out=r2)
+        r2 *= r2
+        np.subtract(cell_y, stations[block, 1, np.newaxis], out=t)
+        t *= t
+        r2 += t
+        np.subtract(cell_z, stations[block, 2, np.newaxis], out=dz)
+        np.multiply(dz, dz, out=t)
+        r2 += t
+        np.sqrt(r2, out=t)
+        r2 *= t
+        dz /= r2
+        result[block] = dz @ delta_mass
+    return GRAV_CONSTANT * result
+
+
+def eval_geertsma(
+    cell_positions: np.ndarray,
+    delta_porv: np.ndarray,
+    stations: np.ndarray,
+    seabed: np.ndarray,
+    poisson_ratio: float,
+) -> np.ndarray:
+    """Subsidence from cell pore volume changes using the Geertsma model.
+
+    Each cell is treated as a nucleus of strain in a half space bounded by the
+    seabed. Stations are evaluated in blocks as in :func:`eval_gravity`.
+
+    Args:
+        cell_positions: Cell centres, shape (ncells, 3)
+        delta_porv: Pore volume reduction for each cell, shape (ncells,) or
+            (ncells, k)
+        stations: Station positions (x, y, depth), shape (nstations, 3)
+        seabed: Seabed depth at each station, shape (nstations,)
+        poisson_ratio: Poisson ratio used in the Geertsma model
+
+    Returns:
+        Subsidence in metres, shape (nstations,) or (nstations, k)
+    """
+    if len(stations) == 0:
+        return np.zeros((0, *delta_porv.shape[1:]))
+    cell_x, cell_y, cell_z = np.ascontiguousarray(cell_positions.T)
+    blocks = _station_blocks(len(stations), len(cell_positions))
+    blockrows = max(block.stop - block.start for block in blocks)
+    work = np.empty((5, blockrows, len(cell_positions)))
+
+    result = np.zeros((len(stations), *delta_porv.shape[1:]))
+    for block in blocks:
+        rows = block.stop - block.start
+        h2, t, s, dz1, dz2 = work[:, :rows]
+        depth = stations[block, 2, np.newaxis]
+
+        # Horizontal distance squared, and vertical distances to the cell and
+        # to its image above the seabed
+        np.subtract(cell_x, stations[block, 0, np.newaxis], out=h2)
+        h2 *= h2
+        np.subtract(cell_y, stations[block, 1, np.newaxis], out=t)
+        t *= t
+        h2 += t
+        np.subtract(cell_z, seabed[block, np.newaxis], out=dz1)
+        np.add(dz1, depth, out=dz2)
+        dz1 -= depth
+
+        # dz1 / dist1**3
+        np.multiply(dz1, dz1, out=t)
+        t += h2
+        np.sqrt(t, out=s)
+        t *= s
+        dz1 /= t
+
+        # (3 - 4 nu) dz2 / dist2**3 - 2 depth (dist2**2 - 3 dz2**2) / dist2**5
+        np.multiply(dz2, dz2, out=t)
+        h2 += t
+        np.sqrt(h2, out=s)
+        s *= h2
+        t *= -3
+        t += h2
+        t /= h2
+        t *= -2 * depth
+        dz2 *= 3 - 4 * poisson_ratio
+        dz2 += t
+        dz2 /= s
+        dz1 += dz2
+
+        result[block] = dz1 @ delta_porv
+    return result / (4 * np.pi)
+
+
+def _eval_tile(
+    kernel: Callable[..., np.ndarray],
+    cells_file: Path,
+    weights_file: Path,
+    stations: np.ndarray,
+    station_args: list[np.ndarray | float],
+) -> np.ndarray:
+    return kernel(
+        np.load(cells_file, mmap_mode="r"),
+        np.load(weights_file, mmap_mode="r"),
+        stations,
+        *station_args,
+    )
+
+
+def eval_tiled(
+    kernel: Callable[..., np.ndarray],
+    cell_positions: np.ndarray,
+    weights: np.ndarray,
+    stations: np.ndarray,
+    *station_args: np.ndarray | float,
+    workers: int = 1,
+) -> np.ndarray:
+    """Evaluate a kernel with the stations split in tiles over worker processes.
+
+    The cell positions and weights are shared with the workers through
+    memory mapped files, only the station tiles are sent to each worker.
+
+    Args:
+        kernel: Kernel function, :func:`eval_gravity` or :func:`eval_geertsma`
+        cell_positions: Cell centres, shape (ncells, 3)
+        weights: Per cell weights for the kernel
+        stations: Station positions (x, y, depth), shape (nstations, 3)
+        station_args: Further kernel arguments. Arrays are taken to have one
+            element per station and are split along with the stations.
+        workers: Number of worker processes, 0 for one per available CPU.
+
+    Returns:
+        Kernel result for all stations
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(stations) < 2:
+        return kernel(cell_positions, weights, stations, *station_args)
+
+    tiles = np.array_split(np.arange(len(stations)), min(workers, len(stations)))
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cells_file = Path(tmpdir) / "cells.npy"
+        weights_file = Path(tmpdir) / "weights.npy"
+        np.save(cells_file, cell_positions)
+        np.save(weights_file, weights)
+        with ProcessPoolExecutor(max_workers=len(tiles)) as executor:
+            results = executor.map(
+                _eval_tile,
+                repeat(kernel),
+                repeat(cells_file),
+                repeat(weights_file),
+                [stations[tile] for tile in tiles],
+                [
+                    [
+                        arg[tile] if isinstance(arg, np.ndarray) else arg
+                        for arg in station_args
+                    ]
+                    for tile in tiles
+                ],
+            )
+            return np.concatenate(list(results))
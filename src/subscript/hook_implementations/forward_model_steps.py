@@ -474,9 +474,11 @@ class GravSubsMaps(ForwardModelStepPlugin):
                 "<GRAVMAPS_CONFIG>",
                 "--outputdir",
                 "<OUTPUT_DIR>",
+                "--workers",
+                "<WORKERS>",
                 "<UNRST_FILE>",
             ],
-            default_mapping={"<OUTPUT_DIR>": "./"},
+            default_mapping={"<OUTPUT_DIR>": "./", "<WORKERS>": "1"},
         )
 
     @staticmethod
@@ -497,6 +499,8 @@ where ``ECLBASE`` is already defined in your ERT config, pointing to the flowsim
 basename relative to ``RUNPATH``, grav_subs_maps.yml is a YAML file defining
 the inputs and modelling parameters and ``OUTPUT_DIR`` is the path to the output folder.
 If not specified OUTPUT_DIR will be defaulted to "./".
+``WORKERS`` is the number of processes the map nodes are split between, defaulted
+to 1. Match it to the number of cores reserved for the realization.
 
 The directory to export maps to must exist.
 """,
@@ -517,12 +521,15 @@ class GravSubsPoints(ForwardModelStepPlugin):
                 "<PREFIX_GENDATA>",
                 "--extension_gendata",
                 "<EXTENSION_GENDATA>",
+                "--workers",
+                "<WORKERS>",
                 "<UNRST_FILE>",
             ],
             default_mapping={
                 "<OUTPUT_DIR>": "./",
                 "<PREFIX_GENDATA>": "",
                 "<EXTENSION_GENDATA>": ".txt",
+                "<WORKERS>": "1",
             },
         )
 
@@ -554,6 +561,8 @@ the output files of type GEN_DATA. The prefix can be used to separate datasets f
 different structures/fields within the dataset and is defaulted to an empty string,
 i.e. no prefix. The extension could include the report step number by defining e.g.
 "_10.txt", but is defaulted without it a report step number, to only ".txt"
+``WORKERS`` is the number of processes the stations are split between, defaulted
+to 1.
 
 The directory to export point files to must exist.
 """,
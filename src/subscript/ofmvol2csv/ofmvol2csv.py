@@ -2,6 +2,7 @@ import argparse
 import io
 import logging
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import pandas as pd
@@ -39,6 +40,19 @@ class CustomFormatter(
     """
 
 
+def jobs_type(value: str) -> int:
+    """Argparse type for the number of processes, which can not be negative"""
+    try:
+        jobs = int(value)
+    except ValueError as err:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}") from err
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(
+            f"must be 0 (all available CPUs) or a positive number, not {jobs}"
+        )
+    return jobs
+
+
 def get_parser() -> argparse.ArgumentParser:
     """Construct a parser for the command line utility ofmvol2csv and for
     its documentation"""
@@ -66,6 +80,16 @@ def get_parser() -> argparse.ArgumentParser:
             "to identify the source file for each row."
         ),
     )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=jobs_type,
+        default=1,
+        help=(
+            "Number of processes to use for parsing the vol files. "
+            "Use 0 to use all available CPUs."
+        ),
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -329,7 +353,10 @@ def process_volstr(volstr: str) -> pd.DataFrame:
 
 
 def ofmvol2csv_main(
-    volfiles: str | list[str], output: str, includefileorigin: bool = False
+    volfiles: str | list[str],
+    output: str,
+    includefileorigin: bool = False,
+    jobs: int = 1,
 ) -> None:
     """Convert a set of volfiles (or wildcard patterns) into one CSV file.
 
@@ -339,25 +366,40 @@ def ofmvol2csv_main(
         output: Filename to write to, in CSV format.
         includefileorigin: Whether to add a column with the originating
             volfile filename for each row of data.
+        jobs: Number of processes used for parsing the vol files. Set to
+            0 to use all available CPUs, 1 parses the files serially.
     """
+    if jobs < 0:
+        raise ValueError(f"jobs must be 0 or a positive number, not {jobs}")
     if isinstance(volfiles, str):
         volfiles = [volfiles]
 
     globbed = glob_patterns(volfiles)
     if set(globbed) != set(volfiles):
         logger.info("Wildcards expanded to: %s", globbed)
-    dframes = []
     if not globbed:
         logger.warning("Filename(s) %s not found", volfiles)
         return
-    for filename in globbed:
-        dframe = process_volfile(filename)
+
+    if jobs == 1 or len(globbed) == 1:
+        parsed = list(map(process_volfile, globbed))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs or None) as executor:
+            parsed = list(executor.map(process_volfile, globbed))
+
+    dframes = []
+    for filename, dframe in zip(globbed, parsed, strict=True):
+        if dframe.empty:
+            continue
         if includefileorigin:
             dframe["OFMVOLFILE"] = filename
-        if not dframe.empty:
-            dframes.append(dframe)
+        dframes.append(dframe)
     if dframes:
         alldata = pd.concat(dframes, sort=False).sort_index()
+        if includefileorigin:
+            alldata["OFMVOLFILE"] = pd.Categorical(
+                alldata["OFMVOLFILE"], categories=globbed
+            )
         alldata.to_csv(output)
         logger.info("Wrote %s rows to %s", len(alldata), output)
     else:
@@ -375,6 +417,7 @@ def main() -> None:
         args.volfiles,
         args.output,
         includefileorigin=args.includefileorigin,
+        jobs=args.jobs,
     )
 
 
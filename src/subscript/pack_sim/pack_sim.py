@@ -1,13 +1,20 @@
 import argparse
 import hashlib
+import json
 import logging
+import mmap
+import os
+import re
 import shlex
 import sys
+import threading
 import time
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from io import StringIO
 from pathlib import Path
-from shutil import copy
-from typing import TextIO
+from shutil import copy, copyfile, copyfileobj
+from typing import Any, TextIO
 
 from subscript import __version__, getLogger
 from subscript.eclcompress.eclcompress import file_is_binary
@@ -26,6 +33,30 @@ EOL_UNIX = r"\n"
 EOL_WINDOWS = r"\r\n"
 EOL_MAC = r"\r"
 
+INCLUDE_KEYWORDS = re.compile(r"INCLUDE|GDFILE|IMPORT", re.IGNORECASE)
+
+FMU_SECTIONS = {
+    "RUNSPEC": "runspec/",
+    "GRID": "grid/",
+    "EDIT": "edit/",
+    "PROPS": "props/",
+    "REGIONS": "regions/",
+    "SOLUTION": "solution/",
+    "SUMMARY": "summary/",
+    "SCHEDULE": "schedule/",
+    "OPTIMIZE": "optimize/",
+}
+
+# Lines after the first line where the first non-whitespace character is a
+# letter. Only these can have keywords that pack_sim acts on.
+KEYWORD_LINES = re.compile(rb"\n([\t\x0b-\r\x1c-\x20]*[A-Za-z][^\n]*)")
+
+# Chunk size in bytes when checking if a file is ASCII
+ASCII_CHUNK = 2**24
+
+# Name of the manifest written to the packing folder in dedup mode
+MANIFEST = "manifest.json"
+
 
 def _read_lines(filename: Path) -> list[str]:
     try:
@@ -201,6 +232,395 @@ def _replace_paths(text: str | Path, paths: dict[str, Path]) -> Path:
     return Path(text)
 
 
+def _has_keyword(line: str, fmu: bool) -> bool:
+    """Check if a line has a keyword that inspect_file acts on.
+
+    Args:
+        line: Line of text
+        fmu: flag for FMU directory layout
+
+    Returns:
+        True if inspect_file would do anything but copying the line.
+    """
+    line_strip = line.strip()
+    line_strip_no_comment = line_strip.split("--", maxsplit=1)[0].strip()
+    return bool(
+        INCLUDE_KEYWORDS.match(line)
+        or line_strip_no_comment == "RESTART"
+        or (fmu and line_strip_no_comment in FMU_SECTIONS)
+        or line_strip.startswith(("IMPFILE", "USEFLUX"))
+    )
+
+
+def _inspection_is_noop(filename: Path, fmu: bool) -> bool:
+    """Check if inspecting a file would return its contents unchanged.
+
+    This is the case for ASCII files with unix line endings, no include
+    statements and no other keywords that inspect_file acts on, when comments
+    are kept. The file is scanned as bytes, only lines starting with a letter
+    are looked at.
+
+    Args:
+        filename: Path to the file
+        fmu: flag for FMU directory layout
+
+    Returns:
+        True if the file can be copied instead of inspected.
+    """
+    if filename.stat().st_size == 0:
+        return True
+    with (
+        open(filename, "rb") as fhandle,
+        mmap.mmap(fhandle.fileno(), 0, access=mmap.ACCESS_READ) as data,
+    ):
+        # Line endings are normalized, and non-ASCII files are written as UTF-8:
+        if data.find(b"\r") >= 0 or data.find(rb"\r") >= 0:
+            return False
+        if not all(
+            data[start : start + ASCII_CHUNK].isascii()
+            for start in range(0, len(data), ASCII_CHUNK)
+        ):
+            return False
+        lines = [data[: data.find(b"\n") + 1 or len(data)]] + [
+            match.group(1) for match in KEYWORD_LINES.finditer(data)
+        ]
+    return not any(_has_keyword(line.decode("ascii"), fmu) for line in lines)
+
+
+def _sha256(filename: Path) -> str:
+    """SHA-256 hex digest of a file's contents"""
+    with open(filename, "rb") as fhandle:
+        return hashlib.file_digest(fhandle, "sha256").hexdigest()
+
+
+def _copy_file(source: Path, target: Path) -> None:
+    """Copy a file using copy_file_range where available.
+
+    This lets the kernel copy the data without passing it through user space,
+    or share the data blocks (reflink) on file systems supporting that.
+    """
+    if not hasattr(os, "copy_file_range"):
+        copyfile(source, target)
+        return
+    with open(source, "rb") as fsrc, open(target, "wb") as fdst:
+        remaining = os.fstat(fsrc.fileno()).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except OSError:
+            # Not supported for these files, typically across file systems
+            # on older kernels
+            fsrc.seek(0)
+            fdst.seek(0)
+            fdst.truncate()
+            copyfileobj(fsrc, fdst)
+
+
+class ContentStore:
+    """Content addressed storage of include files in the packing folder.
+
+    Include files with identical contents are stored once, later files with
+    the same contents are hard links to the first one. Files are hashed and
+    written in a thread pool while the DATA file is inspected.
+
+    A manifest with the source and SHA-256 hash of each packed file is written
+    to the packing folder. When packing to the same folder again, packed files
+    with unchanged contents are kept as they are, and source files with the
+    same size and modification time as in the manifest are not hashed again.
+    """
+
+    def __init__(self, packing_path: Path, workers: int = 1) -> None:
+        self.packing_path = packing_path
+        self.manifest_path = packing_path / MANIFEST
+        self.previous: dict[str, dict[str, Any]] = {}
+        if self.manifest_path.exists():
+            self.previous = json.loads(self.manifest_path.read_text(encoding="utf8"))
+        self.previous_sources = {
+            entry["source"]: entry
+            for entry in self.previous.values()
+            if "mtime_ns" in entry
+        }
+        # Manifest entries of the files packed in this run
+        self.packed: dict[str, Future[dict[str, Any]]] = {}
+        # Events set when the first file with a given hash has been written
+        self.blobs: dict[str, tuple[Path, threading.Event]] = {}
+        self.lock = threading.Lock()
+        self.executor = ThreadPoolExecutor(max_workers=workers or os.cpu_count() or 1)
+
+    def add_file(self, source: Path, target: Path, indent: str = "") -> Path:
+        """Pack a copy of a source file.
+
+        Args:
+            source: file to copy
+            target: path in the packing folder to copy to
+            indent: indent for output printing
+
+        Returns:
+            Path to the packed file. A timestamp is added to the filename if a
+            different file with the same name was packed already.
+        """
+        source = source.absolute()
+        claimed = self._claim(target, source, lambda: self._source_digest(source))
+        if claimed is not None:
+            self.packed[self._key(claimed)] = self.executor.submit(
+                self._store_file, source, claimed
+            )
+            return claimed
+        logger.info("%sIdentical file in packing folder, skipping %s", indent, target)
+        return target
+
+    def add_text(self, text: str, source: Path, target: Path, indent: str = "") -> Path:
+        """Pack an inspected include file.
+
+        Args:
+            text: the inspected contents of the source file
+            source: the include file that was inspected
+            target: path in the packing folder to write to
+            indent: indent for output printing
+
+        Returns:
+            Path to the packed file. A timestamp is added to the filename if a
+            different file with the same name was packed already.
+        """
+        source = source.absolute()
+        data = text.encode("utf8")
+        claimed = self._claim(target, source, lambda: hashlib.sha256(data).hexdigest())
+        if claimed is not None:
+            self.packed[self._key(claimed)] = self.executor.submit(
+                self._store_data, data, source, claimed
+            )
+            return claimed
+        logger.info("%sIdentical file in packing folder, skipping %s", indent, target)
+        return target
+
+    def close(self) -> None:
+        """Wait for all files to be written and write the manifest"""
+        self.executor.shutdown()
+        manifest = {key: future.result() for key, future in self.packed.items()}
+        self.manifest_path.write_text(
+            json.dumps(manifest, indent=2, sort_keys=True), encoding="utf8"
+        )
+        logger.info(
+            "Packed %d files with %d unique contents",
+            len(manifest),
+            len({entry["sha256"] for entry in manifest.values()}),
+        )
+
+    def _key(self, target: Path) -> str:
+        return target.relative_to(self.packing_path).as_posix()
+
+    def _claim(
+        self, target: Path, source: Path, digest: Callable[[], str]
+    ) -> Path | None:
+        """Decide where to pack a file.
+
+        Returns:
+            The path to write the file to, or None if a file with the same
+            contents is already packed at the target path.
+        """
+        key = self._key(target)
+        if key in self.packed:
+            packed = self.packed[key].result()
+            if packed["source"] == str(source) or packed["sha256"] == digest():
+                return None
+        elif target.exists():
+            previous = self.previous.get(key)
+            packed_digest = (
+                previous["sha256"] if previous is not None else _sha256(target)
+            )
+            new_digest = digest()
+            if packed_digest == new_digest:
+                written = threading.Event()
+                written.set()
+                with self.lock:
+                    self.blobs.setdefault(new_digest, (target, written))
+                entry = dict(previous or {}, source=str(source), sha256=new_digest)
+                if "mtime_ns" in entry:
+                    entry.update(self._stat(source))
+                done: Future[dict[str, Any]] = Future()
+                done.set_result(entry)
+                self.packed[key] = done
+                return None
+            if previous is not None and previous["source"] == str(source):
+                # The source file has changed since it was packed
+                return target
+        else:
+            return target
+
+        # Add timestamp to the filename to make it unique
+        tstamp = int(time.time())
+        logger.info("filename %s made unique with a timestamp (%s).", target, tstamp)
+        return Path(str(target) + str(tstamp))
+
+    @staticmethod
+    def _stat(source: Path) -> dict[str, int]:
+        stat = source.stat()
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def _source_digest(self, source: Path) -> str:
+        """Hash of a source file, reusing the manifest for unchanged files"""
+        previous = self.previous_sources.get(str(source))
+        if previous is not None and all(
+            previous[key] == value for key, value in self._stat(source).items()
+        ):
+            return previous["sha256"]
+        return _sha256(source)
+
+    def _register(self, digest: str, target: Path) -> tuple[Path, bool]:
+        """Register target as the stored copy for a hash, unless there is one.
+
+        Returns:
+            The stored copy, and whether it is the target.
+        """
+        with self.lock:
+            if digest in self.blobs:
+                blob, written = self.blobs[digest]
+                is_new = False
+            else:
+                blob, written = target, threading.Event()
+                self.blobs[digest] = (blob, written)
+                is_new = True
+        if is_new:
+            return blob, True
+        written.wait()
+        return blob, False
+
+    def _put(self, digest: str, target: Path, write: Callable[[Path], object]) -> None:
+        blob, is_new = self._register(digest, target)
+        try:
+            self._link_or_write(None if is_new else blob, target, write)
+        except OSError as orig_exc:
+            raise OSError(
+                f"Script stopped: Could not write to '{target}'. "
+                "Make sure you have write access for this file."
+            ) from orig_exc
+        finally:
+            if is_new:
+                self.blobs[digest][1].set()
+
+    @staticmethod
+    def _link_or_write(
+        blob: Path | None, target: Path, write: Callable[[Path], object]
+    ) -> None:
+        # Never write through an existing file, it can be a hard link
+        target.unlink(missing_ok=True)
+        if blob is not None:
+            try:
+                os.link(blob, target)
+                return
+            except OSError:
+                # Hard links not supported, make a copy
+                pass
+        write(target)
+
+    def _store_file(self, source: Path, target: Path) -> dict[str, Any]:
+        digest = self._source_digest(source)
+        self._put(digest, target, lambda path: _copy_file(source, path))
+        return {"source": str(source), "sha256": digest, **self._stat(source)}
+
+    def _store_data(self, data: bytes, source: Path, target: Path) -> dict[str, Any]:
+        digest = hashlib.sha256(data).hexdigest()
+        self._put(digest, target, lambda path: path.write_bytes(data))
+        return {"source": str(source), "sha256": digest}
+
+
+def _write_include(
+    include_filename: Path,
+    new_include: Path,
+    org_sim_loc: Path,
+    packing_path: Path,
+    eclipse_paths: dict[str, Path],
+    indent: str,
+    clear_comments: bool,
+    fmu: bool,
+    section: str,
+    store: ContentStore | None = None,
+) -> Path:
+    """Inspect an include file and write the result to the packing folder.
+
+    Include files that would not be changed by the inspection are copied
+    directly, without reading them line by line.
+
+    Args:
+        include_filename: include file to inspect
+        new_include: path to write the include file to
+        org_sim_loc: original simulation path
+        packing_path: path to pack simulation in
+        eclipse_paths: PATHS dictionary
+        indent: indent for output printing
+        clear_comments: comments or not.
+        fmu: flag for FMU directory layout
+        section: currently active Eclipse section.
+        store: content store to pack the file in, if deduplicating
+
+    Returns:
+        Path to the packed include file. A timestamp is added to the filename
+        if a different file with the same name was packed already.
+    """
+    file_text = None
+    if clear_comments or not _inspection_is_noop(include_filename, fmu):
+        file_text = inspect_file(
+            include_filename,
+            org_sim_loc,
+            packing_path,
+            eclipse_paths,
+            indent + "      ",
+            clear_comments,
+            section=section,
+            fmu=fmu,
+            store=store,
+        )
+    logger.info("%sFinished inspecting %s", indent, include_filename)
+
+    # Write the results of the inspect to the include folder
+    logger.info("%sWriting include file %s...", indent, new_include)
+
+    if store is not None:
+        if file_text is None:
+            return store.add_file(include_filename, new_include, indent)
+        return store.add_text(file_text, include_filename, new_include, indent)
+
+    # Check if file already exists
+    if new_include.exists():
+        # Calculate MD5 hashes for the files with equal file
+        # names to be able to compare the contents
+        md5a = _md5checksum(filepath=new_include)
+        if file_text is None:
+            md5b = _md5checksum(filepath=include_filename)
+        else:
+            md5b = _md5checksum(data=file_text)
+
+        if md5a == md5b:
+            # Files are equal, skip
+            logger.info(
+                "%sIdentical files in packing folder, skipping %s",
+                indent,
+                new_include,
+            )
+            return new_include
+
+        # Add timestamp to the filename to make it unique
+        tstamp = int(time.time())
+        new_include = Path(str(new_include) + str(tstamp))
+        logger.info("%sfilename made unique with a timestamp (%s).", indent, tstamp)
+
+    try:
+        if file_text is None:
+            copyfile(include_filename, new_include)
+        else:
+            new_include.write_text(file_text, encoding="utf8")
+    except OSError as orig_exc:
+        raise OSError(
+            f"Script stopped: Could not write to '{new_include}'. "
+            "Make sure you have write access for this file."
+        ) from orig_exc
+    logger.info("%sFinished writing include file %s", indent, new_include)
+    return new_include
+
+
 def inspect_file(
     filename: Path,
     org_sim_loc: Path,
@@ -210,6 +630,7 @@ def inspect_file(
     clear_comments: bool = False,
     fmu: bool = False,
     section: str = "",
+    store: ContentStore | None = None,
 ) -> str:
     """Method that inspects a file for includes and copies the
     results to include folder. This can be both the main DATA file
@@ -225,6 +646,7 @@ def inspect_file(
         clear_comments: comments or not.
         fmu: flag for FMU directory layout
         section: currently active Eclipse section.
+        store: content store to pack include files in, if deduplicating
 
     Returns:
         Modified text of inspected file.
@@ -232,23 +654,22 @@ def inspect_file(
     """
     filename = _expand_filename(filename, org_sim_loc)
 
-    # Modified text will be stored in new_data_file
-    new_data_file = ""
+    # Modified text will be collected in new_data_file, and joined at the end
+    new_data_file: list[str] = []
 
     lines = iter(_read_lines(filename))
     for line in lines:
-        line = _normalize_line_endings(line)
-        line_strip = line.strip()
-
-        # Remove comments if required
-        line_strip = _remove_comments(clear_comments, line_strip)
-        line_strip_no_comment = _remove_comments(True, line_strip).strip()
+        if "\\" in line:
+            # All the line endings to normalize contain a backslash
+            line = _normalize_line_endings(line)
         line = _remove_comments(clear_comments, line)
+        line_strip = line.strip()
+        line_strip_no_comment = line_strip.split("--", maxsplit=1)[0].strip()
 
-        if line.upper().startswith(("INCLUDE", "GDFILE", "IMPORT")):
+        if INCLUDE_KEYWORDS.match(line):
             # Include keyword found!
             logger.info("%s%s", indent, "FOUND INCLUDE FILE ==>")
-            new_data_file += line
+            new_data_file.append(line)
 
             # In the INCLUDE or GDFILE keyword, find the include path and
             # ignore comments, continuing iterating the same file handle
@@ -301,130 +722,51 @@ def inspect_file(
                                 indent,
                                 include_stripped,
                             )
-                            copy(include_filename, new_include)
+                            if store is not None:
+                                new_include = store.add_file(
+                                    include_filename, new_include, indent
+                                )
+                            else:
+                                copy(include_filename, new_include)
                         else:
-                            file_text = inspect_file(
-                                include_stripped,
+                            new_include = _write_include(
+                                include_filename,
+                                new_include,
                                 org_sim_loc,
                                 packing_path,
                                 eclipse_paths,
-                                indent + "      ",
+                                indent,
                                 clear_comments,
-                                section=section,
-                                fmu=fmu,
+                                fmu,
+                                section,
+                                store,
                             )
-                            logger.info(
-                                "%sFinished inspecting %s", indent, include_stripped
-                            )
-
-                            # Write the results of the inspect to the include folder
-                            logger.info(
-                                "%sWriting include file %s...", indent, new_include
-                            )
-
-                            # Check if file already exists
-                            if new_include.exists():
-                                # Calculate MD5 hashes for the files with equal file
-                                # names to be able to compare the contents
-                                md5a = _md5checksum(filepath=Path(new_include))
-                                md5b = _md5checksum(data=file_text)
-
-                                if md5a == md5b:
-                                    # Files are equal, skip
-                                    logger.info(
-                                        "%sIdentical files in packing folder, "
-                                        "skipping %s",
-                                        indent,
-                                        new_include,
-                                    )
-
-                                else:
-                                    # Add timestamp to the filename to make it unique
-                                    tstamp = int(time.time())
-                                    new_include = Path(str(new_include) + str(tstamp))
-
-                                    try:
-                                        Path(new_include).write_text(
-                                            file_text, encoding="utf8"
-                                        )
-                                        logger.info(
-                                            "%sfilename made unique "
-                                            "with a timestamp (%s).",
-                                            indent,
-                                            tstamp,
-                                        )
-                                        logger.info(
-                                            "%sFinished writing include file %s",
-                                            indent,
-                                            new_include,
-                                        )
-                                    except OSError as orig_exc:
-                                        raise OSError(
-                                            "Script stopped: Could not write to "
-                                            f"'{new_include}'. "
-                                            "Make sure you have write access for "
-                                            "this file."
-                                        ) from orig_exc
-                            else:
-                                Path(new_include).write_text(file_text, encoding="utf8")
-                                logger.info(
-                                    "%sFinished writing include file %s",
-                                    indent,
-                                    new_include,
-                                )
                         fmu_include = "../" if fmu else ""
 
                         # Change the include path in the current file being inspected
                         if "'" in include_full or '"' in include_full:
-                            new_data_file += include_line.replace(
-                                str(include_stripped_in_file),
-                                f"{fmu_include}include/{section}{new_include.name}",
+                            new_data_file.append(
+                                include_line.replace(
+                                    str(include_stripped_in_file),
+                                    f"{fmu_include}include/{section}{new_include.name}",
+                                )
                             )
                         else:
-                            new_data_file += include_line.replace(
-                                str(include_stripped_in_file),
-                                f"'{fmu_include}include/{section}{new_include.name}'",
+                            new_data_file.append(
+                                include_line.replace(
+                                    str(include_stripped_in_file),
+                                    f"'{fmu_include}include/{section}"
+                                    f"{new_include.name}'",
+                                )
                             )
 
                         # Ignore comments after the include statement
                         break
-                    new_data_file += include_line
-        elif line_strip_no_comment == "RUNSPEC" and fmu:
-            section = "runspec/"
-            (packing_path / "include" / section).mkdir(exist_ok=True)
-            new_data_file += line
-        elif line_strip_no_comment == "GRID" and fmu:
-            section = "grid/"
-            (packing_path / "include" / section).mkdir(exist_ok=True)
-            new_data_file += line
-        elif line_strip_no_comment == "EDIT" and fmu:
-            section = "edit/"
-            (packing_path / "include" / section).mkdir(exist_ok=True)
-            new_data_file += line
-        elif line_strip_no_comment == "PROPS" and fmu:
-            section = "props/"
-            (packing_path / "include" / section).mkdir(exist_ok=True)
-            new_data_file += line
-        elif line_strip_no_comment == "REGIONS" and fmu:
-            section = "regions/"
-            (packing_path / "include" / section).mkdir(exist_ok=True)
-            new_data_file += line
-        elif line_strip_no_comment == "SOLUTION" and fmu:
-            section = "solution/"
-            (packing_path / "include" / section).mkdir(exist_ok=True)
-            new_data_file += line
-        elif line_strip_no_comment == "SUMMARY" and fmu:
-            section = "summary/"
-            (packing_path / "include" / section).mkdir(exist_ok=True)
-            new_data_file += line
-        elif line_strip_no_comment == "SCHEDULE" and fmu:
-            section = "schedule/"
+                    new_data_file.append(include_line)
+        elif fmu and line_strip_no_comment in FMU_SECTIONS:
+            section = FMU_SECTIONS[line_strip_no_comment]
             (packing_path / "include" / section).mkdir(exist_ok=True)
-            new_data_file += line
-        elif line_strip_no_comment == "OPTIMIZE" and fmu:
-            section = "optimize/"
-            (packing_path / "include" / section).mkdir(exist_ok=True)
-            new_data_file += line
+            new_data_file.append(line)
         elif line_strip_no_comment == "RESTART":
             # This line defines a restart: raise a warning!
             print(
@@ -448,7 +790,7 @@ def inspect_file(
             print(
                 "**********************************************************************"
             )
-            new_data_file += line
+            new_data_file.append(line)
         elif line_strip.startswith("IMPFILE"):
             # This line defines a restart: raise a warning!
             print(
@@ -469,7 +811,7 @@ def inspect_file(
             print(
                 "**********************************************************************"
             )
-            new_data_file += line
+            new_data_file.append(line)
         elif line_strip.startswith("USEFLUX"):
             # This line defines a restart: raise a warning!
             print(
@@ -490,17 +832,22 @@ def inspect_file(
             print(
                 "**********************************************************************"
             )
-            new_data_file += line
-        elif not (clear_comments and len(line.strip()) == 0):
+            new_data_file.append(line)
+        elif not (clear_comments and len(line_strip) == 0):
             # This line represents anything else: just copy the info.
-            new_data_file += line
+            new_data_file.append(line)
 
     # Return modified text of inspected file
-    return new_data_file
+    return "".join(new_data_file)
 
 
 def pack_simulation(
-    ecl_case: Path, packing_path: Path, clear_comments: bool, fmu: bool
+    ecl_case: Path,
+    packing_path: Path,
+    clear_comments: bool,
+    fmu: bool,
+    dedup: bool = False,
+    workers: int = 1,
 ) -> None:
     """Method that will pack an Eclipse simulation DATA file.
 
@@ -509,6 +856,10 @@ def pack_simulation(
         packing_path: Path to packing location (directory)
         clear_comments: clear or not to clear comments
         fmu: use fmu packing style or not
+        dedup: store include files with identical contents once, and
+            keep unchanged files when packing to the same folder again
+        workers: number of threads hashing and writing include files when
+            deduplicating, 0 for one per available CPU
 
     """
     if not ecl_case or not ecl_case.name:
@@ -542,10 +893,28 @@ def pack_simulation(
     # Get paths from Eclipse PATHS keyword
     eclipse_paths = _get_paths(ecl_case, org_sim_loc)
 
+    store = None
+    repack = False
+    if dedup:
+        logger.info("You requested deduplication of include files.")
+        repack = (packing_path / MANIFEST).exists()
+        store = ContentStore(packing_path, workers)
+
     # Inspect the DATA file, return a modified DATA file
-    data_file = inspect_file(
-        ecl_case, org_sim_loc, packing_path, eclipse_paths, "", clear_comments, fmu=fmu
-    )
+    try:
+        data_file = inspect_file(
+            ecl_case,
+            org_sim_loc,
+            packing_path,
+            eclipse_paths,
+            "",
+            clear_comments,
+            fmu=fmu,
+            store=store,
+        )
+    finally:
+        if store is not None:
+            store.close()
     if not data_file:
         raise ValueError("Script stopped: no text was found in the DATA deck.")
 
@@ -556,8 +925,9 @@ def pack_simulation(
     else:
         path_new_data_file = packing_path / data_file_name
 
-    # Write out DATA file if not already exists
-    if path_new_data_file.exists():
+    # Write out DATA file if not already exists, or if the packing folder
+    # is being updated
+    if path_new_data_file.exists() and not repack:
         raise ValueError(
             f"DATA file {path_new_data_file!s} exists already, will not overwrite."
         )
@@ -605,6 +975,24 @@ def get_parser() -> argparse.ArgumentParser:
         "Eclipse model in standard fmu file structure (model/ and include/grid, "
         "include/props, etc folders)",
     )
+    parser.add_argument(
+        "--dedup",
+        action="store_true",
+        help=(
+            "Store include files with identical contents only once, as hard links, "
+            f"and write a {MANIFEST} with the hash of each packed file. Packing "
+            "to the same folder again then only writes changed files."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help=(
+            "Number of threads hashing and writing include files with --dedup. "
+            "Use 0 for one thread per available CPU."
+        ),
+        default=1,
+    )
     parser.add_argument(
         "--version",
         action="version",
@@ -619,7 +1007,12 @@ def main() -> None:
     args = parser.parse_args()
     logger.setLevel(logging.INFO)
     pack_simulation(
-        Path(args.ECLIPSE_CASE), Path(args.PACKING_PATH), args.clearcomments, args.fmu
+        Path(args.ECLIPSE_CASE),
+        Path(args.PACKING_PATH),
+        args.clearcomments,
+        args.fmu,
+        args.dedup,
+        args.workers,
     )
 
 
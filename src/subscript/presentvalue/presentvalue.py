@@ -2,13 +2,14 @@
 
 import argparse
 import datetime
+import itertools
 import logging
+import sys
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 import res2df
-import scipy.optimize
 
 from subscript import __version__, getLogger
 
@@ -21,6 +22,10 @@ BARRELSPRCUBIC = 6.28981077
 
 NOKUNIT = 1000000.0  # all NOK figures are scaled by this value (input and output)
 
+RELATIVEGASPRICE = 9.3 * 3.79127 / 100 / 100  # MNOK/GSm3 pr. USD/bbl oilprice
+
+SCENARIO_PARAMETERS = ["oilprice", "gasprice", "usdtonok", "discountrate", "econtable"]
+
 
 def get_parser() -> argparse.ArgumentParser:
     """Parser for command line arguments and for documentation.
@@ -101,6 +106,33 @@ def get_parser() -> argparse.ArgumentParser:
             "gasprice (NOK/sm3), usdtonok, costs (MNOK)"
         ),
     )
+    parser.add_argument(
+        "--output",
+        type=str,
+        help=(
+            "CSV file for a table with the results for each DATA file. "
+            "Several DATA files are computed together as an ensemble."
+        ),
+    )
+    parser.add_argument(
+        "--scenarios",
+        type=str,
+        help=(
+            "CSV file with one economical scenario pr. row, to be evaluated for "
+            "every DATA file. Supported column names: SCENARIO, "
+            + ", ".join(SCENARIO_PARAMETERS)
+            + ". Missing values are taken from the command line."
+        ),
+    )
+    parser.add_argument(
+        "--sweep",
+        nargs="+",
+        metavar="PARAMETER=VALUES",
+        help=(
+            "Evaluate every combination of comma separated values for the "
+            "given economical parameters, e.g. oilprice=50,60,70 discountrate=6,8"
+        ),
+    )
     parser.add_argument(
         "--basedatafiles",
         nargs="+",
@@ -152,27 +184,84 @@ def main() -> None:
         )
         raise ValueError(msg)
 
-    for idx, datafile in enumerate(args.datafiles):
-        if args.basedatafiles:
-            if len(args.basedatafiles) > 1:
-                basedatafile = args.basedatafiles[idx]
-            else:
-                basedatafile = args.basedatafiles[0]
-        else:
-            basedatafile = None
+    basedatafiles: list[str | None]
+    if args.basedatafiles and len(args.basedatafiles) > 1:
+        basedatafiles = list(args.basedatafiles)
+    else:
+        basedatafiles = [args.basedatafiles[0] if args.basedatafiles else None] * len(
+            args.datafiles
+        )
 
-        results = presentvalue_main(
-            datafile=datafile,
+    if args.scenarios or args.sweep:
+        if args.writetoparams:
+            sys.exit("Scenarios can not be written to parameters.txt, use --output")
+        results_df = presentvalue_scenarios(
+            {
+                datafile: get_delta_summary(
+                    datafile,
+                    basedatafile,
+                    args.oilvector,
+                    args.gasvector,
+                    args.gasinjvector,
+                )
+                for datafile, basedatafile in zip(
+                    args.datafiles, basedatafiles, strict=True
+                )
+            },
+            prepare_scenarios(
+                args.scenarios,
+                args.sweep,
+                econtable=args.econtable,
+                oilprice=args.oilprice,
+                gasprice=args.gasprice,
+                usdtonok=args.usdtonok,
+                discountrate=args.discountrate,
+            ),
+            discountto=args.discountto,
+            cutoffyear=args.cutoffyear,
+        )
+        if args.output:
+            logger.info("Writing scenario results to %s", args.output)
+            results_df.to_csv(args.output, index=False)
+        else:
+            print(results_df.to_string(index=False))
+        return
+
+    if len(args.datafiles) > 1 or args.output:
+        # Compute all realizations together:
+        all_results = presentvalue_ensemble(
+            [
+                get_delta_summary(
+                    datafile,
+                    basedatafile,
+                    args.oilvector,
+                    args.gasvector,
+                    args.gasinjvector,
+                )
+                for datafile, basedatafile in zip(
+                    args.datafiles, basedatafiles, strict=True
+                )
+            ],
             economics=econ_df,
-            discountrate=args.discountrate,
             discountto=args.discountto,
-            oilvector=args.oilvector,
-            gasvector=args.gasvector,
-            gasinjvector=args.gasinjvector,
             cutoffyear=args.cutoffyear,
-            basedatafile=basedatafile,
         )
+    else:
+        all_results = [
+            presentvalue_main(
+                datafile=args.datafiles[0],
+                economics=econ_df,
+                discountrate=args.discountrate,
+                discountto=args.discountto,
+                oilvector=args.oilvector,
+                gasvector=args.gasvector,
+                gasinjvector=args.gasinjvector,
+                cutoffyear=args.cutoffyear,
+                basedatafile=basedatafiles[0],
+            )
+        ]
 
+    for datafile, results in zip(args.datafiles, all_results, strict=True):
         logger.info(str(results))
 
         paramfile = get_paramfilename(datafile)
@@ -180,10 +269,16 @@ def main() -> None:
             logger.info("Writing results to %s", paramfile)
             with open(paramfile, "a", encoding="utf8") as f_handle:
                 f_handle.write(dict_to_parameterstxt(results, args.paramname))
-        elif not args.verbose:
+        elif not args.verbose and not args.output:
             # Ensure user gets a response
             print(str(results))
 
+    if args.output:
+        logger.info("Writing results table to %s", args.output)
+        results_df = pd.DataFrame(all_results)
+        results_df.insert(0, "DATAFILE", args.datafiles)
+        results_df.to_csv(args.output, index=False)
+
 
 def dict_to_parameterstxt(results: dict[str, float], paramname: str) -> str:
     """Produce a key-value string with newlines from a dict of results
@@ -261,12 +356,9 @@ def presentvalue_main(
 
     logger.info("Economics:\n%s", economics)
 
-    summary_df = get_yearly_summary(datafile, oilvector, gasvector, gasinjvector)
-
-    if basedatafile:
-        summary_df -= get_yearly_summary(
-            basedatafile, oilvector, gasvector, gasinjvector
-        )
+    summary_df = get_delta_summary(
+        datafile, basedatafile, oilvector, gasvector, gasinjvector
+    )
     if max(summary_df.index) < discountto:
         logger.warning("All production is in the past. This gives zero value")
         return {"PresentValue": 0}
@@ -298,44 +390,415 @@ def calculate_financials(pv_df: pd.DataFrame, cutoffyear: int) -> dict[str, floa
     if not pv_df["costs"].abs().sum() > 0:
         return {}
 
-    finance = {}
-    try:
-        if pv_df["OPR"].abs().sum() > 0.0:
-            finance["BEP1"] = scipy.optimize.newton(
-                calc_pv_bep_relativegas, 50, args=(pv_df, cutoffyear), maxiter=50
+    if not pv_df["OPR"].abs().sum() > 0.0:
+        logger.warning("BEP1 and BEP2 are meaningless without oil production")
+    if len(pv_df) < 2:
+        logger.warning("IRR meaningless on dataset with only one year")
+
+    finance = calc_financials_arrays(
+        {
+            "years": pv_df.index.to_numpy(),
+            "OPR": pv_df["OPR"].to_numpy(dtype=float)[np.newaxis, :],
+            "GSR": pv_df["GSR"].to_numpy(dtype=float)[np.newaxis, :],
+            "valid": np.ones((1, len(pv_df)), dtype=bool),
+            "oilprice": pv_df["oilprice"].to_numpy(dtype=float),
+            "gasprice": pv_df["gasprice"].to_numpy(dtype=float),
+            "usdtonok": pv_df["usdtonok"].to_numpy(dtype=float),
+            "costs": pv_df["costs"].to_numpy(dtype=float) * NOKUNIT,
+            "discountfactors": pv_df["discountfactors"].to_numpy(dtype=float),
+        },
+        cutoffyear,
+    )
+    if len(pv_df) > 1 and np.isnan(finance["IRR"][0]):
+        logger.warning("IRR computation failed")
+    if "presentvalue" not in pv_df.columns:
+        del finance["CEI"]
+    return {
+        key: float(values[0])
+        for key, values in finance.items()
+        if np.isfinite(values[0])
+    }
+
+
+def presentvalue_ensemble(
+    summaries: list[pd.DataFrame],
+    economics: pd.DataFrame,
+    discountto: int = datetime.datetime.now().year,
+    cutoffyear: int = 2100,
+) -> list[dict[str, float]]:
+    """Calculate presentvalue and financial parameters for an ensemble of
+    Eclipse runs in one go.
+
+    Yearly production from all realizations is stacked into arrays with one
+    row pr. realization, and presentvalues, break-even prices and internal
+    rate of return are computed for all realizations at once. Results are
+    the same as from presentvalue_main() for each realization.
+
+    Args:
+        summaries: Yearly summaries, one pr. realization, as returned
+            by get_yearly_summary()
+        economics: Year-indexed data with economic parameters
+        discountto: Which year to discount to, defaults to current year
+        cutoffyear: Production/costs beyond this year will be dropped
+
+    Returns:
+        List with one dictionary pr. realization, with the same keys as
+        returned from presentvalue_main().
+    """
+    logger.info("Cutoff year: %s", cutoffyear)
+    logger.info("Discount to year: %s", discountto)
+
+    logger.info("Economics:\n%s", economics)
+
+    ens = ensemble_arrays(summaries, economics, discountto)
+    past = ens["lastyear"] < discountto
+    if past.any():
+        logger.warning(
+            "All production is in the past for %s realizations. This gives zero value",
+            past.sum(),
+        )
+    years = ens["years"]
+    incut = years < cutoffyear
+    discountfactors = ens["discountfactors"] * incut
+
+    oilincome = ens["OPR"] * BARRELSPRCUBIC * ens["usdtonok"]
+    cashflow = oilincome * ens["oilprice"] + ens["GSR"] * ens["gasprice"] - ens["costs"]
+    presentvalues = cashflow * discountfactors
+    pvalues = presentvalues.sum(axis=1) / NOKUNIT
+
+    if logger.isEnabledFor(logging.INFO):
+        pd.set_option("expand_frame_repr", False)
+        for real, valid in enumerate(ens["valid"] & incut):
+            logger.info(
+                "Production and present value for realization %s:\n%s",
+                real,
+                pd.DataFrame(
+                    {
+                        "OPR": ens["OPR"][real],
+                        "GSR": ens["GSR"][real],
+                        "discountfactors": ens["discountfactors"],
+                        "presentvalue": presentvalues[real],
+                    },
+                    index=pd.Index(years, name="year"),
+                )[valid],
             )
-        else:
-            logger.warning("BEP1 is meaningless without oil production")
-    except ImportError:
-        logger.warning("BEP1 computation failed")
-    try:
-        if pv_df["OPR"].abs().sum() > 0.0:
-            finance["BEP2"] = scipy.optimize.newton(
-                calc_pv_bep_constantgas, 50, args=(pv_df, cutoffyear), maxiter=50
+
+    finance: dict[str, np.ndarray] = {}
+    if np.abs(ens["costs"]).sum() > 0:
+        has_oil = np.abs(ens["OPR"]).sum(axis=1) > 0
+        if not (has_oil | past).all():
+            logger.warning(
+                "BEP1 and BEP2 are meaningless without oil production, "
+                "%s realizations have none",
+                (~has_oil & ~past).sum(),
             )
-        else:
-            logger.warning("BEP2 is meaningless without oil production")
-    except ImportError:
-        logger.warning("BEP2 computation failed")
-    try:
-        if len(pv_df) < 2:
+        single_year = ens["valid"].sum(axis=1) < 2
+        if (single_year & ~past).any():
             logger.warning("IRR meaningless on dataset with only one year")
-        else:
-            finance["IRR"] = scipy.optimize.newton(
-                calc_pv_irr, 10, args=(pv_df, cutoffyear), maxiter=50
+
+        finance = calc_financials_arrays(ens, cutoffyear)
+        if np.isnan(finance["IRR"][~single_year & ~past]).any():
+            logger.warning("IRR computation failed")
+
+    results: list[dict[str, float]] = []
+    for real, pvalue in enumerate(pvalues):
+        if past[real]:
+            results.append({"PresentValue": 0})
+            continue
+        results.append(
+            {"PresentValue": float(pvalue)}
+            | {
+                key: float(values[real])
+                for key, values in finance.items()
+                if np.isfinite(values[real])
+            }
+        )
+    return results
+
+
+def prepare_scenarios(
+    filename: str | None = None,
+    sweep: list[str] | None = None,
+    **defaults: str | float | None,
+) -> pd.DataFrame:
+    """Make a table of economical scenarios, from a CSV file and/or
+    a grid of parameter values.
+
+    When both are given, every row in the CSV file is combined with every
+    point in the grid, and the scenario names from the CSV file get the
+    number of the grid point appended. Parameters given in the scenarios
+    can not also be columns in the economical tables used.
+
+    Args:
+        filename: Path to CSV file with one scenario pr. row.
+        sweep: List of strings like "oilprice=50,60,70", every combination
+            of the values will be a scenario.
+        defaults: Values for parameters not included in the scenarios.
+
+    Returns:
+        pd.DataFrame: One row pr. scenario, with a SCENARIO column and one
+        column for each of SCENARIO_PARAMETERS.
+    """
+    if filename:
+        scenarios = pd.read_csv(filename)
+        scenarios.columns = scenarios.columns.map(str.strip)
+    else:
+        scenarios = pd.DataFrame(index=[0])
+    unknown = set(scenarios.columns) - {"SCENARIO", *SCENARIO_PARAMETERS}
+    if unknown:
+        raise ValueError(f"Unknown columns in scenario input: {unknown}")
+    given = set(scenarios.columns)
+
+    grid: dict[str, list[str | float]] = {}
+    for parameter_values in sweep or []:
+        parameter, _, values = parameter_values.partition("=")
+        parameter = parameter.strip()
+        if parameter not in SCENARIO_PARAMETERS or not values:
+            raise ValueError(f"Unsupported sweep: {parameter_values}")
+        grid[parameter] = [
+            value.strip() if parameter == "econtable" else float(value)
+            for value in values.split(",")
+        ]
+        given.add(parameter)
+    if grid:
+        gridpoints = pd.DataFrame(
+            list(itertools.product(*grid.values())), columns=list(grid)
+        )
+        scenarios = scenarios.drop(columns=list(grid), errors="ignore").merge(
+            gridpoints.rename_axis("GRIDPOINT").reset_index(), how="cross"
+        )
+        if "SCENARIO" in scenarios:
+            scenarios["SCENARIO"] = (
+                scenarios["SCENARIO"].astype(str)
+                + "_"
+                + scenarios["GRIDPOINT"].astype(str)
             )
-    except RuntimeError:
-        logger.warning("IRR computation failed")
 
-    if "presentvalue" in pv_df.columns:
-        pvalue = pv_df.loc[: cutoffyear - 1]["presentvalue"].sum() / NOKUNIT
-        pv_negativecashflow = abs(
-            pv_df.loc[: cutoffyear - 1]["presentvalue"][pv_df["presentvalue"] < 0].sum()
-            / NOKUNIT
+    for parameter in SCENARIO_PARAMETERS:
+        default = defaults.get(parameter)
+        if parameter not in scenarios:
+            scenarios[parameter] = default
+        elif default is not None:
+            scenarios[parameter] = scenarios[parameter].fillna(default)
+
+    # prepare_econ_table() only uses parameter values for columns missing
+    # in the economical table:
+    for econtable in scenarios["econtable"].dropna().unique():
+        econ_columns = pd.read_csv(econtable, index_col=0, nrows=0).columns
+        conflicts = given & set(econ_columns.map(str.strip))
+        if conflicts:
+            raise ValueError(
+                f"Scenario parameters {sorted(conflicts)} are also columns "
+                f"in the economical table {econtable}"
+            )
+    if "SCENARIO" not in scenarios:
+        scenarios["SCENARIO"] = range(len(scenarios))
+    return scenarios[["SCENARIO", *SCENARIO_PARAMETERS]]
+
+
+def presentvalue_scenarios(
+    summaries: dict[str, pd.DataFrame],
+    scenarios: pd.DataFrame,
+    discountto: int = datetime.datetime.now().year,
+    cutoffyear: int = 2100,
+) -> pd.DataFrame:
+    """Calculate presentvalue and financial parameters for every
+    combination of realization and economical scenario.
+
+    Production is only loaded once. The scenarios are evaluated one at a
+    time, as each can have its own economical table and thereby its own
+    years and costs, while all realizations are evaluated at once with
+    presentvalue_ensemble() for each scenario.
+
+    Args:
+        summaries: Yearly summaries, as returned by get_yearly_summary(),
+            with the DATA file for each as key.
+        scenarios: Economical scenarios, as returned from prepare_scenarios()
+        discountto: Which year to discount to, defaults to current year
+        cutoffyear: Production/costs beyond this year will be dropped
+
+    Returns:
+        pd.DataFrame: One row pr. scenario and DATA file, with the scenario
+        parameters and the results from presentvalue_ensemble().
+    """
+    results = []
+    for scenario in scenarios.to_dict(orient="records"):
+        logger.info("Scenario: %s", scenario)
+        econ_df = prepare_econ_table(
+            scenario["econtable"] if pd.notna(scenario["econtable"]) else None,
+            oilprice=scenario["oilprice"],
+            gasprice=scenario["gasprice"],
+            usdtonok=scenario["usdtonok"],
+            discountrate=scenario["discountrate"],
+        )
+        scenario_df = pd.DataFrame(
+            presentvalue_ensemble(
+                list(summaries.values()),
+                econ_df,
+                discountto=discountto,
+                cutoffyear=cutoffyear,
+            )
+        )
+        scenario_df.insert(0, "DATAFILE", list(summaries))
+        for position, (parameter, value) in enumerate(scenario.items()):
+            scenario_df.insert(position, parameter, value)
+        results.append(scenario_df)
+    return pd.concat(results, ignore_index=True)
+
+
+def calc_financials_arrays(
+    ens: dict[str, np.ndarray], cutoffyear: int
+) -> dict[str, np.ndarray]:
+    """Calculate break-even prices, internal rate of return and capital
+    efficiency index for one or more realizations.
+
+    The presentvalue is linear in the oil price, so the break-even prices
+    are computed directly. The internal rate of return is found with a
+    Newton iteration using the analytical derivative, for all realizations
+    at once.
+
+    Args:
+        ens: Production and economical data, as returned from
+            ensemble_arrays()
+        cutoffyear: Production/costs beyond this year is ignored
+
+    Returns:
+        Dictionary with BEP1, BEP2, IRR and CEI, each an array with one
+        value pr. realization. Values that can not be computed are NaN.
+    """
+    discountfactors = ens["discountfactors"] * (ens["years"] < cutoffyear) / NOKUNIT
+    oilincome = ens["OPR"] * BARRELSPRCUBIC * ens["usdtonok"]
+    gasincome = ens["GSR"] * ens["gasprice"]
+    cashflow = oilincome * ens["oilprice"] + gasincome - ens["costs"]
+    costs = ens["costs"] @ discountfactors
+    has_oil = np.abs(ens["OPR"]).sum(axis=1) > 0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        bep1 = costs / (
+            (oilincome + ens["GSR"] * RELATIVEGASPRICE * ens["usdtonok"])
+            @ discountfactors
+        )
+        bep2 = (costs - gasincome @ discountfactors) / (oilincome @ discountfactors)
+
+    presentvalues = cashflow * discountfactors
+    negativecashflow = np.abs(np.minimum(presentvalues, 0).sum(axis=1))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cei = np.where(
+            negativecashflow > 0, presentvalues.sum(axis=1) / negativecashflow, np.nan
         )
-        if pv_negativecashflow > 0:
-            finance["CEI"] = pvalue / pv_negativecashflow
-    return finance
+
+    return {
+        "BEP1": np.where(has_oil & np.isfinite(bep1), bep1, np.nan),
+        "BEP2": np.where(has_oil & np.isfinite(bep2), bep2, np.nan),
+        "IRR": calc_irr(
+            cashflow * (ens["years"] < cutoffyear) / NOKUNIT,
+            # Each realization is discounted from its own first year:
+            np.maximum(np.cumsum(ens["valid"], axis=1) - 1, 0),
+            ens["valid"].sum(axis=1) > 1,
+        ),
+        "CEI": cei,
+    }
+
+
+def calc_irr(
+    cashflow: np.ndarray, exponents: np.ndarray, solvable: np.ndarray
+) -> np.ndarray:
+    """Calculate internal rate of return for several cash flows at once
+
+    Args:
+        cashflow: Yearly cash flow, one row pr. realization
+        exponents: Number of years to discount each cash flow
+        solvable: Which realizations to compute for
+
+    Returns:
+        The rate in percent giving zero presentvalue for each realization,
+        NaN where no rate is found.
+    """
+    rate = np.full(len(cashflow), 10.0)
+    rate[~solvable] = np.nan
+    converged = ~solvable
+    with np.errstate(all="ignore"):
+        for _ in range(50):
+            factors = (1.0 + rate[:, np.newaxis] / 100.0) ** -exponents
+            presentvalue = (cashflow * factors).sum(axis=1)
+            derivative = -(
+                exponents * cashflow * factors / (100.0 + rate[:, np.newaxis])
+            ).sum(axis=1)
+            step = np.where(converged, 0, presentvalue / derivative)
+            rate -= step
+            converged |= np.abs(step) < 1.48e-8
+            if converged.all():
+                break
+    # Rates at or below -100% have no meaning as a discount rate:
+    return np.where(converged & (rate > -100), rate, np.nan)
+
+
+def ensemble_arrays(
+    summaries: list[pd.DataFrame], economics: pd.DataFrame, discountto: int
+) -> dict[str, np.ndarray]:
+    """Stack yearly summaries for several realizations into arrays
+    on a common set of years, together with the economical data.
+
+    The years are all years in the summaries and in the economics
+    table from the year we are discount to. Prices are forward (and
+    backward) filled from the economics table like in
+    calc_presentvalue_df(), while production and costs are zero-padded.
+
+    Args:
+        summaries: Yearly summaries with OPR and GSR, indexed by year
+        economics: Year-indexed data with economic parameters
+        discountto: Which year to discount to.
+
+    Returns:
+        Dictionary with "OPR", "GSR" and "valid" as arrays with one row pr.
+        realization and one column pr. year, and "years", "oilprice",
+        "gasprice", "usdtonok", "costs" (in NOK) and "discountfactors" as
+        arrays with one value pr. year. "lastyear" has the last year of each
+        summary. "valid" tells which years a realization would include in
+        calc_presentvalue_df().
+    """
+    allyears = economics.index.union(
+        pd.Index(np.unique(np.concatenate([summary.index for summary in summaries])))
+    )
+    prices = (
+        economics[["oilprice", "gasprice", "usdtonok", "discountrate"]]
+        .reindex(allyears)
+        .ffill()
+        .bfill()
+    )
+    years_index = allyears[(allyears != 1900) & (allyears >= discountto)]
+    years = years_index.to_numpy(dtype=int)
+    prices = prices.loc[years_index]
+
+    opr = np.zeros((len(summaries), len(years)))
+    gsr = np.zeros((len(summaries), len(years)))
+    valid = np.zeros((len(summaries), len(years)), dtype=bool)
+    valid[:, years_index.isin(economics.index)] = True
+    lastyear = np.zeros(len(summaries), dtype=int)
+    for real, summary in enumerate(summaries):
+        lastyear[real] = summary.index.max()
+        positions = years_index.get_indexer(summary.index)
+        inrange = positions >= 0
+        positions = positions[inrange]
+        valid[real, positions] = True
+        opr[real, positions] = np.nan_to_num(summary["OPR"].to_numpy()[inrange])
+        gsr[real, positions] = np.nan_to_num(summary["GSR"].to_numpy()[inrange])
+
+    return {
+        "years": years,
+        "OPR": opr,
+        "GSR": gsr,
+        "valid": valid,
+        "lastyear": lastyear,
+        "oilprice": prices["oilprice"].to_numpy(dtype=float),
+        "gasprice": prices["gasprice"].to_numpy(dtype=float),
+        "usdtonok": prices["usdtonok"].to_numpy(dtype=float),
+        "costs": economics["costs"].reindex(years_index).fillna(0).to_numpy(dtype=float)
+        * NOKUNIT,
+        "discountfactors": 1.0
+        / (1.0 + prices["discountrate"].to_numpy(dtype=float) / 100.0)
+        ** (years - discountto),
+    }
 
 
 def calc_presentvalue_df(
@@ -446,6 +909,34 @@ def get_yearly_summary(
     return sum_df.drop("DATE", axis="columns").set_index("YEAR").dropna()
 
 
+def get_delta_summary(
+    eclfile: str,
+    baseeclfile: str | None = None,
+    oilvector: str = "FOPT",
+    gasvector: str = "FGPT",
+    gasinjvector: str = "FGIT",
+) -> pd.DataFrame:
+    """Obtain a yearly summary from an Eclipse output file, with the
+    production from an optional reference case deducted.
+
+    Args:
+        eclfile: Path to Eclipse DATA file
+        baseeclfile: Path to Eclipse DATA file to use as reference
+        oilvector: Name of cumulative summary vector with oil production
+        gasvector: Name of cumulative summary vector with gas production
+        gasinjvector: Name of cumulative summary vector with gas injection
+
+    Returns:
+        pd.DataFrame, see get_yearly_summary()
+    """
+    summary_df = get_yearly_summary(eclfile, oilvector, gasvector, gasinjvector)
+    if baseeclfile:
+        summary_df -= get_yearly_summary(
+            baseeclfile, oilvector, gasvector, gasinjvector
+        )
+    return summary_df
+
+
 def prepare_econ_table(
     filename: str | None = None,
     oilprice: float | None = None,
@@ -514,9 +1005,7 @@ def calc_pv_irr(rate: float, pv_df: pd.DataFrame, cutoffyear: int) -> float:
     Returns:
         Computed presentvalue
     """
-    discountfactors_irr = 1.0 / (1.0 + rate / 100.0) ** np.array(
-        list(range(len(pv_df)))
-    )
+    discountfactors_irr = 1.0 / (1.0 + rate / 100.0) ** np.arange(len(pv_df))
     if len(pv_df) < 2:
         raise ValueError("IRR computation meaningless on a single year")
     pv_irr = (
@@ -527,60 +1016,5 @@ def calc_pv_irr(rate: float, pv_df: pd.DataFrame, cutoffyear: int) -> float:
     return pv_irr.loc[: cutoffyear - 1].sum() / NOKUNIT
 
 
-def calc_pv_bep_relativegas(
-    oilprice: float,
-    pv_df: pd.DataFrame,
-    cutoffyear: int,
-    relativegasprice: float = 9.3 * 3.79127 / 100 / 100,
-) -> float:
-    """Calculate break-even oilprice with gasprice strongly correlated to
-    oilprice using EPA QX 201X External Assumptions;
-    there is a link between gas and oil prices and the
-    resulting break-even price is in USD/boe.
-
-    Args:
-        oilprice: Price pr. barrel of oil in USD
-        pv_df: Production and economical data.
-        cutoffyear: Production/costs beyond this year is ignored
-        relativegasprice: Gasprice (in MNOK/GSm3) is oilprice
-            (usd/bbl) multiplied with this constant.
-    Returns:
-        Computed presentvalue.
-    """
-    gasprice = oilprice * relativegasprice
-
-    pv_bep = (
-        pv_df["OPR"] * BARRELSPRCUBIC * oilprice * pv_df["usdtonok"]
-        + (pv_df["GSR"] * gasprice * pv_df["usdtonok"])
-        - pv_df["costs"] * NOKUNIT
-    ) * pv_df["discountfactors"]
-    return pv_bep.loc[: cutoffyear - 1].sum() / NOKUNIT
-
-
-def calc_pv_bep_constantgas(
-    oilprice: float, pv_df: pd.DataFrame, cutoffyear: int
-) -> float:
-    """Calculate break-even oilprice without touching the gas price:
-
-    Gas price is fixed, from the dataframe, the resulting break-even price
-    is in USD/bbl. This can be used to evaluate gas injection/deferral projects.
-
-    Args:
-        oilprice: Price pr. barrel of oil in USD
-        pv_df: Production and economical data, with gasprice
-        cutoffyear: Production/costs beyond this year is ignored
-
-    Returns:
-        Computed presentvalue.
-    """
-    pv_bep = (
-        pv_df["OPR"] * BARRELSPRCUBIC * oilprice * pv_df["usdtonok"]
-        + (pv_df["GSR"] * pv_df["gasprice"])
-        - pv_df["costs"] * NOKUNIT
-    ) * pv_df["discountfactors"]
-
-    return pv_bep.loc[: cutoffyear - 1].sum() / NOKUNIT
-
-
 if __name__ == "__main__":
     main()
@@ -2,16 +2,20 @@
 metadata"""
 
 import argparse
+import json
 import logging
+import mmap
+import os
 import re
 import warnings
 from datetime import date, datetime
 from pathlib import Path
+from typing import Any
 
 import numpy as np
 import pandas as pd
-import res2df
 from fmu.tools.fipmapper.fipmapper import FipMapper
+from res2df.fipreports import REGION_REPORT_COLUMNS, report_block_lineparser
 
 from subscript import __version__, getLogger
 
@@ -41,6 +45,26 @@ DATE_MATCHER_ECL = re.compile(r"^\s{2}REPORT\s{3}0")
 # Flow: Look for "Report step  0" at start of line
 DATE_MATCHER_FLOW = re.compile(r"^Report step\s{2}0")
 
+# To index a PRT file in one pass, match (in bytes) the start of lines with
+# report dates, the initial Flow report step, BALANCE/BAL<fip> report headers,
+# region reports and RESERVOIR VOLUMES tables. The leading newline makes the
+# regex engine skip quickly from line to line, the first line of a PRT file
+# is never of interest. Report dates are matched case sensitively, like in
+# find_report_date_in_prt().
+PRT_INDEX_MATCHER = re.compile(
+    rb"\n(?:(?P<report>(?-i:  REPORT\s))|(?P<flowinitial>(?-i:Report step\s{2}0))"
+    rb"|  (?P<balance>BAL\w*)\s+AT\s"
+    rb"|[ ]*:[ ]*(?P<region>FIP\w*)\s+REPORT\s+REGION\s"
+    rb"|[ ]*:[ ]*(?P<resvol>RESERVOIR VOLUMES))",
+    re.IGNORECASE,
+)
+
+# Version of the format of persisted PRT index files, to be increased when
+# the content of the index changes.
+PRT_INDEX_VERSION = 2
+
+# PRT files smaller than this are fast to index, and no index file is written:
+PRT_INDEX_MIN_FILESIZE = 100 * 1024**2
 
 logger = getLogger(__name__)
 
@@ -223,13 +247,242 @@ def find_report_date_in_prt(line: str, find_initial: bool = False) -> date | Non
     return date_object
 
 
+def index_prt(prt_file: str | Path) -> dict[str, Any]:
+    """Index a PRT file in one streaming pass.
+
+    Byte offsets are recorded for the region reports (pr. FIP vector and report
+    date) and for the RESERVOIR VOLUMES tables, together with the initial date
+    of the simulation. This allows extraction of volume reports by seeking
+    directly to the requested report instead of parsing the full PRT file.
+
+    Args:
+        prt_file: Path to a PRT file
+
+    Returns:
+        Dictionary with the keys "initial_date" (datetime.date or None),
+        "region_reports" and "reservoir_volumes". The latter two are lists of
+        dictionaries with the keys "date", "start" and "end", where region
+        reports also have a "fipname" and reservoir volumes have the "balname"
+        (BALANCE, BALZON etc) of the report they are in, if any.
+    """
+    prt_index: dict[str, Any] = {
+        "initial_date": None,
+        "region_reports": [],
+        "reservoir_volumes": [],
+    }
+    if Path(prt_file).stat().st_size == 0:
+        return prt_index
+
+    report_date: date | None = None
+    balname: str | None = None
+    region_report: dict[str, Any] | None = None
+    # A BAL<fip> header is followed by the report line with its date:
+    after_balance_header = False
+    # The entry for which the end offset is not yet known:
+    open_entry: dict[str, Any] | None = None
+
+    with (
+        Path(prt_file).open("rb") as f_handle,
+        mmap.mmap(f_handle.fileno(), 0, access=mmap.ACCESS_READ) as prt_map,
+    ):
+        for match in PRT_INDEX_MATCHER.finditer(prt_map):
+            linestart = match.start() + 1
+            entry: dict[str, Any] | None = None
+            if match["region"]:
+                fipname = match["region"].decode().upper()
+                if (
+                    region_report is not None
+                    and region_report["fipname"] == fipname
+                    and region_report["date"] == report_date
+                ):
+                    # Continuation of the same region report, f.ex. after
+                    # a page break in the PRT file.
+                    if open_entry is region_report:
+                        continue
+                    region_report["end"] = None
+                    entry = region_report
+                else:
+                    entry = region_report = {
+                        "fipname": fipname,
+                        "date": report_date,
+                        "start": linestart,
+                        "end": None,
+                    }
+                    prt_index["region_reports"].append(entry)
+            elif match["resvol"]:
+                entry = {
+                    "balname": balname,
+                    "date": report_date,
+                    "start": linestart,
+                    "end": None,
+                }
+                prt_index["reservoir_volumes"].append(entry)
+            elif match["balance"]:
+                balname = match["balance"].decode().upper()
+                region_report = None
+            else:
+                line = prt_map[linestart : prt_map.find(b"\n", linestart)].decode(
+                    "utf8", errors="replace"
+                )
+                if prt_index["initial_date"] is None:
+                    prt_index["initial_date"] = find_report_date_in_prt(
+                        line, find_initial=True
+                    )
+                if (
+                    match["report"]
+                    and (new_date := find_report_date_in_prt(line)) != report_date
+                ):
+                    report_date = new_date
+                    if not after_balance_header:
+                        balname = None
+
+            if open_entry is not None:
+                open_entry["end"] = linestart
+            open_entry = entry
+            after_balance_header = match["balance"] is not None
+        if open_entry is not None:
+            open_entry["end"] = len(prt_map)
+
+    logger.debug(
+        "Indexed %s region reports and %s reservoir volume tables in %s",
+        len(prt_index["region_reports"]),
+        len(prt_index["reservoir_volumes"]),
+        prt_file,
+    )
+    return prt_index
+
+
+def load_prt_index(
+    prt_file: str | Path, min_filesize: int = PRT_INDEX_MIN_FILESIZE
+) -> dict[str, Any]:
+    """Load the index of a PRT file from its sidecar index file, or index
+    the PRT file and persist the index if it is large.
+
+    The index file is named as the PRT file with ".idx" appended, and is only
+    used if the size and modification time of the PRT file are unchanged since
+    the index was written. Failure to write the index file is not an error.
+
+    Args:
+        prt_file: Path to a PRT file
+        min_filesize: Only write an index file for PRT files of this size
+            (in bytes) or larger.
+
+    Returns:
+        The index of the PRT file, as returned by index_prt().
+    """
+    index_file = Path(str(prt_file) + ".idx")
+    prt_stat = Path(prt_file).stat()
+    if index_file.is_file():
+        try:
+            persisted = json.loads(index_file.read_text(encoding="utf8"))
+        except (OSError, ValueError):
+            persisted = {}
+        if (
+            persisted.get("version") == PRT_INDEX_VERSION
+            and persisted.get("size") == prt_stat.st_size
+            and persisted.get("mtime_ns") == prt_stat.st_mtime_ns
+        ):
+            logger.info("Using PRT index file %s", index_file)
+            return _prt_index_from_json(persisted)
+        logger.info("PRT index file %s is outdated", index_file)
+
+    prt_index = index_prt(prt_file)
+    if prt_stat.st_size < min_filesize:
+        return prt_index
+
+    persisted = {
+        "version": PRT_INDEX_VERSION,
+        "size": prt_stat.st_size,
+        "mtime_ns": prt_stat.st_mtime_ns,
+        **prt_index,
+    }
+    # Write to a temporary file first, to not expose a partial index file
+    # to concurrent readers:
+    tmp_index_file = index_file.with_name(f"{index_file.name}.{os.getpid()}.tmp")
+    try:
+        tmp_index_file.write_text(json.dumps(persisted, default=str), encoding="utf8")
+        tmp_index_file.replace(index_file)
+        logger.info("Written PRT index file %s", index_file)
+    except OSError as err:
+        logger.warning("Could not write PRT index file %s: %s", index_file, err)
+        tmp_index_file.unlink(missing_ok=True)
+    return prt_index
+
+
+def _prt_index_from_json(persisted: dict[str, Any]) -> dict[str, Any]:
+    """Convert a PRT index read from JSON back to the format of index_prt(),
+    with dates as datetime.date objects"""
+
+    def _to_date(date_str: str | None) -> date | None:
+        return None if date_str is None else date.fromisoformat(date_str)
+
+    return {
+        "initial_date": _to_date(persisted["initial_date"]),
+        "region_reports": [
+            {**report, "date": _to_date(report["date"])}
+            for report in persisted["region_reports"]
+        ],
+        "reservoir_volumes": [
+            {**table, "date": _to_date(table["date"])}
+            for table in persisted["reservoir_volumes"]
+        ],
+    }
+
+
+def _read_prt_lines(prt_file: str | Path, start: int, end: int) -> list[str]:
+    """Read the lines in a byte range of a PRT file"""
+    with Path(prt_file).open("rb") as f_handle:
+        f_handle.seek(start)
+        return f_handle.read(end - start).decode("utf8", errors="replace").splitlines()
+
+
+def _parse_region_reports(
+    lines: list[str], fipname: str, report_date: date
+) -> pd.DataFrame:
+    """Parse the region reports for a FIP vector from the lines of one
+    BALANCE/BAL<fip> report, into the same format as res2df.fipreports.df()"""
+    reportblockmatcher = re.compile(
+        ".+" + fipname + r"\s+REPORT\s+REGION\s+(\d+)", re.IGNORECASE
+    )
+    records = []
+    in_report_block = False
+    region_index = None
+    for line in lines:
+        matchedreportblock = reportblockmatcher.match(line)
+        if matchedreportblock:
+            in_report_block = True
+            region_index = int(matchedreportblock.group(1))
+            continue
+        if line.startswith(" ============================"):
+            in_report_block = False
+            continue
+        if not in_report_block or not any(
+            string in line.upper() for string in ["IN PLACE", "OUTFLOW", "MATERIAL"]
+        ):
+            continue
+        # The colons in the report block are not reliably included (differs by
+        # Eclipse version), insert them at fixed positions like res2df does.
+        line = line.strip()
+        if line[0] != ":":
+            line = ":" + line
+        if ":" not in line[25:27] and len(line) > 26:
+            line = line[:26] + ":" + line[27:]
+        records.append(
+            [report_date, fipname, region_index, *report_block_lineparser(line)]
+        )
+    return pd.DataFrame(data=records, columns=REGION_REPORT_COLUMNS)
+
+
 def currently_in_place_from_prt(
-    prt_file: str, fipname: str = "FIPNUM", date_str: str | None = None
+    prt_file: str,
+    fipname: str = "FIPNUM",
+    date_str: str | None = None,
+    prt_index: dict[str, Any] | None = None,
 ) -> tuple[pd.DataFrame, np.ndarray, str]:
     """Extracts currently-in-place volumes from a PRT file
 
-    This function uses res2df.fipreports, and slices its
-    output for the purpose here.
+    Only the region reports at the requested date are parsed, located through
+    an index of the PRT file, and the output is sliced for the purpose here.
 
     Args:
         prt_file (str): Path to a PRT to parse
@@ -237,24 +490,37 @@ def currently_in_place_from_prt(
         date_str (str): If None or "first", the first date will be used. If not None,
                     "first" or "last", it should be an ISO-formatted date string
                     to extract (YYYY-MM-DD).
+        prt_index (dict): Index of the PRT file from index_prt() or
+                    load_prt_index(). If None, the PRT file will be indexed.
 
     Returns:
         pd.DataFrame: The dataframe with in-place volumes.
         np.ndarray: Array of available dates with BALANCE reports.
         str: The selected date as a string.
     """
-    inplace_df = res2df.fipreports.df(prt_file, fipname=fipname)
+    if not fipname.startswith("FIP"):
+        raise ValueError("fipname must start with FIP")
+    if len(fipname) > 8:
+        raise ValueError("fipname can be at most 8 characters")
+
+    if prt_index is None:
+        prt_index = index_prt(prt_file)
+    region_reports = [
+        report
+        for report in prt_index["region_reports"]
+        if report["fipname"] == fipname.upper() and report["date"] is not None
+    ]
 
     # Avoid date_str as None, use empty string instead
     if date_str is None:
         date_str = ""
 
-    if inplace_df.empty:
+    if not region_reports:
         logger.warning("The PRT file %s has no volume report for %s", prt_file, fipname)
         # Then there will be no RESERVOIR VOLUME report either
-        return inplace_df, np.array([]), date_str
+        return pd.DataFrame(columns=REGION_REPORT_COLUMNS), np.array([]), date_str
 
-    available_dates = inplace_df.sort_values("DATE")["DATE"].unique()
+    available_dates = np.array(sorted({report["date"] for report in region_reports}))
 
     # Available dates as list of strings:
     available_dates_str = [
@@ -279,11 +545,14 @@ def currently_in_place_from_prt(
             )
             # Should return an empty dataframe with the same columns,
             # and not volumes for first date in PRT file
-            empty_df = pd.DataFrame(columns=inplace_df.columns)
+            empty_df = pd.DataFrame(columns=REGION_REPORT_COLUMNS)
             return empty_df, np.array([]), date_str
 
-    # Filter to requested date:
-    inplace_df = inplace_df[inplace_df["DATE"] == date]
+    # Parse only the (first) report at the requested date:
+    report = next(report for report in region_reports if report["date"] == date)
+    inplace_df = _parse_region_reports(
+        _read_prt_lines(prt_file, report["start"], report["end"]), fipname, date
+    )
 
     # Filter dataframe to only volumes pr. region, not inter-region flows:
     inplace_df = inplace_df[inplace_df["DATATYPE"] == "CURRENTLY IN PLACE"]
@@ -296,18 +565,10 @@ def currently_in_place_from_prt(
 
     logger.info("Extracted CURRENTLY IN PLACE from %s at date %s", prt_file, date_str)
 
-    # Find the initial date from the PRT file, to compare with date for report extracted
-    initial_date_object = None
-    find_initial = True
-    with Path(prt_file).open(encoding="utf8") as f_handle:
-        for line in f_handle:
-            initial_date_object = find_report_date_in_prt(line, find_initial)
-
-            if initial_date_object is not None:
-                logger.info(
-                    f"Initial date is {initial_date_object}, report date is {date_str}"
-                )
-                break
+    # Compare the initial date from the PRT file with date for report extracted
+    initial_date_object = prt_index["initial_date"]
+    if initial_date_object is not None:
+        logger.info(f"Initial date is {initial_date_object}, report date is {date_str}")
 
     if initial_date_object is not None and (date > initial_date_object):
         warnings.warn(
@@ -329,11 +590,42 @@ def currently_in_place_from_prt(
     return inplace_df, available_dates, date_str
 
 
+def _parse_reservoir_volumes(lines: list[str], fipname: str) -> list[dict]:
+    """Parse the lines of a RESERVOIR VOLUMES table, starting at the
+    table header, into one record pr. region"""
+    records = []
+    for line in lines[1:]:
+        if line.strip().startswith("======================="):
+            # PRT table is finished.
+            break
+        # Extract lines with only numbers in between colons
+        line_split = [part.strip() for part in line.split(":") if part.strip()]
+        if len(line_split) != 6:
+            continue
+        try:
+            int(line_split[0])
+        except ValueError:
+            # Not the line we are looking for.
+            continue
+        records.append(
+            {
+                fipname: int(line_split[0]),
+                "PORV_TOTAL": float(line_split[1]),
+                "HCPV_OIL": float(line_split[2]),
+                "WATPV_TOTAL": float(line_split[3]),
+                "HCPV_GAS": float(line_split[4]),
+                "HCPV_TOTAL": float(line_split[5]),
+            }
+        )
+    return records
+
+
 def reservoir_volumes_from_prt(
     prt_file: str,
     dates_bal_report: np.ndarray,
     fipname: str = "FIPNUM",
     date_str: str = "",
+    prt_index: dict[str, Any] | None = None,
 ) -> pd.DataFrame:
     """Extracts numbers from the table "RESERVOIR VOLUMES" in an Eclipse PRT
     file, example table is::
@@ -361,24 +653,13 @@ def reservoir_volumes_from_prt(
         dates_bal_report (np.ndarray): Available dates with BALANCE report in the PRT file.
         fipname (str): Name of FIP-parameter, defaults to FIPNUM.
         date_str (str): The requested date to extract volume report from PRT file from.
+        prt_index (dict): Index of the PRT file from index_prt() or
+            load_prt_index(). If None, the PRT file will be indexed.
 
     Returns:
         pd.DataFrame: The dataframe with reservoir volumes.
     """  # noqa: E501
 
-    records = []
-    start_matcher = re.compile(r"^\s*:\s*RESERVOIR VOLUMES.*$")
-
-    table_found = (
-        False  # State determining if current line is in our interesting table or not.
-    )
-    # The Reservoir Volume table is not tagged with the "FIPNAME", but will appear
-    # after the in-place volume table (see the "BALANCE" report) in the PRT file.
-    fipname_found = fipname == "FIPNUM"  # found the correct fipname, True for FIPNUM
-
-    # Must pick the reservoir volume table corresponding to the date of interest
-    date_found = False
-
     # In case empty numpy array (no dates provided as input to function):
     if dates_bal_report.size == 0:
         logger.error(
@@ -395,48 +676,20 @@ def reservoir_volumes_from_prt(
     else:
         wanted_date = datetime.strptime(date_str, "%Y-%m-%d").date()
 
-    # Eclipse, Flow: Look for "  REPORT " at start of line (Eclipse: up to REPORT 999)
-    with Path(prt_file).open(encoding="utf8") as f_handle:
-        for line in f_handle:
-            # Search PRT file for the date requested:
-            date_object = find_report_date_in_prt(line)
-
-            if date_object == wanted_date:
-                date_found = True
-            if isinstance(date_object, date) and date_object > wanted_date:
-                # Next report step (i.e. no Reservoir Volume Report) -> stop search
-                break
-
-            # PRT file will have the BAL<nnn> report after the BALANCE report
-            if date_found and line.startswith("  " + "BAL" + fipname[3:6]):
-                fipname_found = True
-                continue
-            if date_found and fipname_found and start_matcher.search(line) is not None:
-                table_found = True
-                continue
-            if table_found and line.strip().startswith("======================="):
-                # PRT table is finished.
-                break
-            if table_found:
-                # Extract lines with only numbers in between colons
-                line_split = [part.strip() for part in line.split(":") if part.strip()]
-                if len(line_split) != 6:
-                    continue
-                try:
-                    int(line_split[0])
-                except ValueError:
-                    # Not the line we are looking for.
-                    continue
-                records.append(
-                    {
-                        fipname: int(line_split[0]),
-                        "PORV_TOTAL": float(line_split[1]),
-                        "HCPV_OIL": float(line_split[2]),
-                        "WATPV_TOTAL": float(line_split[3]),
-                        "HCPV_GAS": float(line_split[4]),
-                        "HCPV_TOTAL": float(line_split[5]),
-                    }
-                )
+    if prt_index is None:
+        prt_index = index_prt(prt_file)
+
+    # The Reservoir Volume table is not tagged with the "FIPNAME", but will appear
+    # after the in-place volume table in the BALANCE report for FIPNUM, and in
+    # the BAL<nnn> report for other FIP vectors.
+    balnames = {None, "BALANCE"} if fipname == "FIPNUM" else {"BAL" + fipname[3:6]}
+    records = []
+    for table in prt_index["reservoir_volumes"]:
+        if table["date"] == wanted_date and table["balname"] in balnames:
+            records = _parse_reservoir_volumes(
+                _read_prt_lines(prt_file, table["start"], table["end"]), fipname
+            )
+            break
 
     if not records:
         logger.warning(
@@ -495,8 +748,9 @@ def main() -> None:
         logger.error("PRT-file %s does not exist", prt_file)
         return
 
+    prt_index = load_prt_index(prt_file)
     simvolumes_df, available_dates, selected_date = currently_in_place_from_prt(
-        prt_file, args.fipname, args.date
+        prt_file, args.fipname, args.date, prt_index=prt_index
     )
 
     if simvolumes_df.empty:
@@ -520,7 +774,7 @@ def main() -> None:
 
     # Provide array with available dates with BALANCE report as input:
     resvolumes_df = reservoir_volumes_from_prt(
-        prt_file, available_dates, args.fipname, selected_date
+        prt_file, available_dates, args.fipname, selected_date, prt_index=prt_index
     )
 
     fipmapper: FipMapper | None
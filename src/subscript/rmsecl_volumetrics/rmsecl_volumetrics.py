@@ -12,7 +12,7 @@ from fmu.tools.fipmapper import fipmapper
 from fmu.tools.rms import volumetrics
 
 from subscript import getLogger
-from subscript.prtvol2csv.prtvol2csv import currently_in_place_from_prt
+from subscript.prtvol2csv.prtvol2csv import currently_in_place_from_prt, load_prt_index
 
 logger = getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -148,7 +148,9 @@ def main() -> None:
     if args.PRTFILE.endswith("csv"):
         simvolumes_df = pd.read_csv(args.PRTFILE, index_col="FIPNUM")
     else:
-        simvolumes_df, _, _ = currently_in_place_from_prt(args.PRTFILE, "FIPNUM")
+        simvolumes_df, _, _ = currently_in_place_from_prt(
+            args.PRTFILE, "FIPNUM", prt_index=load_prt_index(args.PRTFILE)
+        )
 
     volumetrics_df = volumetrics.merge_rms_volumetrics(args.volumetricsbase).set_index(
         ["REGION", "ZONE"]
@@ -19,26 +19,33 @@
 
 
 import argparse
+import datetime
 import difflib
+import glob
 import logging
 import os
 import re
 import sys
 import termios
 import tty
-from collections.abc import Callable
+from collections import defaultdict
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from multiprocessing import Process
 from pathlib import Path
 from typing import Any
 
 import matplotlib.pyplot as plt
 import numpy as np
+import resfo
 
 # Get rid of FutureWarning from pandas/plotting.py
+from matplotlib.backend_bases import Event, TimerBase
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
 from pandas.plotting import register_matplotlib_converters
-from resdata.grid import Grid
-from resdata.resfile import ResdataFile
 from resdata.summary import Summary
+from resfo.array_entry import ResArray
 
 import subscript
 
@@ -60,6 +67,21 @@ to be a vector to plot. Thus, vectors and datafiles can be mixed.
 
 EPILOG = ""
 
+# Seconds between each check for new data in --follow mode
+FOLLOW_INTERVAL = 10.0
+
+SUMMARY_SUFFIXES = [".SMSPEC", ".UNSMRY", ".FSMSPEC", ".FUNSMRY"]
+
+# Non-unified summary files, one pr. report step
+NONUNIFIED_SUMMARY_SUFFIX = ".[SA][0-9][0-9][0-9][0-9]"
+
+# Opened summaries pr. DATA file, together with the names and modification
+# times of the summary files when they were opened:
+_SUMMARY_CACHE: dict[str, tuple[tuple[tuple[str, float], ...], Summary]] = {}
+
+# Vectors read pr. DATA file, together with the summary they were read from:
+_VECTOR_CACHE: dict[str, tuple[Summary, dict[str, np.ndarray]]] = {}
+
 
 def get_parser() -> argparse.ArgumentParser:
     """Setup parser for command line options"""
@@ -112,6 +134,17 @@ def get_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="All vectors are put into one single plot",
     )
+    parser.add_argument(
+        "--follow",
+        "-f",
+        action="store_const",
+        const=FOLLOW_INTERVAL,
+        help=(
+            "Follow running simulations, adding new data to the plots as the "
+            f"summary files grow. Summary files are checked every {FOLLOW_INTERVAL:g} "
+            "seconds"
+        ),
+    )
     parser.add_argument("-v", "--verbose", action="store_true", help="Be verbose")
     parser.add_argument(
         "VECTORSDATAFILES",
@@ -141,6 +174,8 @@ def summaryplotter(
     dumpimages: bool = False,
     colourby: str | None = None,
     logcolourby: str | None = None,
+    follow: float | None = None,
+    vectordata: list[dict[str, np.ndarray]] | None = None,
 ) -> None:
     """
     Will plot Eclipse summary vectors to screen or dump to file based on kwargs.
@@ -159,17 +194,24 @@ def summaryplotter(
         dumpimages:
         colourby:
         logcolourby:
+        follow: Seconds between each check for new data in the summary files.
+            If None, the plots are not updated.
+        vectordata: Summary vectors already read for each summary, as returned
+            by load_vectors(). If None, the vectors are read here.
     """
-    rstfiles = []  # EclRst objects
-    gridfiles = []  # Grid objects
     parametervalues = []  # Vector of values pr. realization for colouring
+    # Summary index, vector, line and normalization for each plotted line:
+    followedlines: list[tuple[int, str, Line2D, float]] = []
 
     if parameterfiles is None:
         parameterfiles = []
 
     if datafiles and not summaryfiles:
         logger.info("Reloading summary files from disk")
-        summaryfiles = [Summary(datafile) for datafile in datafiles]
+        summaryfiles = [
+            summary for summary in load_summaries(datafiles) if summary is not None
+        ]
+        vectordata = None
 
     if maxlabels == 0:
         nolegend = True
@@ -294,84 +336,38 @@ def summaryplotter(
         logger.info(
             "Summary vectors after wildcard expansion: %s", matchedsummaryvectors
         )
+    if vectordata is None:
+        vectordata = extract_vectors(summaryfiles, matchedsummaryvectors)
 
     if datafiles is None:
         datafiles = []
 
-    # If we have any restart vectors defined, we must also load the restart files
-    if restartvectors:
-        for datafile in datafiles:
-            rstfile = datafile.replace(".DATA", "")
-            rstfile += ".UNRST"
-            gridfile = datafile.replace(".DATA", "")
-            gridfile += ".EGRID"  # What about .GRID??
-            logger.info("Loading grid and restart file %s", rstfile)
-            # TODO: Allow some of the rstfiles to be missing
-            # TODO: Handle missing rstfiles gracefully
-            rst = ResdataFile(rstfile)
-            grid = Grid(gridfile)
-            rstfiles.append(rst)
-            gridfiles.append(grid)
-            logger.info("RST loading done")
-
     if (len(matchedsummaryvectors) + len(restartvectors)) == 0:
         logger.error("Error: No vectors to plot")
         sys.exit(1)
 
-    # Now it is time to prepare vectors from restart-data, quite time-consuming!!
-    # Remember that SOIL should also be supported, but must be calculated on
-    # demand from SWAT and SGAS (if present)
+    # Restart vectors are read in one pass over each restart file, with the
+    # realizations read concurrently:
     restartvectordata: dict
     restartvectordates: dict
-    restartvectordata = {}
-    restartvectordates = {}
-    for rstvec in restartvectors:
-        logger.info("Getting data for %s...", rstvec)
-        match = re.match(r"^([A-Z]+):([0-9]+),([0-9]+),([0-9]+)$", rstvec)
-        dataname = match.group(1)  # type: ignore
-        # aka SWAT, PRESSURE, SGAS etc..
-        (ijk) = (
-            int(match.group(2)) - 1,  # type: ignore
-            int(match.group(3)) - 1,  # type: ignore
-            int(match.group(4)) - 1,  # type: ignore
-        )
-        # Remember that these indices start on 1, not on zero!
-
-        restartvectordata[rstvec] = {}
-        restartvectordates[rstvec] = {}
-        for idx, datafile in enumerate(datafiles):
-            active_index = gridfiles[idx].get_active_index(ijk=ijk)
-            restartvectordata[rstvec][datafile] = []
-            restartvectordates[rstvec][datafile] = []
-
-            # Loop over all restart steps
-            last_step = range(rstfiles[idx].num_named_kw("SWAT"))[-1]
-            for report_step in range(last_step + 1):
-                restartvectordates[rstvec][datafile].append(
-                    rstfiles[idx].iget_restart_sim_time(report_step)
+    restartvectordata = {rstvec: {} for rstvec in restartvectors}
+    restartvectordates = {rstvec: {} for rstvec in restartvectors}
+    if restartvectors:
+        with ThreadPoolExecutor() as executor:
+            realizationdata = list(
+                executor.map(
+                    lambda datafile: restart_vectors(datafile, restartvectors),
+                    datafiles,
                 )
-                if dataname != "SOIL":
-                    restartvectordata[rstvec][datafile].append(
-                        rstfiles[idx].iget_named_kw(dataname, report_step)[active_index]
-                    )
-                else:
-                    swatvalue = rstfiles[idx].iget_named_kw("SWAT", report_step)[
-                        active_index
-                    ]
-                    if "SGAS" in rstfiles[idx]:
-                        sgasvalue = rstfiles[idx].iget_named_kw("SGAS", report_step)[
-                            active_index
-                        ]
-                        restartvectordata[rstvec][datafile].append(
-                            1 - swatvalue - sgasvalue
-                        )
-                    else:
-                        restartvectordata[rstvec][datafile].append(1 - swatvalue)
+            )
+        for datafile, rstdata in zip(datafiles, realizationdata, strict=True):
+            for rstvec, (rstdates, rstvalues) in rstdata.items():
+                restartvectordates[rstvec][datafile] = rstdates
+                restartvectordata[rstvec][datafile] = rstvalues
     # Data structure examples
     # restartvectordata["SOIL:1,1,1"]["datafile"] = [0.89, 0.70, 0.60, 0.55, 0.54]
     # restartvectortimes["SOIL:1,1,1"]["datafile"] = ["1 Jan 2011", "1 Jan 2012"]
     # (NB dates are in format "datetime")
-    # TODO: Fill restartvectordata with NaN's if restart data is missing
 
     # Make the plots
 
@@ -436,9 +432,11 @@ def summaryplotter(
             if histvec in firstsummary:
                 values = firstsummary.numpy_vector(histvec)
                 sumlabel = "_nolegend_"
+                scale = 1.0
                 if normalize:
                     maxvalue = values.max()
                     if abs(maxvalue) > 0.0:
+                        scale = 1 / maxvalue
                         values = [i * 1 / maxvalue for i in values]
                         sumlabel = histvec + " " + str(maxvalue)
                     else:
@@ -446,7 +444,8 @@ def summaryplotter(
                             "Could not normalize %s, maxvalue is %g", histvec, maxvalue
                         )
 
-                plt.plot(firstsummary.dates, values, "k.", label=sumlabel)
+                (plotline,) = plt.plot(firstsummary.dates, values, "k.", label=sumlabel)
+                followedlines.append((0, histvec, plotline, scale))
                 fig.autofmt_xdate()
 
         for idx, summaryfile in enumerate(summaryfiles):
@@ -458,7 +457,7 @@ def summaryplotter(
                 else:
                     sumlabel = summaryfile.case.lower()
 
-                values = summaryfile.numpy_vector(vector)
+                values = vectordata[idx][vector]
 
                 if ensemblemode:
                     cycledcolor = colours[vector_idx]
@@ -468,9 +467,11 @@ def summaryplotter(
                 else:
                     cycledcolor = colours[idx]
 
+                scale = 1.0
                 if normalize:
                     maxvalue = values.max()
                     if abs(maxvalue) > 0.0:
+                        scale = 1 / maxvalue
                         values = [i * 1 / maxvalue for i in values]
                         sumlabel = sumlabel + " " + str(maxvalue)
                     else:
@@ -478,7 +479,7 @@ def summaryplotter(
                             "Could not normalize %s, maxvalue is %g", vector, maxvalue
                         )
 
-                plt.plot(
+                (plotline,) = plt.plot(
                     summaryfile.dates,
                     values,
                     "-",
@@ -487,6 +488,7 @@ def summaryplotter(
                     linewidth=1.5,
                     alpha=alpha,
                 )
+                followedlines.append((idx, vector, plotline, scale))
                 fig.autofmt_xdate()
 
         if not nolegend:
@@ -532,7 +534,7 @@ def summaryplotter(
                 cycledcolor = colours[datafile_idx]
 
             values = np.array(restartvectordata[rstvec][datafiles[datafile_idx]])
-            if normalize:
+            if normalize and values.size:
                 maxvalue = values.max()
                 values = [i * 1 / maxvalue for i in values]
                 rstlabel = rstlabel + " " + str(maxvalue)
@@ -554,6 +556,19 @@ def summaryplotter(
         plt.savefig("summaryplotdump.png", bbox_inches="tight")
         plt.savefig("summaryplotdump.pdf", bbox_inches="tight")
     else:
+        if follow:
+            followers = [
+                SummaryFollower(
+                    summaryfile,
+                    [
+                        vector
+                        for idx, vector, _, _ in followedlines
+                        if idx == summary_idx
+                    ],
+                )
+                for summary_idx, summaryfile in enumerate(summaryfiles)
+            ]
+            follow_figures(followers, followedlines, follow)
         plt.show()
 
 
@@ -577,10 +592,10 @@ def split_vectorsdatafiles(
     vectors = []  # strings
     parameterfiles = []  # strings
 
-    for vecdata in vectorsdatafiles:
-        try:
-            sumfn = Summary(vecdata)
-        except OSError:
+    for vecdata, sumfn in zip(
+        vectorsdatafiles, load_summaries(vectorsdatafiles), strict=True
+    ):
+        if sumfn is None:
             # If we get here, we assume it was an Eclipse vector name.
             vectors.append(vecdata)
             continue
@@ -601,6 +616,512 @@ def split_vectorsdatafiles(
     return (summaryfiles, datafiles, vectors, parameterfiles)
 
 
+def active_indices(gridfile: str, ijks: list[tuple[int, int, int]]) -> list[int]:
+    """Find the active cell indices for grid cells in an EGRID file.
+
+    Only the grid dimensions and ACTNUM are read from the file.
+
+    Args:
+        gridfile: EGRID file
+        ijks: Zero-based cell indices
+
+    Returns:
+        Active index for each cell, -1 for inactive cells.
+    """
+    dims = None
+    actnum = None
+    for entry in resfo.lazy_read(gridfile):
+        keyword = entry.read_keyword().strip()
+        if keyword == "GRIDHEAD":
+            dims = np.asarray(entry.read_array())[1:4]
+        elif keyword == "ACTNUM":
+            actnum = np.asarray(entry.read_array())
+        elif keyword == "ENDGRID":
+            # Any local grids follow after the global grid
+            break
+    if dims is None:
+        raise ValueError(f"No GRIDHEAD in {gridfile}")
+    nx, ny, nz = (int(dim) for dim in dims)
+    # Bit 1 in ACTNUM is the matrix cell in dual porosity grids:
+    active = np.ones(nx * ny * nz, dtype=bool) if actnum is None else (actnum & 1) > 0
+    activeindex = np.cumsum(active) - 1
+    indices = []
+    for i, j, k in ijks:
+        if not (0 <= i < nx and 0 <= j < ny and 0 <= k < nz):
+            raise ValueError(f"Cell {i + 1},{j + 1},{k + 1} is outside the grid")
+        globalindex = i + j * nx + k * nx * ny
+        indices.append(int(activeindex[globalindex]) if active[globalindex] else -1)
+    return indices
+
+
+def read_array_element(entry: ResArray, index: int) -> Any:  # noqa: ANN401
+    """Read one element of a numeric array in an unformatted file.
+
+    The position of the element is computed from the Fortran record
+    layout, so the rest of the array is not read.
+
+    Args:
+        entry: Array from resfo.lazy_read() on an unformatted file
+        index: Zero-based index into the array
+    """
+    if not 0 <= index < entry.read_length():
+        raise IndexError(f"Index {index} out of range for {entry.read_keyword()}")
+    dtype = np.dtype(resfo.types.to_np_type(entry.read_type()))  # type: ignore
+    # The array header is one record of 16 bytes, and data records hold
+    # up to 1000 elements, each record enclosed by 4 byte markers:
+    recordsize = 1000 * dtype.itemsize + 8
+    entry.stream.seek(
+        entry.start
+        + 16
+        + 8
+        + (index // 1000) * recordsize
+        + 4
+        + (index % 1000) * dtype.itemsize
+    )
+    return np.frombuffer(entry.stream.read(dtype.itemsize), dtype=dtype)[0]
+
+
+def restart_cell_values(
+    rstfile: str, cells: list[tuple[str, int]]
+) -> dict[tuple[str, int], tuple[list[datetime.datetime], list[float]]]:
+    """Read time series of cell values from a unified restart file.
+
+    All cells are read in one pass over the file, reading only the
+    requested values from each report step.
+
+    Args:
+        rstfile: Unified restart file
+        cells: Restart keyword and active cell index for each time series.
+            SOIL is computed from SWAT and SGAS (if present).
+
+    Returns:
+        Dates and values for each time series.
+    """
+    readindices: dict[str, set[int]] = defaultdict(set)
+    for keyword, index in cells:
+        if keyword == "SOIL":
+            readindices["SWAT"].add(index)
+            readindices["SGAS"].add(index)
+        else:
+            readindices[keyword].add(index)
+
+    series: dict[tuple[str, int], tuple[list[datetime.datetime], list[float]]] = {
+        cell: ([], []) for cell in cells
+    }
+    stepvalues: dict[tuple[str, int], float] = {}
+    date = None
+
+    def _end_report_step() -> None:
+        for keyword, index in cells:
+            if keyword == "SOIL":
+                if ("SWAT", index) not in stepvalues:
+                    continue
+                value = (
+                    1 - stepvalues["SWAT", index] - stepvalues.get(("SGAS", index), 0.0)
+                )
+            elif (keyword, index) in stepvalues:
+                value = stepvalues[keyword, index]
+            else:
+                continue
+            series[keyword, index][0].append(date)  # type: ignore
+            series[keyword, index][1].append(value)
+        stepvalues.clear()
+
+    in_lgr = False
+    with open(rstfile, "rb") as stream:
+        for entry in resfo.lazy_read(stream, resfo.Format.UNFORMATTED):
+            keyword = entry.read_keyword().strip()
+            if keyword == "LGR":
+                in_lgr = True
+            elif keyword == "ENDLGR":
+                in_lgr = False
+            elif in_lgr:
+                continue
+            elif keyword == "SEQNUM":
+                _end_report_step()
+            elif keyword == "INTEHEAD":
+                intehead = np.asarray(entry.read_array())
+                date = datetime.datetime(
+                    int(intehead[66]), int(intehead[65]), int(intehead[64])
+                )
+            elif keyword in readindices:
+                for index in readindices[keyword]:
+                    stepvalues[keyword, index] = float(read_array_element(entry, index))
+    _end_report_step()
+    return series
+
+
+def restart_vectors(
+    datafile: str, restartvectors: list[str]
+) -> dict[str, tuple[list[datetime.datetime], list[float]]]:
+    """Read restart vectors like SOIL:40,31,33 for an Eclipse run.
+
+    Args:
+        datafile: Eclipse DATA file, the grid and restart file are
+            assumed to be next to it.
+        restartvectors: Vectors with keyword and one-based cell indices.
+
+    Returns:
+        Dates and values for each restart vector.
+    """
+    rstfile = datafile.replace(".DATA", "") + ".UNRST"
+    gridfile = datafile.replace(".DATA", "") + ".EGRID"  # What about .GRID??
+    logger.info("Reading restart vectors from %s", rstfile)
+    keywords = []
+    ijks = []
+    for rstvec in restartvectors:
+        match = re.match(r"^([A-Z]+):([0-9]+),([0-9]+),([0-9]+)$", rstvec)
+        keywords.append(match.group(1))  # type: ignore
+        # Remember that these indices start on 1, not on zero!
+        ijks.append(
+            (
+                int(match.group(2)) - 1,  # type: ignore
+                int(match.group(3)) - 1,  # type: ignore
+                int(match.group(4)) - 1,  # type: ignore
+            )
+        )
+    cells = list(zip(keywords, active_indices(gridfile, ijks), strict=True))
+    for rstvec, (_, index) in zip(restartvectors, cells, strict=True):
+        if index < 0:
+            logger.warning("Cell in %s is inactive in %s", rstvec, gridfile)
+    cellvalues = restart_cell_values(rstfile, [cell for cell in cells if cell[1] >= 0])
+    return {
+        rstvec: cellvalues.get(cell, ([], []))
+        for rstvec, cell in zip(restartvectors, cells, strict=True)
+    }
+
+
+def array_end(entry: ResArray) -> int:
+    """Compute the file position after a numeric array in an unformatted file.
+
+    Args:
+        entry: Array from resfo.lazy_read() on an unformatted file
+    """
+    length = entry.read_length()
+    itemsize = np.dtype(resfo.types.to_np_type(entry.read_type())).itemsize  # type: ignore
+    numrecords = -(-length // 1000)
+    return entry.start + 16 + 8 + length * itemsize + numrecords * 8
+
+
+def complete_arrays(stream: Any, filesize: int) -> Iterator[tuple[ResArray, int]]:  # noqa: ANN401
+    """Iterate over the complete arrays in an unformatted file being written.
+
+    Args:
+        stream: Binary file object, iteration starts at its current position.
+        filesize: Size of the file, arrays extending beyond it are incomplete.
+
+    Yields:
+        Array and the file position after it.
+    """
+    entries = resfo.lazy_read(stream, resfo.Format.UNFORMATTED)
+    while True:
+        try:
+            entry = next(entries)
+        except (StopIteration, resfo.ResfoParsingError):
+            # ResfoParsingError is an incomplete array header at the end
+            return
+        end = array_end(entry)
+        if end > filesize:
+            # The array is still being written
+            return
+        yield entry, end
+
+
+class SummaryFollower:
+    """Follow the unified summary file of a running simulation.
+
+    Each poll only reads the ministeps that have been appended to the
+    UNSMRY file since the previous poll.
+    """
+
+    def __init__(self, summary: Summary, vectors: list[str]) -> None:
+        """
+        Args:
+            summary: Summary for the simulation, the follower starts after
+                the last ministep in it.
+            vectors: Summary vectors to follow.
+        """
+        self.case = summary.case
+        self.smspec = Path(summary.case + ".SMSPEC")
+        self.unsmry = Path(summary.case + ".UNSMRY")
+        self.vectors = vectors
+        self.offset = 0
+        self.smspecsize = -1
+        if not (self.smspec.exists() and self.unsmry.exists()):
+            logger.warning("No unified summary files to follow for %s", summary.case)
+            return
+        self._set_indices(summary)
+        lasttime = summary.numpy_vector("TIME")[-1]
+        filesize = self.unsmry.stat().st_size
+        with open(self.unsmry, "rb") as stream:
+            for entry, end in complete_arrays(stream, filesize):
+                if entry.read_keyword() != "PARAMS  ":
+                    continue
+                if read_array_element(entry, self.timeindex) > lasttime:
+                    break
+                self.offset = end
+
+    def _set_indices(self, summary: Summary) -> None:
+        self.smspecsize = self.smspec.stat().st_size
+        self.start_time = summary.start_time
+        self.timeindex = summary.get_key_index("TIME")
+        self.indices = {
+            vector: summary.get_key_index(vector)
+            for vector in self.vectors
+            if vector in summary
+        }
+
+    def poll(self) -> tuple[bool, np.ndarray, dict[str, np.ndarray]]:
+        """Read the ministeps appended since the previous poll.
+
+        If the summary files have been rewritten, f.ex. by a new simulation,
+        all ministeps are read.
+
+        Returns:
+            Whether the summary files were rewritten, dates of the ministeps
+            and values of each vector.
+        """
+        if self.smspecsize < 0 or not self.unsmry.exists():
+            return False, np.array([]), {}
+        filesize = self.unsmry.stat().st_size
+        rewritten = (
+            filesize < self.offset or self.smspec.stat().st_size != self.smspecsize
+        )
+        if rewritten:
+            logger.info("Summary files for %s have been rewritten", self.case)
+            try:
+                self._set_indices(Summary(self.case))
+            except OSError:
+                # The simulator has not written any data yet
+                return False, np.array([]), {}
+            self.offset = 0
+        elif filesize == self.offset:
+            return False, np.array([]), {}
+
+        rows = []
+        with open(self.unsmry, "rb") as stream:
+            stream.seek(self.offset)
+            for entry, end in complete_arrays(stream, filesize):
+                if entry.read_keyword() == "PARAMS  ":
+                    rows.append(np.asarray(entry.read_array()))
+                self.offset = end
+        if not rows:
+            return (
+                rewritten,
+                np.array([]),
+                {vector: np.array([]) for vector in self.indices},
+            )
+        params = np.vstack(rows)
+        dates = np.array(
+            [
+                self.start_time + datetime.timedelta(seconds=int(days * 86400))
+                for days in params[:, self.timeindex]
+            ]
+        )
+        return (
+            rewritten,
+            dates,
+            {vector: params[:, index] for vector, index in self.indices.items()},
+        )
+
+
+def update_followed_lines(
+    followers: list[SummaryFollower],
+    followedlines: list[tuple[int, str, Line2D, float]],
+) -> None:
+    """Add new data from running simulations to plotted lines.
+
+    Args:
+        followers: One SummaryFollower for each summary in the plots
+        followedlines: Summary index, vector, line and normalization
+            for each plotted line.
+    """
+    updatedaxes = set()
+    for summary_idx, follower in enumerate(followers):
+        rewritten, dates, values = follower.poll()
+        if not dates.size and not rewritten:
+            continue
+        for idx, vector, line, scale in followedlines:
+            if idx != summary_idx or vector not in values:
+                continue
+            if rewritten:
+                line.set_data(dates, values[vector] * scale)
+            else:
+                line.set_data(
+                    np.append(np.asarray(line.get_xdata(), dtype=object), dates),
+                    np.append(line.get_ydata(), values[vector] * scale),
+                )
+            if line.axes is not None:
+                updatedaxes.add(line.axes)
+    for axes in updatedaxes:
+        axes.relim()
+        axes.autoscale_view()
+        axes.figure.canvas.draw_idle()
+
+
+def follow_figures(
+    followers: list[SummaryFollower],
+    followedlines: list[tuple[int, str, Line2D, float]],
+    interval: float,
+) -> None:
+    """Poll for new data while any figure with followed lines is open.
+
+    The timer belongs to the canvas of one of the figures, and is moved to
+    another of them when that figure is closed.
+
+    Args:
+        followers: One SummaryFollower for each summary in the plots
+        followedlines: Summary index, vector, line and normalization
+            for each plotted line.
+        interval: Seconds between each check for new data.
+    """
+    figures: list[Figure] = []
+    for _, _, plotline, _ in followedlines:
+        figure = plotline.figure
+        if isinstance(figure, Figure) and figure not in figures:
+            figures.append(figure)
+    timers: dict[Figure, TimerBase] = {}
+
+    def start_timer() -> None:
+        if figures:
+            timer = figures[0].canvas.new_timer(interval=int(interval * 1000))
+            timer.add_callback(update_followed_lines, followers, followedlines)
+            timer.start()
+            timers[figures[0]] = timer
+
+    def on_close(event: Event) -> None:
+        figure = event.canvas.figure
+        if figure in figures:
+            figures.remove(figure)
+        if figure in timers:
+            timers.pop(figure).stop()
+            start_timer()
+
+    for figure in figures:
+        figure.canvas.mpl_connect("close_event", on_close)
+    start_timer()
+
+
+def summary_mtimes(datafile: str) -> tuple[tuple[str, float], ...]:
+    """Names and modification times of the summary files for an Eclipse run,
+    both unified and non-unified.
+
+    Args:
+        datafile: Eclipse DATA file, or basename of the summary files
+
+    Returns:
+        Tuple with a (filename, modification time) pair for each summary file.
+    """
+    base = Path(datafile).with_suffix("")
+    paths = [Path(datafile).with_suffix(suffix) for suffix in SUMMARY_SUFFIXES]
+    paths += sorted(
+        base.parent.glob(glob.escape(base.name) + NONUNIFIED_SUMMARY_SUFFIX)
+    )
+    return tuple((path.name, path.stat().st_mtime) for path in paths if path.exists())
+
+
+def load_summary(datafile: str) -> Summary | None:
+    """Open the summary files for an Eclipse run.
+
+    Opened summaries are cached, and only opened again if any of the
+    summary files have been modified since last time. Summary vectors
+    are read lazily by the Summary object.
+
+    Args:
+        datafile: Eclipse DATA file, or basename of the summary files
+
+    Returns:
+        Summary, or None if there are no summary files to open.
+    """
+    mtimes = summary_mtimes(datafile)
+    if mtimes and datafile in _SUMMARY_CACHE:
+        cached_mtimes, summary = _SUMMARY_CACHE[datafile]
+        if cached_mtimes == mtimes:
+            return summary
+        logger.info("Summary files for %s have changed", datafile)
+    try:
+        summary = Summary(datafile)
+    except OSError:
+        return None
+    if mtimes:
+        _SUMMARY_CACHE[datafile] = (mtimes, summary)
+    return summary
+
+
+def load_summaries(datafiles: list[str]) -> list[Summary | None]:
+    """Open the summary files for several Eclipse runs concurrently.
+
+    Args:
+        datafiles: Eclipse DATA files
+
+    Returns:
+        List with a Summary, or None if it could not be opened, for each DATA file.
+    """
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(load_summary, datafiles))
+
+
+def extract_vectors(
+    summaryfiles: list[Summary], vectors: list[str]
+) -> list[dict[str, np.ndarray]]:
+    """Read summary vectors from several summaries concurrently.
+
+    Args:
+        summaryfiles: Summary objects
+        vectors: Summary vectors to read, vectors missing in a summary
+            are skipped for that summary.
+
+    Returns:
+        List with a dictionary from vector name to values for each summary.
+    """
+
+    def _extract(summary: Summary) -> dict[str, np.ndarray]:
+        return {
+            vector: summary.numpy_vector(vector)
+            for vector in vectors
+            if vector in summary
+        }
+
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(_extract, summaryfiles))
+
+
+def load_vectors(
+    datafiles: list[str], summaryfiles: list[Summary], vectors: list[str]
+) -> list[dict[str, np.ndarray]]:
+    """Read summary vectors for plotting from several summaries concurrently.
+
+    Vectors read earlier are cached, and only read again if the summary
+    has been opened again by load_summary() since last time. Wildcards
+    are expanded against the first summary, as in summaryplotter().
+
+    Args:
+        datafiles: Eclipse DATA files, one for each summary
+        summaryfiles: Summary objects
+        vectors: Summary vectors or wildcards to read
+
+    Returns:
+        List with a dictionary from vector name to values for each summary.
+    """
+    if not summaryfiles:
+        return []
+    matchedvectors = [
+        matched for vector in vectors for matched in summaryfiles[0].keys(vector)
+    ]
+
+    def _extract(datafile: str, summary: Summary) -> dict[str, np.ndarray]:
+        if datafile not in _VECTOR_CACHE or _VECTOR_CACHE[datafile][0] is not summary:
+            _VECTOR_CACHE[datafile] = (summary, {})
+        cached = _VECTOR_CACHE[datafile][1]
+        for vector in matchedvectors:
+            if vector not in cached and vector in summary:
+                cached[vector] = summary.numpy_vector(vector)
+        return {vector: cached[vector] for vector in matchedvectors if vector in cached}
+
+    with ThreadPoolExecutor() as executor:
+        return list(executor.map(_extract, datafiles, summaryfiles))
+
+
 def main() -> None:
     """Parse command line, and control user interface."""
 
@@ -641,6 +1162,7 @@ def main() -> None:
         target=summaryplotter,
         kwargs={
             "summaryfiles": summaryfiles,
+            "vectordata": load_vectors(datafiles, summaryfiles, vectors),
             "datafiles": datafiles,
             "vectors": vectors,
             "colourby": args.colourby,
@@ -653,6 +1175,7 @@ def main() -> None:
             "nolegend": args.nolegend,
             "dumpimages": args.dumpimages,
             "ensemblemode": args.ensemblemode,
+            "follow": args.follow,
         },
     )
     plotprocess.start()
@@ -701,10 +1224,22 @@ def restart_plotprocess(
     parameterfiles: list[str],
 ) -> Process:
     stop_process(plotprocess)
+    # Only summaries that have changed on disk are loaded again, and only
+    # their vectors are read again:
+    logger.info("Reloading summary files from disk")
+    loaded = [
+        (datafile, summary)
+        for datafile, summary in zip(datafiles, load_summaries(datafiles), strict=True)
+        if summary is not None
+    ]
+    summaryfiles = [summary for _, summary in loaded]
     new_process = Process(
         target=summaryplotter,
         kwargs={
-            "summaryfiles": None,  # forces reload
+            "summaryfiles": summaryfiles,
+            "vectordata": load_vectors(
+                [datafile for datafile, _ in loaded], summaryfiles, vectors
+            ),
             "datafiles": datafiles,
             "vectors": vectors,
             "colourby": args.colourby,
@@ -717,6 +1252,7 @@ def restart_plotprocess(
             "nolegend": args.nolegend,
             "dumpimages": args.dumpimages,
             "ensemblemode": args.ensemblemode,
+            "follow": args.follow,
         },
     )
     new_process.start()
@@ -9,17 +9,20 @@ hence the name. Later, this library has been merged into opm-common
 import argparse
 import datetime
 import logging
+import sys
 import tempfile
 import textwrap
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
 
 import dateutil.parser
+import numpy as np
 import yaml
+from opm.io.parser import ParseContext, Parser
 from pydantic import BaseModel, FilePath
 
 from subscript import __version__, getLogger
-from subscript.sunsch.time_vector import TimeVector
+from subscript.sunsch.time_vector import TimeVector, error_actions
 
 logger = getLogger(__name__)
 
@@ -122,20 +125,21 @@ def process_sch_config(conf: dict | SunschConfig) -> TimeVector:
 
     if conf.files is not None:
         for conf_filename in conf.files:
-            if sch_file_nonempty(conf_filename):
+            deck = parse_sch_file(conf_filename)
+            if len(deck) > 0:
                 logger.info("Loading %s", conf_filename)
             else:
                 logger.warning("No Eclipse statements in %s, skipping", conf_filename)
                 continue
 
-            file_starts_with_dates = sch_file_starts_with_dates_keyword(conf_filename)
+            file_starts_with_dates = deck[0].name == "DATES"
             timevector = load_timevector_from_file(
-                conf_filename, conf.startdate, file_starts_with_dates
+                conf_filename, conf.startdate, file_starts_with_dates, deck=deck
             )
             if file_starts_with_dates:
-                schedule.load_string(str(timevector))
+                schedule.merge(timevector)
             else:
-                schedule.load_string(str(timevector), conf.starttime)
+                schedule.merge(timevector, conf.starttime)
 
     if conf.insert is not None:
         logger.info("Processing %s insert statements", len(conf.insert))
@@ -169,8 +173,9 @@ def process_sch_config(conf: dict | SunschConfig) -> TimeVector:
             # Do the insertion:
             if date >= conf.starttime:
                 if insert_statement.string is None and filename is not None:
-                    if sch_file_nonempty(filename):
-                        schedule.load(str(filename), date=date)
+                    deck = parse_sch_file(filename)
+                    if len(deck) > 0:
+                        schedule.load_deck(deck, date=date)
                     else:
                         logger.warning(
                             "No Eclipse statements in %s, skipping", filename
@@ -193,27 +198,27 @@ def process_sch_config(conf: dict | SunschConfig) -> TimeVector:
             )
 
     # Clip anything that is beyond the enddate
-    for date in schedule.dates:
-        if date.date() > enddate:
-            schedule.delete(date)
+    schedule.truncate_after(enddate)
 
     # Ensure that the end-date is actually mentioned in the Schedule
     # so that we know Eclipse will actually simulate until this date
-    if enddate not in [x.date() for x in schedule.dates]:
+    if len(schedule) == 0 or schedule[-1].dt.date() != enddate:
         schedule.add_keywords(datetime_from_date(enddate), [""])
 
     # Dategrid is added at the end, in order to support
     # an implicit end-date
     if conf.dategrid:
         dates = dategrid(conf.startdate, enddate, conf.dategrid)
-        for date_ in dates:
-            schedule.add_keywords(datetime_from_date(date_), [""])
+        schedule.add_dates([datetime_from_date(date_) for date_ in dates], [""])
 
     return schedule
 
 
 def load_timevector_from_file(
-    filename: Path, startdate: datetime.date, file_starts_with_dates: bool
+    filename: Path,
+    startdate: datetime.date,
+    file_starts_with_dates: bool,
+    deck: Any = None,  # noqa: ANN401
 ) -> TimeVector:
     """
     Load a timevector from a file, and clip dates that are  earlier than startdate.
@@ -222,54 +227,46 @@ def load_timevector_from_file(
     delete whatever comes before the first DATES. But if the first DATES
     predates startdate, then we delete it.
 
+    Args:
+        filename: Schedule file to load
+        startdate: Dates before this date are clipped away
+        file_starts_with_dates: Whether the first keyword is DATES
+        deck: The file already parsed with parse_sch_file(), the file
+            is parsed if not provided.
+
     Returns:
         opm.tools.TimeVector
     """
+    if deck is None:
+        deck = parse_sch_file(filename)
     tmpschedule = TimeVector(datetime.date(1900, 1, 1))
     if file_starts_with_dates:
-        tmpschedule.load(str(filename))
-        early_dates = [date for date in tmpschedule.dates if date.date() < startdate]
-        if len(early_dates) > 1:
-            logger.info("Clipping away dates: %s", early_dates[1:])
-            for date in early_dates:
-                tmpschedule.delete(date)
+        tmpschedule.load_deck(deck)
     else:
-        tmpschedule.load(str(filename), datetime_from_date(datetime.date(1900, 1, 1)))
-
-        early_dates = [date for date in tmpschedule.dates if date.date() < startdate]
-        if len(early_dates) > 1:
-            logger.info("Clipping away dates: %s", early_dates[1:])
-            for date in early_dates:
-                tmpschedule.delete(date)
+        tmpschedule.load_deck(deck, datetime_from_date(datetime.date(1900, 1, 1)))
+
+    # The first date is the start of tmpschedule, where keywords in front
+    # of the first DATES are kept:
+    early_dates = [date for date in tmpschedule.dates if date.date() < startdate]
+    if len(early_dates) > 1:
+        logger.info("Clipping away dates: %s", early_dates[1:])
+        for date in early_dates[1:]:
+            tmpschedule.delete(date)
     return tmpschedule
 
 
-def sch_file_nonempty(filename: Path) -> bool:
-    """Determine if a file (to be included) has any Eclipse
-    keywords at all (excluding comments)
+def parse_sch_file(filename: Path | str) -> Any:  # noqa: ANN401
+    """Parse a schedule file (to be included) into an OPM deck
 
     Args:
         filename
 
     Returns:
-        bool: False if the file is empty or has only comments.
+        opm.io.Deck, with no keywords if the file is empty or has only comments.
     """
-    # Implementation is by trial and error:
     try:
-        tmpschedule = TimeVector(datetime.date(1900, 1, 1))
-        tmpschedule.load(str(filename))
+        return Parser().parse(str(filename), ParseContext(error_actions))
     except IndexError as err:
-        if (
-            "vector::_M_range_check: __n (which is 0) >= this->size() (which is 0)"
-            in str(err)
-        ):
-            # This is what we get from opm>=2022.04 for empty files.
-            return False
-
-        if "Keyword index 0 is out of range" in str(err):
-            # This is what we get from opm<2022.04 for empty files.
-            return False
-
         # Try to workaround a non-explanatory error from opm-common:
         if "map::at" in str(err):
             logger.error("Error happened while parsing %s", filename)
@@ -284,11 +281,18 @@ def sch_file_nonempty(filename: Path) -> bool:
         logger.error(err)
         raise SystemExit from err
 
-    except ValueError:
-        # This is where we get for files not starting with DATES,
-        # but that means it is nonempty
-        return True
-    return True
+
+def sch_file_nonempty(filename: Path) -> bool:
+    """Determine if a file (to be included) has any Eclipse
+    keywords at all (excluding comments)
+
+    Args:
+        filename
+
+    Returns:
+        bool: False if the file is empty or has only comments.
+    """
+    return len(parse_sch_file(filename)) > 0
 
 
 def sch_file_starts_with_dates_keyword(filename: Path) -> bool:
@@ -306,14 +310,8 @@ def sch_file_starts_with_dates_keyword(filename: Path) -> bool:
     Returns:
         bool: true if first keyword is DATES
     """
-    # Implementation is by trial and error:
-    try:
-        # Test if it has DATES
-        tmpschedule = TimeVector(datetime.date(1900, 1, 1))
-        tmpschedule.load(str(filename))
-    except ValueError:
-        return False
-    return True
+    deck = parse_sch_file(filename)
+    return len(deck) > 0 and deck[0].name == "DATES"
 
 
 def substitute(insert_statement: InsertStatement) -> Path:
@@ -401,6 +399,34 @@ def wrap_long_lines(string: str, maxchars: int = 128, warn: bool = True) -> str:
     return wrappedstr.strip()
 
 
+def wrap_keyword(string: str, maxchars: int = 128, warn: bool = True) -> str:
+    """Wrap long lines in the string representation of a single keyword.
+
+    This is wrap_long_lines() for use when writing one keyword at a time,
+    whitespace around the keyword is kept.
+
+    Args:
+        string (str): Multiline string to be possibly wrapped
+        maxchars (int): Maximal length of each line
+        warn (bool): Whether to log a warning for each line
+            of excessive length
+
+    Returns:
+        str: Multiline string with no lines more than maxchars in length.
+    """
+    if all(len(line) <= maxchars for line in string.splitlines()):
+        return string
+    stripped = string.strip()
+    if not stripped:
+        return string
+    start = string.index(stripped)
+    return (
+        string[:start]
+        + wrap_long_lines(stripped, maxchars=maxchars, warn=warn)
+        + string[start + len(stripped) :]
+    )
+
+
 def dategrid(
     startdate: datetime.date, enddate: datetime.date, interval: str
 ) -> list[datetime.date]:
@@ -416,32 +442,31 @@ def dategrid(
         list of datetime.date. Always includes start-date, might not include end-date
     """
     dates = [startdate]
-    date = startdate + datetime.timedelta(days=1)
-    startdateweekday = startdate.weekday()
-
-    # Brute force implementation by looping over all possible
-    # days. This is robust with respect to all possible date oddities,
-    # but makes it difficult to support more interval types.
-    while date <= enddate:
-        if interval == "monthly":
-            if date.day == 1:
-                dates.append(date)
-        elif interval == "bimonthly":
-            if date.day == 1 and date.month % 2 == 1:
-                dates.append(date)
-        elif interval == "weekly":
-            if date.weekday() == startdateweekday:
-                dates.append(date)
-        elif interval == "biweekly":
-            weeknumber = date.isocalendar()[1]
-            if date.weekday() == startdateweekday and weeknumber % 2 == 1:
-                dates.append(date)
-        elif interval == "yearly":
-            if date.day == 1 and date.month == 1:
-                dates.append(date)
-        elif interval == "daily":
-            dates.append(date)
-        date += datetime.timedelta(days=1)
+
+    # Only the matching dates after startdate are generated, by stepping
+    # days, weeks or months:
+    if interval in {"daily", "weekly", "biweekly"}:
+        step = 1 if interval == "daily" else 7
+        days = np.arange(
+            np.datetime64(startdate, "D") + step,
+            np.datetime64(enddate, "D") + 1,
+            step,
+        ).tolist()
+        if interval == "biweekly":
+            days = [date for date in days if date.isocalendar()[1] % 2 == 1]
+        dates.extend(days)
+    elif interval in {"monthly", "bimonthly", "yearly"}:
+        # Months counted from year 0, starting at the month after startdate:
+        for months in range(
+            startdate.year * 12 + startdate.month, enddate.year * 12 + enddate.month
+        ):
+            year, month = divmod(months, 12)
+            if (
+                interval == "monthly"
+                or (interval == "bimonthly" and month % 2 == 0)
+                or (interval == "yearly" and month == 0)
+            ):
+                dates.append(datetime.date(year, month + 1, 1))
     return dates
 
 
@@ -572,17 +597,18 @@ def main() -> None:
     if args.debug and config.output != __MAGIC_STDOUT__:
         logger.setLevel(logging.DEBUG)
 
-    # Generate the schedule section, as a string:
-    schedule = wrap_long_lines(str(process_sch_config(config)), maxchars=128, warn=True)
+    # Generate the schedule section, and write it one keyword at a time:
+    schedule = process_sch_config(config)
 
     if config.output == __MAGIC_STDOUT__:
-        print(schedule)
+        schedule.write(sys.stdout, formatter=wrap_keyword)
     else:
         logger.info("Writing Eclipse deck to %s", config.output)
         dirname = Path(config.output).parent
         if dirname and not dirname.exists():
             raise OSError(f"The directory {dirname} does not exist")
-        Path(config.output).write_text(schedule, encoding="utf8")
+        with open(config.output, "w", encoding="utf8") as fileobj:
+            schedule.write(fileobj, formatter=wrap_keyword)
 
 
 if __name__ == "__main__":
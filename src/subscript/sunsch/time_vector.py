@@ -1,6 +1,8 @@
 # To be removed once the OPM version of this file is updated
 
+import bisect
 import datetime
+import heapq
 from io import StringIO
 from operator import attrgetter
 
@@ -89,6 +91,7 @@ class TimeStep:
         self.keywords = keywords
         self.tstep = None
         self.is_start = False
+        self._keyword_strings = []
 
     @classmethod
     def create_first(cls, dt):
@@ -105,34 +108,57 @@ class TimeStep:
     def __contains__(self, arg):
         return any(arg == kw.name for kw in self.keywords)
 
-    def __str__(self):
-        string = StringIO()
+    def keyword_strings(self):
+        """Will return the string representation of each keyword.
+
+        The strings are cached, so that keywords which are not replaced are
+        only stringified once.
+
+        """
+        if len(self._keyword_strings) > len(self.keywords):
+            del self._keyword_strings[len(self.keywords) :]
+        for index, kw in enumerate(self.keywords):
+            if index == len(self._keyword_strings):
+                self._keyword_strings.append((kw, str(kw)))
+            elif self._keyword_strings[index][0] is not kw:
+                self._keyword_strings[index] = (kw, str(kw))
+        return [string for _, string in self._keyword_strings]
 
+    def write(self, fileobj, formatter=None):
+        """Will write the string representation of the timestep to a file object.
+
+        The optional formatter is a function applied to the string of each
+        keyword before it is written.
+
+        """
         if not self.is_start:
             day = self.dt.day
             month = self.dt.month
             year = self.dt.year
             if not self.dt.time():
-                string.write(f"DATES\n  {day} '{inv_ecl_month[month]}' {year}/\n/\n\n")
+                fileobj.write(f"DATES\n  {day} '{inv_ecl_month[month]}' {year}/\n/\n\n")
             else:
                 hour = self.dt.hour
                 minute = self.dt.minute
                 second = self.dt.second + self.dt.microsecond * 1.0e-6
                 if self.dt.microsecond > 0:
-                    string.write(
+                    fileobj.write(
                         f"DATES\n  {day} '{inv_ecl_month[month]}' {year}"
                         f" {hour:02d}:{minute:02d}:{second:07.4f} /\n/\n\n"
                     )
                 else:
-                    string.write(
+                    fileobj.write(
                         f"DATES\n  {day} '{inv_ecl_month[month]}' {year}"
                         f" {hour:02d}:{minute:02d}:{int(second):02d} /\n/\n\n"
                     )
 
-        for kw in self.keywords:
-            string.write(str(kw))
-            string.write("\n")
+        for string in self.keyword_strings():
+            fileobj.write(formatter(string) if formatter else string)
+            fileobj.write("\n")
 
+    def __str__(self):
+        string = StringIO()
+        self.write(string)
         return string.getvalue()
 
 
@@ -290,14 +316,30 @@ class TimeVector:
 
     def _add_dates_block(self, ts):
         self.time_steps_dict[ts.dt] = ts
-        self.time_steps_list.append(ts)
+        bisect.insort(self.time_steps_list, ts, key=attrgetter("dt"))
 
     def delete(self, dt):
         del self.time_steps_dict[dt]
-        for index, ts in enumerate(self.time_steps_list):
-            if ts.dt == dt:
-                del self.time_steps_list[index]
-                break
+        index = bisect.bisect_left(self.time_steps_list, dt, key=attrgetter("dt"))
+        del self.time_steps_list[index]
+
+    def truncate_after(self, dt):
+        """Will delete all timesteps after dt.
+
+        If dt is a datetime.date instance, timesteps at any time of that day
+        are kept.
+
+        """
+        if not isinstance(dt, datetime.datetime):
+            dt = datetime.datetime(dt.year, dt.month, dt.day) + datetime.timedelta(
+                days=1
+            )
+            index = bisect.bisect_left(self.time_steps_list, dt, key=attrgetter("dt"))
+        else:
+            index = bisect.bisect_right(self.time_steps_list, dt, key=attrgetter("dt"))
+        for ts in self.time_steps_list[index:]:
+            del self.time_steps_dict[ts.dt]
+        del self.time_steps_list[index:]
 
     def add_keywords(self, dt, keywords):
         if dt < self.start_date:
@@ -310,7 +352,36 @@ class TimeVector:
         else:
             ts = TimeStep(dt, keywords)
             self._add_dates_block(ts)
-            self.time_steps_list.sort(key=attrgetter("dt"))
+
+    def add_dates(self, dates, keywords=()):
+        """Will add the keywords at each of the dates in one operation.
+
+        Each date gets its own copy of the keywords list, for dates already
+        in the vector the keywords are appended. This is equivalent to, but
+        faster than, calling add_keywords() for each date.
+
+        """
+        new_steps = {}
+        for dt in dates:
+            if dt < self.start_date:
+                raise ValueError(f"Invalid datetime argument: {dt}")
+            if dt in self.time_steps_dict:
+                for kw in keywords:
+                    self.time_steps_dict[dt].add_keyword(kw)
+            elif dt in new_steps:
+                for kw in keywords:
+                    new_steps[dt].add_keyword(kw)
+            else:
+                new_steps[dt] = TimeStep(dt, list(keywords))
+
+        self.time_steps_dict.update(new_steps)
+        self.time_steps_list = list(
+            heapq.merge(
+                self.time_steps_list,
+                sorted(new_steps.values(), key=attrgetter("dt")),
+                key=attrgetter("dt"),
+            )
+        )
 
     def _add_deck(self, deck, start_date):
         first_kw = deck[0]
@@ -381,6 +452,32 @@ class TimeVector:
         deck = Parser().parse_string(deck_string, parse_context)
         self._add_deck(deck, date)
 
+    def load_deck(self, deck, date=None):
+        """
+        Like load() - but load from an already parsed deck.
+        """
+        self._add_deck(deck, date)
+
+    def merge(self, other, date=None):
+        """Will add the keywords from all timesteps in another TimeVector.
+
+        This gives the same result as loading the string representation of
+        the other vector, without writing and parsing it again. Keywords in
+        the first timestep of the other vector, in front of its first DATES
+        keyword, are added at the date argument.
+
+        """
+        for ts in other:
+            if not ts.is_start:
+                self.add_keywords(ts.dt, list(ts.keywords))
+            elif ts.keywords:
+                if date is None:
+                    raise ValueError(
+                        "When merging you must specify date for keywords"
+                        " in front of the first DATES keyword"
+                    )
+                self.add_keywords(date, list(ts.keywords))
+
     def __str__(self):
         """Will return a string representation of the vector.
 
@@ -390,11 +487,20 @@ class TimeVector:
         """
 
         string = StringIO()
-        for ts in self:
-            string.write(str(ts))
-
+        self.write(string)
         return string.getvalue()
 
+    def write(self, fileobj, formatter=None):
+        """Will write the vector to a file object, one timestep at a time.
+
+        This gives the same content as str(), without holding the whole
+        schedule in memory. The optional formatter is a function applied
+        to the string of each keyword before it is written.
+
+        """
+        for ts in self:
+            ts.write(fileobj, formatter)
+
     @property
     def dates(self):
         """
@@ -4,6 +4,7 @@ from pathlib import Path
 import numpy as np
 import pandas as pd
 import pytest
+import res2df
 from matplotlib import pyplot
 
 from subscript.check_swatinit.check_swatinit import (
@@ -17,9 +18,13 @@ from subscript.check_swatinit.check_swatinit import (
     __WATER__,
     _evaluate_pc,
     compute_pc,
+    glob_datafiles,
     main,
     merge_equil,
+    merge_pc_max,
+    ppcwmax_gridvector,
     qc_flag,
+    qc_tables,
     qc_volumes,
     reorder_dframe_for_nonnans,
 )
@@ -368,6 +373,10 @@ def test_qc_volumes(propslist, expected_dict):
         ([0.5], [1], [0.3], [0.5], [0]),
         ([0.1], [1], None, [0.5], [3]),
         ([0.1], [1], [0], [0.9], [3 - 1 / 3]),
+        # Many cells with individual scaling in one call:
+        ([0.1, 0.55, 1], [1, 2, 1], [0.1, 0, 0], [1, 1, 0.9], [3, 3 - 3 / 10.0, 0]),
+        # Collapsed scaled saturation axis, SWL == SWU:
+        ([0.2, 0.5, 0.6], [1, 1, 1], [0.5, 0.5, 0.5], [0.5, 0.5, 0.5], [3, 0, 0]),
     ],
 )
 def test_evaluate_pc(swats, scale_vert, swls, swus, expected_pc):
@@ -451,6 +460,41 @@ def test_merge_equil(gridlist, equillist, expected):
     )
 
 
+def test_merge_pc_max():
+    """Test that the maximal capillary pressure pr. SATNUM is looked up for
+    each cell, and that cells without saturation functions are dropped"""
+    satfunc_df = pd.DataFrame(
+        [
+            {"SATNUM": 1, "SW": 0.1, "PCOW": 3},
+            {"SATNUM": 1, "SW": 1, "PCOW": 0},
+            {"SATNUM": 2, "SW": 0.2, "PCOW": 5},
+            {"SATNUM": 2, "SW": 1, "PCOW": 1},
+        ]
+    )
+    grid_df = pd.DataFrame({"SATNUM": [2, 1, 2]})
+    assert merge_pc_max(grid_df, satfunc_df)["PCOW_MAX"].tolist() == [5, 3, 5]
+
+    grid_df = pd.DataFrame({"SATNUM": [3, 1], "SWAT": [0.5, 0.6]})
+    pd.testing.assert_frame_equal(
+        merge_pc_max(grid_df, satfunc_df),
+        pd.DataFrame({"SATNUM": [1], "SWAT": [0.6], "PCOW_MAX": [3.0]}),
+    )
+
+
+def test_ppcwmax_gridvector(mocker):
+    """Test that PPCWMAX pr. SATNUM in the deck is mapped to each cell"""
+    eclfiles = mocker.Mock()
+    eclfiles.get_deck.return_value = res2df.ResdataFiles.str2deck(
+        "RUNSPEC\nTABDIMS\n 2 /\nPROPS\nPPCWMAX\n 4 NO /\n 9 NO /\n"
+    )
+    assert ppcwmax_gridvector(eclfiles, np.array([2, 1, 1, 2])).tolist() == [
+        9,
+        4,
+        4,
+        9,
+    ]
+
+
 SATFUNC_DF = pd.DataFrame([{"SW": 0.1, "PCOW": 3}, {"SW": 1, "PCOW": 0}]).assign(
     SATNUM=1
 )
@@ -541,6 +585,122 @@ def test_eqlnum2(tmp_path, mocker, monkeypatch):
         main()
 
 
+def test_glob_datafiles(tmp_path, monkeypatch):
+    """Test expansion of DATA file patterns for batch mode"""
+    monkeypatch.chdir(tmp_path)
+    for real in [1, 0, 10]:
+        Path(f"realization-{real}").mkdir()
+        Path(f"realization-{real}/FOO.DATA").touch()
+    assert glob_datafiles(["realization-*/FOO.DATA"]) == [
+        "realization-0/FOO.DATA",
+        "realization-1/FOO.DATA",
+        "realization-10/FOO.DATA",
+    ]
+    assert glob_datafiles(["BAR.DATA", "realization-1/*.DATA", "BAR.DATA"]) == [
+        "BAR.DATA",
+        "realization-1/FOO.DATA",
+    ]
+    assert not glob_datafiles(["realization-*/BAR.DATA"])
+
+
+def test_qc_tables_cache(mocker):
+    """Decks with identical saturation functions and EQUIL share tables"""
+    tables = """RUNSPEC
+OIL
+WATER
+TABDIMS
+ 1 /
+PROPS
+SWOF
+0.1 0 1 3
+1.0 1 0 0
+/
+SOLUTION
+EQUIL
+ 1000 200 1200 0 0 0 0 0 0 /
+"""
+    satfunc_spy = mocker.spy(res2df.satfunc, "df")
+    satfunc_df, equil_df = qc_tables(
+        res2df.ResdataFiles.str2deck(tables.replace("OIL", "OIL\nDIMENS\n 1 1 1 /"))
+    )
+    assert satfunc_df["PCOW"].max() == 3
+    assert equil_df["OWC"].to_numpy()[0] == 1200
+    assert satfunc_spy.call_count == 1
+
+    qc_tables(
+        res2df.ResdataFiles.str2deck(tables.replace("OIL", "OIL\nDIMENS\n 2 2 2 /"))
+    )
+    assert satfunc_spy.call_count == 1
+
+    qc_tables(res2df.ResdataFiles.str2deck(tables.replace("1200", "1300")))
+    assert satfunc_spy.call_count == 2
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch(workers, tmp_path, mocker, monkeypatch):
+    """Test batch mode on several (mocked) realizations"""
+    monkeypatch.chdir(tmp_path)
+    for real in range(3):
+        Path(f"realization-{real}").mkdir()
+        Path(f"realization-{real}/FOO-{real}.DATA").touch()
+
+    def mocked_gridframe(eclfiles):
+        real = int(str(eclfiles.get_path())[-1])
+        if real == 2:
+            raise ValueError("Broken realization")
+        return pd.DataFrame(
+            [
+                {
+                    "SWATINIT": 0.5,
+                    "SWAT": 0.5 + real / 10,
+                    "PORV": 100,
+                    "QC_FLAG": __HC_BELOW_FWL__,
+                }
+            ]
+        )
+
+    mocker.patch(
+        "subscript.check_swatinit.check_swatinit.check_applicability",
+        return_value=None,
+    )
+    mocker.patch(
+        "subscript.check_swatinit.check_swatinit.make_qc_gridframe",
+        side_effect=mocked_gridframe,
+    )
+    mocker.patch(
+        "sys.argv",
+        [
+            "check_swatinit",
+            "realization-*/*.DATA",
+            "--volumes",
+            "volumes.csv",
+            "--outputdir",
+            "grids",
+            "--workers",
+            str(workers),
+        ],
+    )
+    main()
+    volumes = pd.read_csv("volumes.csv")
+    assert volumes["DATAFILE"].tolist() == [
+        "realization-0/FOO-0.DATA",
+        "realization-1/FOO-1.DATA",
+        "realization-2/FOO-2.DATA",
+    ]
+    assert volumes["REAL"].tolist() == [0, 1, 2]
+    assert np.allclose(volumes["SWAT_WVOL"].to_numpy()[0:2], [50, 60])
+    assert np.allclose(volumes[__HC_BELOW_FWL__].to_numpy()[0:2], [0, 10])
+    assert volumes.iloc[2, 2:].isna().all()
+    assert sorted(path.name for path in Path("grids").iterdir()) == [
+        "FOO-0.csv",
+        "FOO-1.csv",
+    ]
+
+    mocker.patch("sys.argv", ["check_swatinit", "realization-*/*.DATA", "--plot"])
+    with pytest.raises(SystemExit, match="not supported for several DATA files"):
+        main()
+
+
 @pytest.mark.parametrize(
     "inputrows, expected",
     [
@@ -363,6 +363,21 @@ def test_cvs2volstr():
     assert len(dupdata) == len(data)
 
 
+def test_write_vol(tmp_path, monkeypatch):
+    """Test that writing to a file handle gives the same as df2vol()"""
+    data = csv2ofmvol.read_pdm_csv_files([PRODDATA_A4, PRODDATA_A3])
+    with open(tmp_path / "out.vol", "w", encoding="utf8") as outfile:
+        linecount = csv2ofmvol.write_vol(data, outfile)
+    volstr = (tmp_path / "out.vol").read_text(encoding="utf8")
+    assert volstr == csv2ofmvol.df2vol(data)
+    assert linecount == len(volstr.splitlines()) == 13
+    assert volstr.index("*NAME A-3") < volstr.index("*NAME A-4")
+
+    # Formatting in chunks that split wells gives the same output:
+    monkeypatch.setattr(csv2ofmvol, "VOL_CHUNKSIZE", 2)
+    assert csv2ofmvol.df2vol(data) == volstr
+
+
 def test_main(datadir, mocker):
     """Test command line interface"""
     # Test installation
@@ -399,6 +414,7 @@ def test_emptyfile(tmp_path, monkeypatch):
     Path("indexcols.csv").write_text("DATE,WELL", encoding="utf8")
     with pytest.raises(ValueError, match="No supported data columns provided"):
         csv2ofmvol.csv2ofmvol_main("indexcols.csv", "columns.vol")
+    assert not Path("columns.vol").exists()
 
     # CSV file with index columns and one data column
     Path("oilcol.csv").write_text("DATE,WELL,OIL", encoding="utf8")
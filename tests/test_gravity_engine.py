@@ -0,0 +1,129 @@
+import datetime
+
+import numpy as np
+import pytest
+
+from subscript.gravity_engine import gravity_engine
+
+
+def test_eval_gravity(monkeypatch):
+    """Test the gravity kernel against the field from a single point mass"""
+    cells = np.array([[0.0, 0.0, 1000.0], [500.0, 0.0, 2000.0]])
+    stations = np.array([[0.0, 0.0, 0.0], [300.0, 400.0, 100.0], [0.0, 0.0, 50.0]])
+    delta_mass = np.array([[1e9, 0.0], [0.0, 2e9]])
+
+    dgsim = gravity_engine.eval_gravity(cells, delta_mass, stations)
+    assert dgsim.shape == (3, 2)
+    assert dgsim[0, 0] == pytest.approx(gravity_engine.GRAV_CONSTANT * 1e9 / 1000**2)
+    assert dgsim[1, 0] == pytest.approx(
+        gravity_engine.GRAV_CONSTANT * 1e9 * 900 / (500**2 + 900**2) ** 1.5
+    )
+
+    # Station blocking does not change the result
+    monkeypatch.setattr(gravity_engine, "KERNEL_BLOCKSIZE", 1)
+    np.testing.assert_allclose(
+        gravity_engine.eval_gravity(cells, delta_mass, stations), dgsim
+    )
+    np.testing.assert_allclose(
+        gravity_engine.eval_gravity(cells, delta_mass[:, 1], stations), dgsim[:, 1]
+    )
+
+    # No stations gives empty results
+    no_stations = gravity_engine.eval_gravity(cells, delta_mass, np.zeros((0, 3)))
+    assert no_stations.shape == (0, 2)
+
+
+@pytest.mark.parametrize("poisson_ratio", [0.0, 0.25, 0.45])
+def test_eval_geertsma(poisson_ratio, monkeypatch):
+    """Test the Geertsma kernel against the surface solution for a point source"""
+    cells = np.array([[0.0, 0.0, 1100.0]])
+    stations = np.array([[0.0, 0.0, 0.0], [300.0, 0.0, 0.0], [300.0, 0.0, 100.0]])
+    seabed = np.array([100.0, 100.0, 100.0])
+    delta_porv = np.array([1000.0])
+
+    subsidence = gravity_engine.eval_geertsma(
+        cells, delta_porv, stations, seabed, poisson_ratio
+    )
+    # At the seabed the image terms reduce to (1 - nu) / pi * dV * D / R**3
+    for station, expected_distance2 in [(0, 1000**2), (1, 1000**2 + 300**2)]:
+        assert subsidence[station] == pytest.approx(
+            (1 - poisson_ratio) / np.pi * 1000 * 1000 / expected_distance2**1.5
+        )
+
+    monkeypatch.setattr(gravity_engine, "KERNEL_BLOCKSIZE", 1)
+    np.testing.assert_allclose(
+        gravity_engine.eval_geertsma(
+            cells, delta_porv, stations, seabed, poisson_ratio
+        ),
+        subsidence,
+    )
+
+    # No stations gives empty results
+    no_stations = gravity_engine.eval_geertsma(
+        cells, delta_porv, np.zeros((0, 3)), np.zeros(0), poisson_ratio
+    )
+    assert no_stations.shape == (0,)
+
+
+def test_survey_cache(mocker):
+    """Test that each survey date is read once, also when shared by diffdates"""
+    grid = mocker.MagicMock()
+    grid.get_num_active.return_value = 3
+    grid.export_position.return_value = np.tile([0.0, 0.0, 1000.0], (3, 1))
+    init = mocker.MagicMock()
+    init.__contains__.return_value = False
+    rest = mocker.MagicMock()
+    rest.dates = [datetime.datetime(2018, 1, 1), datetime.datetime(2020, 7, 1)]
+    rest.restart_view.side_effect = lambda index: index
+    mocker.patch.object(
+        gravity_engine,
+        "phase_masses",
+        side_effect=lambda rsb, *_: {
+            "oil": np.arange(3.0) + rsb,
+            "gas": np.full(3, -rsb),
+        },
+    )
+    mocker.patch.object(
+        gravity_engine, "_restart_array", side_effect=lambda rsb, _: np.full(3, rsb)
+    )
+
+    engine = gravity_engine.GravityEngine(grid, init, rest)
+    assert engine.restart_index == {"20180101": 0, "20200701": 1}
+    diffdates = [("20200701", "20180101"), ("20180101", "20200701")]
+    np.testing.assert_array_equal(
+        engine.subsidence(
+            np.array([[0.0, 0.0, 0.0]]), np.array([0.0]), diffdates, 0.25
+        ).shape,
+        (1, 2),
+    )
+    assert rest.restart_view.call_count == 2
+
+    assert list(engine.survey("20200701")) == ["oil", "gas", "porv"]
+    delta_mass = gravity_engine.delta_mass_by_phase(
+        engine.survey("20180101"), engine.survey("20200701"), ["gas", "oil", "total"]
+    )
+    np.testing.assert_array_equal(delta_mass, np.tile([-1, 1, 0], (3, 1)))
+    assert rest.restart_view.call_count == 2
+
+
+@pytest.mark.parametrize("workers", [1, 2, 3])
+def test_eval_tiled(workers):
+    """Test that splitting the stations over worker processes gives the same
+    result as evaluating them in one go"""
+    rng = np.random.default_rng(seed=1)
+    cells = rng.uniform(0, 1000, size=(50, 3)) + np.array([0, 0, 1000])
+    stations = rng.uniform(0, 1000, size=(7, 3)) * np.array([1, 1, 0.1])
+    delta_porv = rng.normal(size=50)
+
+    np.testing.assert_allclose(
+        gravity_engine.eval_tiled(
+            gravity_engine.eval_geertsma,
+            cells,
+            delta_porv,
+            stations,
+            stations[:, 2],
+            0.3,
+            workers=workers,
+        ),
+        gravity_engine.eval_geertsma(cells, delta_porv, stations, stations[:, 2], 0.3),
+    )
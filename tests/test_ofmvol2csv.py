@@ -468,6 +468,33 @@ def test_cmdline_globbing(datadir):
     pd.testing.assert_frame_equal(output, output_alt)
 
 
+@pytest.mark.parametrize("jobs", [0, 2])
+def test_jobs(datadir, jobs):
+    """Test that parsing vol files in a process pool gives the same result
+    as parsing them serially"""
+    ofmvol2csv.ofmvol2csv_main("file*.vol", "serial.csv", includefileorigin=True)
+    ofmvol2csv.ofmvol2csv_main(
+        "file*.vol", "parallel.csv", includefileorigin=True, jobs=jobs
+    )
+    pd.testing.assert_frame_equal(
+        pd.read_csv("serial.csv"), pd.read_csv("parallel.csv")
+    )
+
+
+def test_negative_jobs(datadir, mocker, capsys):
+    """Test that a negative number of processes is rejected"""
+    with pytest.raises(ValueError, match="jobs must be 0 or a positive number"):
+        ofmvol2csv.ofmvol2csv_main("file*.vol", "volfiles.csv", jobs=-1)
+
+    mocker.patch("sys.argv", ["ofmvol2csv", "--jobs", "-1", "file*.vol"])
+    with pytest.raises(SystemExit):
+        ofmvol2csv.main()
+    assert "must be 0 (all available CPUs) or a positive number" in (
+        capsys.readouterr().err
+    )
+    assert not Path("volfiles.csv").exists()
+
+
 def test_no_files(tmp_path, monkeypatch):
     """Test what happens when input does not exist"""
     monkeypatch.chdir(tmp_path)
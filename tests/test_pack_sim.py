@@ -1,4 +1,5 @@
 import filecmp
+import json
 import os
 import shutil
 import subprocess
@@ -74,6 +75,42 @@ def test_repeated_run(tmp_path, mocker, monkeypatch):
         pack_sim.main()
 
 
+def test_dedup(tmp_path, mocker, monkeypatch):
+    """Test that identical include files are stored once, and that packing
+    again with --dedup only rewrites changed files"""
+    monkeypatch.chdir(tmp_path)
+    Path("src").mkdir()
+    Path("src/a.inc").write_text("PORO\n 100*0.2 /\n", encoding="utf8")
+    Path("src/b.inc").write_text("PORO\n 100*0.2 /\n", encoding="utf8")
+    Path("src/CASE.DATA").write_text(
+        "GRID\nINCLUDE\n 'a.inc' /\nINCLUDE\n 'b.inc' /\n", encoding="utf8"
+    )
+    mocker.patch(
+        "sys.argv", ["pack_sim", "src/CASE.DATA", "packed", "--dedup", "--workers", "2"]
+    )
+    pack_sim.main()
+
+    assert Path("packed/include/a.inc").samefile("packed/include/b.inc")
+    manifest = json.loads(Path("packed/manifest.json").read_text(encoding="utf8"))
+    assert set(manifest) == {"include/a.inc", "include/b.inc"}
+    assert manifest["include/a.inc"]["sha256"] == manifest["include/b.inc"]["sha256"]
+
+    # Packing again keeps unchanged files, and updates changed ones:
+    packed_inode = Path("packed/include/a.inc").stat().st_ino
+    Path("src/b.inc").write_text("PORO\n 100*0.3 /\n", encoding="utf8")
+    pack_sim.main()
+
+    assert Path("packed/include/a.inc").stat().st_ino == packed_inode
+    assert Path("packed/include/a.inc").read_text(encoding="utf8") == (
+        "PORO\n 100*0.2 /\n"
+    )
+    assert Path("packed/include/b.inc").read_text(encoding="utf8") == (
+        "PORO\n 100*0.3 /\n"
+    )
+    assert not Path("packed/include/a.inc").samefile("packed/include/b.inc")
+    assert "include/b.inc" in Path("packed/CASE.DATA").read_text(encoding="utf8")
+
+
 @pytest.mark.parametrize(
     "injected, expectedwarning",
     [
@@ -125,6 +162,37 @@ def test_binary_file_detection(tmp_path, monkeypatch):
     assert filecmp.cmp(f"{ECLDIR}/{egrid_file}", f"{packing_path}/include/{egrid_file}")
 
 
+@pytest.mark.parametrize(
+    "contents, fmu, expected",
+    [
+        (b"", False, True),
+        (b"PORO\n 0.1 0.2 /\n", False, True),
+        (b"PORO\n 0.1 0.2 /", True, True),
+        (b"PORO -- comment\n 0.1 0.2 /\n", False, True),
+        (b"PORO\r\n 0.1 0.2 /\r\n", False, False),
+        (b"-- C:\\rock\n", False, False),
+        (b"TITLE\nSm\xc3\xb8rbukk\n", False, False),
+        (b"-- Comment\nINCLUDE\n 'foo.inc' /\n", False, False),
+        (b"import\n 'foo.inc' /\n", False, False),
+        (b"  INCLUDE\n 'foo.inc' /\n", False, True),
+        (b"1 2 3 /\n  RESTART -- comment\n", False, False),
+        (b"USEFLUX\n", False, False),
+        (b"  GRID\n", False, True),
+        (b"  GRID\n", True, False),
+    ],
+)
+def test_inspection_is_noop(contents, fmu, expected, tmp_path):
+    """Test detection of include files that can be copied instead of inspected"""
+    include_file = tmp_path / "foo.inc"
+    include_file.write_bytes(contents)
+    assert pack_sim._inspection_is_noop(include_file, fmu) is expected
+    if expected:
+        (tmp_path / "packed" / "include").mkdir(parents=True)
+        assert pack_sim.inspect_file(
+            include_file, tmp_path, tmp_path / "packed", {}, fmu=fmu
+        ) == contents.decode("ascii")
+
+
 def test_empty_file_inspection(tmp_path, monkeypatch):
     """Test that an empty include file is inspected correctly"""
 
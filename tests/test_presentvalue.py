@@ -279,6 +279,18 @@ def test_calc_pv_irr():
     assert presentvalue.calc_pv_irr(results["IRR"] * 2, IRR_DF, 2100) < 0.0
 
 
+def test_calc_irr():
+    """Test the internal rate of return for several cash flows at once"""
+    irr = presentvalue.calc_irr(
+        np.array([[-1, 1.2, 0], [-1, 0, 1.21], [-1, 0, 0], [-1, 2, 0]]),
+        np.array([[0, 1, 2], [0, 1, 2], [0, 1, 2], [0, 0, 0]]),
+        np.array([True, True, True, False]),
+    )
+    assert np.allclose(irr[:2], [20, 10])
+    # No income, or only one year, gives no rate:
+    assert np.isnan(irr[2:]).all()
+
+
 def test_main(tmp_path, mocker, monkeypatch):
     """Test the main functionality of presentvalue as endpoint script, writing
     back results to parameters.txt in the original runpath"""
@@ -390,6 +402,189 @@ def test_no_oil(tmp_path, monkeypatch):
     )
 
 
+@pytest.mark.parametrize("discountto, cutoffyear", [(2022, 2100), (2026, 2030)])
+def test_presentvalue_ensemble(discountto, cutoffyear):
+    """Test that computing for an ensemble gives the same results as for
+    each realization by itself"""
+    rng = np.random.default_rng(seed=1)
+    summaries = [
+        pd.DataFrame(
+            {
+                "OPR": rng.uniform(0, 1e5, nyears) * (real != 3),
+                "GSR": rng.uniform(-1e7, 1e8, nyears),
+            },
+            index=pd.Index(range(startyear, startyear + nyears), name="YEAR"),
+        )
+        for real, (startyear, nyears) in enumerate(
+            [(2020, 10), (2022, 1), (2018, 20), (2025, 6), (2015, 5)]
+        )
+    ]
+    econ_df = pd.DataFrame(
+        columns=ECONCOLS,
+        data=[
+            [2022, 60, 1.7, 10, 1000, 8],
+            [2024, 70, 2.0, 9, 100, 8],
+            [2030, 65, 1.5, 9.5, 0, 8],
+        ],
+    ).set_index("year")
+
+    results = presentvalue.presentvalue_ensemble(
+        summaries, econ_df, discountto=discountto, cutoffyear=cutoffyear
+    )
+    assert len(results) == len(summaries)
+    for summary_df, result in zip(summaries, results, strict=True):
+        if max(summary_df.index) < discountto:
+            assert result == {"PresentValue": 0}
+            continue
+        pv_df = presentvalue.calc_presentvalue_df(summary_df, econ_df, discountto)
+        expected = {
+            "PresentValue": pv_df.loc[: cutoffyear - 1]["presentvalue"].sum()
+            / presentvalue.NOKUNIT
+        }
+        expected.update(presentvalue.calculate_financials(pv_df, cutoffyear))
+        assert list(result) == list(expected)
+        for key, value in expected.items():
+            assert np.isclose(result[key], value)
+
+
+def test_main_ensemble(tmp_path, mocker, monkeypatch):
+    """Test computing several DATA files together, with a results table"""
+    for real in range(3):
+        (tmp_path / f"realization-{real}").mkdir()
+        smry = pd.DataFrame(
+            [
+                {"DATE": "2030-01-01", "FOPT": 0, "FGPT": 0},
+                {"DATE": "2031-01-01", "FOPT": 1000 * real, "FGPT": 0},
+                {"DATE": "2032-01-01", "FOPT": 3000 * real, "FGPT": 1e6},
+            ]
+        )
+        smry["DATE"] = pd.to_datetime(smry["DATE"])
+        monkeypatch.chdir(tmp_path / f"realization-{real}")
+        Summary.fwrite(res2df.summary.df2ressum(smry, "ENS"))
+        Path("parameters.txt").write_text("", encoding="utf8")
+    monkeypatch.chdir(tmp_path)
+    datafiles = [f"realization-{real}/ENS" for real in range(3)]
+    mocker.patch(
+        "sys.argv",
+        [
+            "presentvalue",
+            "--discountto",
+            "2030",
+            "--writetoparams",
+            "--output",
+            "pv.csv",
+            *datafiles,
+        ],
+    )
+    presentvalue.main()
+    results_df = pd.read_csv("pv.csv")
+    assert list(results_df["DATAFILE"]) == datafiles
+    econ_df = presentvalue.prepare_econ_table(
+        oilprice=60, gasprice=1.7, usdtonok=7, discountrate=8
+    )
+    for datafile, pvalue in zip(datafiles, results_df["PresentValue"], strict=True):
+        assert np.isclose(
+            pvalue,
+            presentvalue.presentvalue_main(datafile, econ_df, discountto=2030)[
+                "PresentValue"
+            ],
+        )
+        assert (Path(datafile).parent / "parameters.txt").read_text(
+            encoding="utf8"
+        ).split() == ["PresentValue", str(pvalue)]
+
+
+def test_prepare_scenarios(tmp_path, monkeypatch):
+    """Test scenarios from a CSV file, from a grid of values, and both"""
+    monkeypatch.chdir(tmp_path)
+    defaults = {
+        "econtable": None,
+        "oilprice": 60,
+        "gasprice": 1.7,
+        "usdtonok": 7,
+        "discountrate": 8,
+    }
+    scenarios = presentvalue.prepare_scenarios(
+        sweep=["oilprice=50,70", "discountrate=6,8,10"], **defaults
+    )
+    assert list(scenarios.columns) == ["SCENARIO", *presentvalue.SCENARIO_PARAMETERS]
+    assert len(scenarios) == 6
+    assert list(scenarios["SCENARIO"]) == list(range(6))
+    assert set(scenarios["oilprice"]) == {50, 70}
+    assert set(scenarios["discountrate"]) == {6, 8, 10}
+    assert set(scenarios["usdtonok"]) == {7}
+
+    Path("scenarios.csv").write_text(
+        "SCENARIO,oilprice,gasprice\nlow,40,\nhigh,90,2.5\n", encoding="utf8"
+    )
+    scenarios = presentvalue.prepare_scenarios("scenarios.csv", **defaults)
+    assert list(scenarios["SCENARIO"]) == ["low", "high"]
+    assert list(scenarios["gasprice"]) == [1.7, 2.5]
+    assert scenarios["econtable"].isna().all()
+
+    scenarios = presentvalue.prepare_scenarios(
+        "scenarios.csv", ["discountrate=6,8"], **defaults
+    )
+    assert list(scenarios["SCENARIO"]) == ["low_0", "low_1", "high_0", "high_1"]
+    assert list(scenarios["oilprice"]) == [40, 40, 90, 90]
+    assert list(scenarios["discountrate"]) == [6, 8, 6, 8]
+
+    with pytest.raises(ValueError, match="Unsupported sweep"):
+        presentvalue.prepare_scenarios(sweep=["costs=1,2"], **defaults)
+    Path("scenarios.csv").write_text("costs\n100\n", encoding="utf8")
+    with pytest.raises(ValueError, match="Unknown columns"):
+        presentvalue.prepare_scenarios("scenarios.csv", **defaults)
+
+    # Swept parameters would be ignored for economical tables having them:
+    Path("econ.csv").write_text("year,oilprice,costs\n2030,80,100\n", encoding="utf8")
+    assert (
+        len(
+            presentvalue.prepare_scenarios(
+                sweep=["gasprice=1,2", "econtable=econ.csv"], **defaults
+            )
+        )
+        == 2
+    )
+    with pytest.raises(ValueError, match="also columns in the economical table"):
+        presentvalue.prepare_scenarios(
+            sweep=["oilprice=50,60,70"], **(defaults | {"econtable": "econ.csv"})
+        )
+
+
+def test_presentvalue_scenarios():
+    """Test that every combination of realization and scenario is evaluated"""
+    summaries = {
+        f"REAL{real}.DATA": pd.DataFrame(
+            {"OPR": [1000.0 * real, 2000.0], "GSR": [0.0, 1e6]},
+            index=pd.Index([2030, 2031], name="YEAR"),
+        )
+        for real in range(3)
+    }
+    scenarios = presentvalue.prepare_scenarios(
+        sweep=["oilprice=50,70", "discountrate=0,10"],
+        econtable=None,
+        gasprice=1.7,
+        usdtonok=7,
+    )
+    results_df = presentvalue.presentvalue_scenarios(
+        summaries, scenarios, discountto=2030
+    )
+    assert len(results_df) == len(summaries) * len(scenarios)
+    for row in results_df.itertuples():
+        econ_df = presentvalue.prepare_econ_table(
+            oilprice=row.oilprice,
+            gasprice=row.gasprice,
+            usdtonok=row.usdtonok,
+            discountrate=row.discountrate,
+        )
+        pv_df = presentvalue.calc_presentvalue_df(
+            summaries[row.DATAFILE], econ_df, 2030
+        )
+        assert np.isclose(
+            row.PresentValue, pv_df["presentvalue"].sum() / presentvalue.NOKUNIT
+        )
+
+
 @pytest.mark.integration
 def test_integration():
     """Test that the endpoint is installed"""
@@ -712,6 +712,104 @@ def test_available_dates(tmp_path, monkeypatch):
     )
 
 
+def test_index_prt():
+    """Test that region reports and reservoir volume tables are indexed"""
+    prtfile = TEST_PRT_DATADIR / "DROGON_NO_INITIAL_BALANCE_FLOW.PRT"
+    prt_index = prtvol2csv.index_prt(prtfile)
+
+    assert prt_index["initial_date"] == date(2018, 1, 1)
+    assert [
+        (report["fipname"], report["date"]) for report in prt_index["region_reports"]
+    ] == [
+        ("FIPNUM", date(2018, 7, 1)),
+        ("FIPZON", date(2018, 7, 1)),
+        ("FIPNUM", date(2019, 7, 1)),
+        ("FIPNUM", date(2020, 7, 1)),
+    ]
+    assert [
+        (table["balname"], table["date"]) for table in prt_index["reservoir_volumes"]
+    ][:2] == [("BALANCE", date(2018, 7, 1)), ("BALZON", date(2018, 7, 1))]
+
+    prt_bytes = prtfile.read_bytes()
+    for report in prt_index["region_reports"]:
+        assert b"REPORT REGION  1 " in prt_bytes[report["start"] : report["end"]]
+    for table in prt_index["reservoir_volumes"]:
+        assert (
+            prt_bytes[table["start"] : table["end"]]
+            .strip()
+            .startswith(b":  RESERVOIR VOLUMES")
+        )
+
+    # Extraction using a precomputed index gives the same result:
+    with pytest.warns(UserWarning, match="not at initial time"):
+        inplace_df, dates, date_str = prtvol2csv.currently_in_place_from_prt(
+            str(prtfile), "FIPZON", prt_index=prt_index
+        )
+    assert len(inplace_df) == 3
+    resvol_df = prtvol2csv.reservoir_volumes_from_prt(
+        str(prtfile), dates, "FIPZON", date_str, prt_index=prt_index
+    )
+    # (Flow pads the table with zero rows up to the largest FIPNUM)
+    assert resvol_df.loc[1:3, "PORV_TOTAL"].tolist() == [
+        190839915,
+        168805595,
+        184674889,
+    ]
+
+
+def test_index_prt_report_case(tmp_path):
+    """Lines starting with "  Report" do not reset the report date"""
+    prt_bytes = (TEST_PRT_DATADIR / "DROGON_NO_INITIAL_BALANCE_FLOW.PRT").read_bytes()
+    region_line = prt_bytes.rfind(b"\n", 0, prt_bytes.find(b"REPORT REGION")) + 1
+    Path(tmp_path / "DROGON.PRT").write_bytes(
+        prt_bytes[:region_line]
+        + b"  Report written by the simulator\n"
+        + prt_bytes[region_line:]
+    )
+    prt_index = prtvol2csv.index_prt(tmp_path / "DROGON.PRT")
+    assert [report["date"] for report in prt_index["region_reports"]] == [
+        date(2018, 7, 1),
+        date(2018, 7, 1),
+        date(2019, 7, 1),
+        date(2020, 7, 1),
+    ]
+
+
+def test_index_prt_empty(tmp_path):
+    """An empty PRT file gives an empty index"""
+    Path(tmp_path / "EMPTY.PRT").write_text("", encoding="utf8")
+    assert prtvol2csv.index_prt(tmp_path / "EMPTY.PRT") == {
+        "initial_date": None,
+        "region_reports": [],
+        "reservoir_volumes": [],
+    }
+
+
+def test_load_prt_index(tmp_path, monkeypatch, mocker):
+    """Test that the PRT index is persisted and reused while the PRT file
+    is unchanged"""
+    monkeypatch.chdir(tmp_path)
+    shutil.copy(TEST_PRT_DATADIR / "DROGON_FIPZON.PRT", "DROGON.PRT")
+    prt_index = prtvol2csv.index_prt("DROGON.PRT")
+
+    # Small PRT files are not persisted by default:
+    assert prtvol2csv.load_prt_index("DROGON.PRT") == prt_index
+    assert not Path("DROGON.PRT.idx").exists()
+
+    assert prtvol2csv.load_prt_index("DROGON.PRT", min_filesize=0) == prt_index
+    assert Path("DROGON.PRT.idx").exists()
+
+    spy = mocker.spy(prtvol2csv, "index_prt")
+    assert prtvol2csv.load_prt_index("DROGON.PRT") == prt_index
+    assert spy.call_count == 0
+
+    # Changing the PRT file invalidates the index file:
+    with Path("DROGON.PRT").open("a", encoding="utf8") as f_handle:
+        f_handle.write("\n")
+    assert prtvol2csv.load_prt_index("DROGON.PRT") == prt_index
+    assert spy.call_count == 1
+
+
 def test_inactive_fipnum(tmp_path, mocker, monkeypatch):
     """Test the case with non-contiguous active FIPNUM"""
 
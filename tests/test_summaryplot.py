@@ -1,3 +1,4 @@
+import os
 import shutil
 import subprocess
 from pathlib import Path
@@ -5,7 +6,13 @@ from types import SimpleNamespace
 
 import matplotlib
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 import pytest
+import res2df
+import resfo
+from resdata.grid import Grid
+from resdata.resfile import ResdataFile
 from resdata.summary import Summary
 
 from subscript.summaryplot import summaryplot
@@ -202,6 +209,180 @@ def test_splitvectorsdatafiles():
     )
 
 
+def _write_summary(casename, fopt):
+    smry = pd.DataFrame(
+        {"DATE": pd.to_datetime(["2030-01-01", "2031-01-01"]), "FOPT": fopt}
+    )
+    Summary.fwrite(res2df.summary.df2ressum(smry, casename))
+
+
+def test_load_summaries(tmp_path, monkeypatch):
+    """Test that only modified summaries are opened again on reload"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(summaryplot, "_SUMMARY_CACHE", {})
+    _write_summary("FOO", [0, 100])
+    _write_summary("BAR", [0, 200])
+
+    foo, bar, missing = summaryplot.load_summaries(["FOO.DATA", "BAR.DATA", "FOPT"])
+    assert isinstance(foo, Summary)
+    assert missing is None
+    assert list(summaryplot.extract_vectors([foo, bar], ["FOPT", "FOPR"])[1]) == [
+        "FOPT"
+    ]
+
+    _write_summary("BAR", [0, 300])
+    os.utime("BAR.UNSMRY", (0, 0))
+    reloaded_foo, reloaded_bar = summaryplot.load_summaries(["FOO.DATA", "BAR.DATA"])
+    assert reloaded_foo is foo
+    assert reloaded_bar is not bar
+    assert summaryplot.extract_vectors([reloaded_bar], ["FOPT"])[0]["FOPT"][-1] == 300
+
+
+def test_load_vectors(tmp_path, monkeypatch, mocker):
+    """Test that vectors are only read again from modified summaries"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(summaryplot, "_SUMMARY_CACHE", {})
+    monkeypatch.setattr(summaryplot, "_VECTOR_CACHE", {})
+    _write_summary("FOO", [0, 100])
+    _write_summary("BAR", [0, 200])
+    datafiles = ["FOO.DATA", "BAR.DATA"]
+
+    vectordata = summaryplot.load_vectors(
+        datafiles, summaryplot.load_summaries(datafiles), ["FOP*"]
+    )
+    assert [data["FOPT"][-1] for data in vectordata] == [100, 200]
+
+    _write_summary("BAR", [0, 300])
+    os.utime("BAR.UNSMRY", (0, 0))
+    numpy_vector = mocker.spy(Summary, "numpy_vector")
+    vectordata = summaryplot.load_vectors(
+        datafiles, summaryplot.load_summaries(datafiles), ["FOPT"]
+    )
+    assert [data["FOPT"][-1] for data in vectordata] == [100, 300]
+    assert numpy_vector.call_count == 1
+
+
+def test_load_summary_nonunified(tmp_path, monkeypatch):
+    """Test that new report steps in non-unified summary files are loaded"""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(summaryplot, "_SUMMARY_CACHE", {})
+    _write_summary("FOO", [0, 100])
+    smspec_mtime = os.stat("FOO.SMSPEC").st_mtime
+
+    # Split the unified summary file into one file pr. report step:
+    steps = []
+    for keyword, values in resfo.read("FOO.UNSMRY"):
+        if keyword.strip() == "SEQHDR":
+            steps.append([])
+        steps[-1].append((keyword, values))
+    Path("FOO.UNSMRY").unlink()
+    resfo.write("FOO.S0001", steps[0])
+    resfo.write("FOO.S0002", steps[1])
+    assert len(summaryplot.load_summary("FOO.DATA").dates) == 2
+
+    # A running simulation writes a new file without touching the SMSPEC:
+    resfo.write("FOO.S0003", steps[1])
+    os.utime("FOO.SMSPEC", (smspec_mtime, smspec_mtime))
+    assert len(summaryplot.load_summary("FOO.DATA").dates) == 3
+
+
+def test_summary_follower(tmp_path, monkeypatch):
+    """Test reading ministeps appended to a summary file by a running simulation"""
+    monkeypatch.chdir(tmp_path)
+    smry = pd.DataFrame(
+        {
+            "DATE": pd.date_range("2030-01-01", periods=10, freq="MS"),
+            "FOPT": np.arange(10) * 100.0,
+        }
+    )
+    Summary.fwrite(res2df.summary.df2ressum(smry, "RUNNING"))
+    unsmry = Path("RUNNING.UNSMRY").read_bytes()
+    ministep_ends = []
+    with open("RUNNING.UNSMRY", "rb") as stream:
+        for entry in resfo.lazy_read(stream):
+            if entry.read_keyword() == "PARAMS  ":
+                ministep_ends.append(summaryplot.array_end(entry))
+
+    # The simulation has written four ministeps, and is writing the fifth:
+    Path("RUNNING.UNSMRY").write_bytes(unsmry[: ministep_ends[3] + 10])
+    follower = summaryplot.SummaryFollower(Summary("RUNNING"), ["FOPT"])
+    assert follower.poll()[1].size == 0
+
+    Path("RUNNING.UNSMRY").write_bytes(unsmry[: ministep_ends[6] + 30])
+    rewritten, dates, values = follower.poll()
+    assert not rewritten
+    assert list(dates) == list(smry["DATE"][4:7])
+    assert list(values["FOPT"]) == [400, 500, 600]
+
+    Path("RUNNING.UNSMRY").write_bytes(unsmry)
+    assert list(follower.poll()[2]["FOPT"]) == [700, 800, 900]
+    assert follower.poll()[1].size == 0
+
+    # A new simulation overwrites the summary files:
+    Path("RUNNING.UNSMRY").write_bytes(unsmry[: ministep_ends[1]])
+    rewritten, _, values = follower.poll()
+    assert rewritten
+    assert list(values["FOPT"]) == [0, 100]
+
+
+def _close_event(figure):
+    figure.canvas.callbacks.process(
+        "close_event", matplotlib.backend_bases.CloseEvent("close_event", figure.canvas)
+    )
+
+
+def test_follow_figures(mocker):
+    """Test that polling goes on until all followed figures are closed"""
+    figures = [plt.figure() for _ in range(3)]
+    followedlines = [
+        (0, "FOPT", figures[0].gca().plot([0], [0])[0], 1.0),
+        (0, "FOPR", figures[1].gca().plot([0], [0])[0], 1.0),
+    ]
+    new_timers = [mocker.spy(figure.canvas, "new_timer") for figure in figures]
+    summaryplot.follow_figures([], followedlines, 1.0)
+    assert [spy.call_count for spy in new_timers] == [1, 0, 0]
+
+    # Closing a figure without followed lines changes nothing
+    _close_event(figures[2])
+    assert [spy.call_count for spy in new_timers] == [1, 0, 0]
+
+    # Closing the figure with the timer moves it to the other followed figure
+    stop = mocker.spy(new_timers[0].spy_return, "stop")
+    _close_event(figures[0])
+    assert stop.call_count == 1
+    assert [spy.call_count for spy in new_timers] == [1, 1, 0]
+
+    # Closing the last followed figure stops polling
+    stop = mocker.spy(new_timers[1].spy_return, "stop")
+    _close_event(figures[1])
+    assert stop.call_count == 1
+    assert [spy.call_count for spy in new_timers] == [1, 1, 0]
+    plt.close("all")
+
+
+def test_restart_vectors():
+    """Test reading cell values from a restart file, compared to resdata"""
+    datafile = Path(__file__).parent / "testdata_sector2fluxnum/TEST.DATA"
+    rstfile = ResdataFile(str(datafile.with_suffix(".UNRST")))
+    grid = Grid(str(datafile.with_suffix(".EGRID")))
+    rstvecs = ["SWAT:1,1,1", "PRESSURE:100,40,10", "SOIL:57,3,6", "SWAT:57,3,6"]
+    result = summaryplot.restart_vectors(str(datafile), rstvecs)
+
+    numsteps = rstfile.num_named_kw("SWAT")
+    expected_dates = [rstfile.iget_restart_sim_time(step) for step in range(numsteps)]
+    for rstvec in ["SWAT:1,1,1", "PRESSURE:100,40,10", "SWAT:57,3,6"]:
+        keyword, cell = rstvec.split(":")
+        ijk = tuple(int(idx) - 1 for idx in cell.split(","))
+        active_index = grid.get_active_index(ijk=ijk)
+        dates, values = result[rstvec]
+        assert dates == expected_dates
+        assert values == [
+            rstfile.iget_named_kw(keyword, step)[active_index]
+            for step in range(numsteps)
+        ]
+    assert np.allclose(result["SOIL:57,3,6"][1], 1 - np.array(values))
+
+
 def test_find_parameterstxt_in_current(tmp_path, monkeypatch):
     """Test that we are able to locate a parameters.txt in current directory"""
     monkeypatch.chdir(tmp_path)
@@ -263,6 +444,7 @@ def _interactive_args():
         nolegend=False,
         dumpimages=False,
         ensemblemode=False,
+        follow=None,
     )
 
 
@@ -1,4 +1,5 @@
 import datetime
+import io
 import shutil
 import subprocess
 from pathlib import Path
@@ -8,6 +9,7 @@ import yaml
 from pydantic import ValidationError
 
 from subscript.sunsch import sunsch
+from subscript.sunsch.time_vector import TimeVector
 
 DATADIR = Path(__file__).absolute().parent / "testdata_sunsch"
 
@@ -493,6 +495,51 @@ def test_merge(readonly_datadir):
     assert "WRFTPLT" in str(sch)
 
 
+def test_merge_parses_once(readonly_datadir, mocker):
+    """Each merged file should only be parsed once"""
+    parse_spy = mocker.spy(sunsch, "parse_sch_file")
+    sunschconf = {
+        "startdate": datetime.date(2000, 1, 1),
+        "files": ["emptyinit.sch", "mergeme.sch"],
+    }
+    sch = sunsch.process_sch_config(sunschconf)
+    assert parse_spy.call_count == 2
+    assert "WRFTPLT" in str(sch)
+    assert str(sch).startswith("WCONHIST")
+
+
+def test_merge_clip_keeps_initial_keywords(tmp_path, monkeypatch):
+    """Clipping dates before startdate in a file that does not start
+    with DATES keeps the keywords in front of the first DATES"""
+    monkeypatch.chdir(tmp_path)
+    Path("history.sch").write_text(
+        """
+WCONHIST
+  'OP1' 'OPEN' 'ORAT' 1000 /
+/
+
+DATES
+  1 'JAN' 2019 /
+/
+
+WCONHIST
+  'OP1' 'OPEN' 'ORAT' 2000 /
+/
+
+DATES
+  1 'JAN' 2021 /
+/
+""",
+        encoding="utf8",
+    )
+    sch = sunsch.process_sch_config(
+        {"startdate": datetime.date(2020, 1, 1), "files": ["history.sch"]}
+    )
+    assert sch.dates == [datetime.datetime(2020, 1, 1), datetime.datetime(2021, 1, 1)]
+    assert "1000" in str(sch)
+    assert "2000" not in str(sch)
+
+
 def test_sch_file_nonempty(tmp_path, monkeypatch):
     """Test that we can detect empty files"""
     monkeypatch.chdir(tmp_path)
@@ -640,6 +687,33 @@ def test_dategrid():
         )
 
 
+def test_timevector_sorted():
+    """Test that timesteps are kept sorted through insertions, bulk
+    insertions, deletions and truncation"""
+    tv = TimeVector(datetime.date(2000, 1, 1))
+    for year in [2005, 2001, 2003]:
+        tv.add_keywords(datetime.datetime(year, 1, 1), [f"-- {year}"])
+    tv.add_dates(
+        [datetime.datetime(2004, 1, 1), datetime.datetime(2003, 1, 1)], ["-- grid"]
+    )
+    assert [date.year for date in tv.dates] == [2000, 2001, 2003, 2004, 2005]
+    assert tv[datetime.date(2003, 1, 1)].keywords == ["-- 2003", "-- grid"]
+    assert tv[datetime.date(2004, 1, 1)].keywords == ["-- grid"]
+    with pytest.raises(ValueError):
+        tv.add_dates([datetime.datetime(1999, 1, 1)])
+
+    tv.delete(datetime.datetime(2003, 1, 1))
+    assert datetime.date(2003, 1, 1) not in tv
+    assert [date.year for date in tv.dates] == [2000, 2001, 2004, 2005]
+
+    tv.add_keywords(datetime.datetime(2004, 1, 1, 12), [])
+    tv.truncate_after(datetime.date(2004, 1, 1))
+    assert tv.dates[-1] == datetime.datetime(2004, 1, 1, 12)
+    tv.truncate_after(datetime.datetime(2004, 1, 1))
+    assert tv.dates[-1] == datetime.datetime(2004, 1, 1)
+    assert len(tv) == 3
+
+
 def test_wrap_long_lines():
     """Test that lines that are excessively long gets wrapped.
 
@@ -677,6 +751,37 @@ def test_wrap_long_lines():
     )
 
 
+def test_wrap_keyword():
+    """Test wrapping of long lines in a single keyword, keeping the
+    whitespace around it"""
+    assert sunsch.wrap_keyword("") == ""
+    assert sunsch.wrap_keyword("x x\n/\n") == "x x\n/\n"
+    assert sunsch.wrap_keyword("x x x x x\n/\n", maxchars=3) == "x x\nx x\nx\n/\n"
+    assert (
+        sunsch.wrap_keyword("\n  x x x x x\n/\n\n", maxchars=3)
+        == "\n  x x\nx x\nx\n/\n\n"
+    )
+
+
+def test_write_timevector(readonly_datadir):
+    """Writing a schedule to a file object gives the same as str()"""
+    sch = sunsch.process_sch_config(
+        {
+            "startdate": datetime.date(2017, 1, 1),
+            "files": ["initwithdates.sch", "mergeme.sch"],
+            "dategrid": "yearly",
+        }
+    )
+    string = io.StringIO()
+    sch.write(string)
+    assert string.getvalue() == str(sch)
+
+    string = io.StringIO()
+    sch.write(string, formatter=str.lower)
+    assert string.getvalue().startswith("wconhist")
+    assert "DATES" in string.getvalue()
+
+
 def test_long_vfp_lines(tmp_path, caplog, mocker, monkeypatch):
     """Make sure that lines can't get too long for Eclipse"""
     monkeypatch.chdir(tmp_path)